@@ -0,0 +1,155 @@
+"""Compression - Content-Encoding negotiation and compressed responses.
+
+API responses are gzipped as they are sent by GZipMiddleware, at a level
+cheap enough to run per request. Static files are compressed once, after
+the frontend is built, at the highest levels instead. Run
+
+    python -m backend.compression frontend/dist
+
+after "vite build" to write a .gz sibling (and a .br one when the brotli
+package is installed) next to every text file worth compressing.
+"""
+
+import argparse
+import gzip
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.middleware import gzip as starlette_gzip
+from starlette.types import Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only with brotli installed
+    brotli = None  # type: ignore[assignment]
+
+# File suffixes whose content compresses; images and fonts already are
+COMPRESSIBLE = frozenset({
+    ".html", ".js", ".mjs", ".css", ".json", ".map", ".svg", ".txt", ".xml", ".ico", ".wasm",
+})
+# Smaller files gain less than the extra headers cost
+MIN_SIZE = 1024
+# Sibling suffix of each precompressed encoding, most preferred first
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def accepted_encodings(accept_encoding: str | None) -> dict[str, float]:
+    """Parse an Accept-Encoding header into the quality of each coding.
+
+    "*" stands for every coding not listed. Malformed qualities count as 1.
+    """
+    qualities = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        try:
+            qualities[coding] = float(params.strip().lower().removeprefix("q=") or 1)
+        except ValueError:
+            qualities[coding] = 1.0
+    return qualities
+
+
+def accepts_encoding(accept_encoding: str | None, coding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a coding."""
+    qualities = accepted_encodings(accept_encoding)
+    # q=0 refuses the coding
+    return qualities.get(coding, qualities.get("*", 0.0)) > 0
+
+
+def choose_encoding(accept_encoding: str | None, available: Iterable[str]) -> str:
+    """Pick the coding to send among the available ones, or "identity".
+
+    The highest quality wins, ties going to the first available coding.
+    """
+    qualities = accepted_encodings(accept_encoding)
+    best, best_quality = "identity", 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class GZipMiddleware(starlette_gzip.GZipMiddleware):
+    """Starlette's GZipMiddleware, honouring q-values in Accept-Encoding.
+
+    Starlette compresses whenever the header mentions gzip, even as
+    "gzip;q=0".
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response if the client accepts gzip."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        responder: starlette_gzip.IdentityResponder
+        if accepts_encoding(Headers(scope=scope).get("accept-encoding"), "gzip"):
+            responder = starlette_gzip.GZipResponder(
+                self.app,
+                self.minimum_size,
+                compresslevel=self.compresslevel,
+                thread_minimum_size=self.thread_minimum_size,
+                exclude_content_types=self.exclude_content_types,
+            )
+        else:
+            responder = starlette_gzip.IdentityResponder(
+                self.app, self.minimum_size, exclude_content_types=self.exclude_content_types
+            )
+        await responder(scope, receive, send)
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    """Compress data at the encoding's highest level."""
+    if encoding == "br":
+        return brotli.compress(data, quality=11)  # type: ignore[no-any-return]
+    # mtime=0 keeps the output the same from one build to the next
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def precompress(directory: Path) -> list[Path]:
+    """Write compressed siblings for every compressible file under directory.
+
+    Siblings newer than their file are kept, and a sibling that would not
+    be smaller is not written. Returns the paths written.
+    """
+    encodings = [e for e in SUFFIXES if e != "br" or brotli is not None]
+    written = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = Path(root, name)
+            if path.suffix not in COMPRESSIBLE:
+                continue
+            stat = path.stat()
+            if stat.st_size < MIN_SIZE:
+                continue
+            data = None
+            for encoding in encodings:
+                target = path.with_name(name + SUFFIXES[encoding])
+                if target.exists() and target.stat().st_mtime_ns >= stat.st_mtime_ns:
+                    continue
+                if data is None:
+                    data = path.read_bytes()
+                compressed = _compress(data, encoding)
+                if len(compressed) < len(data):
+                    target.write_bytes(compressed)
+                    written.append(target)
+    return written
+
+
+def main() -> None:
+    """Precompress a frontend build."""
+    parser = argparse.ArgumentParser(description="Precompress a frontend build")
+    parser.add_argument("directory", type=Path, help="build output, e.g. frontend/dist")
+    args = parser.parse_args()
+
+    written = precompress(args.directory)
+    codings = "gzip and brotli" if brotli is not None else "gzip"
+    print(f"Wrote {len(written)} {codings} files under {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Application Configuration - Settings read from the environment."""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime settings for the Task Board API."""
+    storage_backend: str = "memory"
+    sqlite_path: str = "task_board.db"
+    blocking_io_threads: int = 40
+    # Results kept by the read coalescer; 0 turns coalescing off
+    read_cache_size: int = 256
+    # Read-through cache in front of storage: none, memory or redis
+    cache: str = "none"
+    cache_url: str = "redis://localhost:6379/0"
+    # Entries kept by the memory cache, and seconds any entry lives
+    cache_size: int = 10_000
+    cache_ttl: float = 60.0
+    # Gzip API responses at least this many bytes long; 0 turns it off
+    compress_min_size: int = 1024
+    # Request and call latency histograms for /api/metrics
+    metrics: bool = True
+    # Bearer token for /api/admin; None disables the admin endpoints
+    admin_token: str | None = None
+    # Keep traces of requests slower than this; None turns tracing off
+    slow_request_ms: float | None = None
+    workers: int = 1
+    # Write-ahead log for the memory backend; None keeps it memory-only
+    wal_dir: str | None = None
+    wal_sync: str = "group"
+    wal_interval_ms: float | None = None
+    snapshot_every: int = 100_000
+
+    def __post_init__(self) -> None:
+        """Reject combinations that cannot work."""
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self.workers}")
+        if self.workers > 1 and self.storage_backend == "memory":
+            raise ValueError("multiple workers need a shared store; use the sqlite backend")
+        if self.workers > 1 and self.cache == "memory":
+            raise ValueError("multiple workers need a shared cache; use the redis cache")
+
+    @property
+    def shared(self) -> bool:
+        """Whether several worker processes serve the same store."""
+        return self.workers > 1
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from TASK_BOARD_* environment variables.
+
+        With more than one worker the storage backend defaults to sqlite,
+        the store every worker process can share.
+        """
+        workers = int(os.environ.get("TASK_BOARD_WORKERS", cls.workers))
+        default_backend = "sqlite" if workers > 1 else cls.storage_backend
+        return cls(
+            storage_backend=os.environ.get("TASK_BOARD_STORAGE", default_backend).lower(),
+            sqlite_path=os.environ.get("TASK_BOARD_DB_PATH", cls.sqlite_path),
+            blocking_io_threads=int(
+                os.environ.get("TASK_BOARD_IO_THREADS", cls.blocking_io_threads)
+            ),
+            read_cache_size=int(os.environ.get("TASK_BOARD_READ_CACHE", cls.read_cache_size)),
+            cache=os.environ.get("TASK_BOARD_CACHE", cls.cache).lower(),
+            cache_url=os.environ.get("TASK_BOARD_CACHE_URL", cls.cache_url),
+            cache_size=int(os.environ.get("TASK_BOARD_CACHE_SIZE", cls.cache_size)),
+            cache_ttl=float(os.environ.get("TASK_BOARD_CACHE_TTL", cls.cache_ttl)),
+            compress_min_size=int(
+                os.environ.get("TASK_BOARD_COMPRESS_MIN_SIZE", cls.compress_min_size)
+            ),
+            metrics=os.environ.get("TASK_BOARD_METRICS", "1").lower() not in ("0", "false", "no"),
+            admin_token=os.environ.get("TASK_BOARD_ADMIN_TOKEN") or None,
+            slow_request_ms=_optional_float(os.environ.get("TASK_BOARD_SLOW_REQUEST_MS")),
+            workers=workers,
+            wal_dir=os.environ.get("TASK_BOARD_WAL_DIR") or None,
+            wal_sync=os.environ.get("TASK_BOARD_WAL_SYNC", cls.wal_sync).lower(),
+            wal_interval_ms=_optional_float(os.environ.get("TASK_BOARD_WAL_INTERVAL_MS")),
+            snapshot_every=int(os.environ.get("TASK_BOARD_SNAPSHOT_EVERY", cls.snapshot_every)),
+        )
+
+
+def _optional_float(value: str | None) -> float | None:
+    """Parse an optional numeric setting; unset or empty means None."""
+    return float(value) if value else None
+
+
+# Settings for the running process
+settings = Settings.from_env()
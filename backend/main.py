@@ -1,22 +1,49 @@
 """Main FastAPI Application - Task Board API."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+import anyio
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
 
+from backend.compression import GZipMiddleware
+from backend.config import settings
+from backend.metrics import MetricsMiddleware
+from backend.openapi import use_precomputed
+from backend.profiling import SlowRequestMiddleware
+from backend.routers.admin_router import router as admin_router
+from backend.routers.metrics_router import router as metrics_router
 from backend.routers.task_router import router as task_router
+from backend.services.change_feed import SqliteChangeFeed, change_feed
+from backend.static import FrontendFiles
+
+# Responses are compressed as they are sent, so favour speed over size
+API_GZIP_LEVEL = 5
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Follow other workers' changes while the app runs."""
+    async with anyio.create_task_group() as tg:
+        if isinstance(change_feed, SqliteChangeFeed):
+            tg.start_soon(change_feed.run)
+        yield
+        tg.cancel_scope.cancel()
+
 
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="Task Board API",
     description="A clean, full-stack task management application",
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
 )
+# Serve backend/openapi.json rather than building the schema per process
+use_precomputed(app)
 
 # Configure CORS for development
 app.add_middleware(
@@ -25,10 +52,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Revision"],
 )
 
+# Gzip large responses for clients that accept it. Event streams, bodies
+# already encoded (gzipped exports, precompressed files) and small
+# responses pass through as they are.
+if settings.compress_min_size:
+    app.add_middleware(
+        GZipMiddleware, minimum_size=settings.compress_min_size, compresslevel=API_GZIP_LEVEL
+    )
+
+# Time every request by route, for /api/metrics
+if settings.metrics:
+    app.add_middleware(MetricsMiddleware)
+
+# Keep traces of slow requests, for /api/admin/slow-requests
+if settings.slow_request_ms is not None:
+    app.add_middleware(SlowRequestMiddleware, threshold_ms=settings.slow_request_ms)
+
 # Include routers
 app.include_router(task_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
+app.include_router(admin_router, prefix="/api")
 
 
 # Health check endpoint
@@ -41,15 +87,12 @@ async def health_check() -> dict[str, str]:
 # Serve static files (frontend build)
 frontend_path = Path(__file__).parent.parent / "frontend" / "dist"
 if frontend_path.exists():
-    app.mount("/assets", StaticFiles(directory=frontend_path / "assets"), name="assets")
-
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str) -> FileResponse:
-        """Serve frontend files."""
-        file_path = frontend_path / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(frontend_path / "index.html")
+    frontend = FrontendFiles(frontend_path)
+
+    @app.get("/{full_path:path}", include_in_schema=False)
+    async def serve_frontend(full_path: str, request: Request) -> Response:
+        """Serve frontend files, falling back to index.html for client routes."""
+        return frontend.response(full_path, request.headers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,351 @@
+"""Metrics - In-process histograms and gauges in Prometheus text format.
+
+Recording an observation is a bisect and an increment of counts owned by
+the calling thread, so it takes no lock and timing a call costs well under
+a microsecond. Metrics live in the process: with several workers, each one
+reports its own.
+"""
+
+import functools
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from threading import get_ident
+from time import perf_counter
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Upper bounds, in seconds, for whole requests and for single calls
+REQUEST_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+CALL_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.1, 1.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """Format a label set, with an optional extra pre-formatted label."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class HistogramChild:
+    """Bucket counts and sum for one label set of a histogram.
+
+    Each thread records into its own shard, a list of bucket counts with
+    the sum last, so observations never contend or lose updates. Shards are
+    added up when the metric is read.
+    """
+
+    __slots__ = ("_bounds", "_shards", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Start with every bucket empty."""
+        self._bounds = bounds
+        self._shards: dict[int, list[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._new_shard()
+        shard[bisect_left(self._bounds, value)] += 1
+        shard[-1] += value
+
+    def _new_shard(self) -> list[Any]:
+        """Add the calling thread's shard."""
+        shard: list[Any] = [0] * (len(self._bounds) + 1) + [0.0]
+        with self._lock:
+            self._shards[get_ident()] = shard
+        return shard
+
+    def time(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Wrap a function so every call's duration is observed."""
+        # observe, inlined: this wraps hot repository and service calls
+        bounds, shards, new_shard = self._bounds, self._shards, self._new_shard
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> T:
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                shard = shards.get(get_ident()) or new_shard()
+                shard[bisect_left(bounds, elapsed)] += 1
+                shard[-1] += elapsed
+
+        return timed
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Add up the bucket counts (not cumulative) and the sum."""
+        with self._lock:
+            shards = list(self._shards.values())
+        totals = [sum(column) for column in zip(*shards, strict=True)]
+        if not totals:
+            return [0] * (len(self._bounds) + 1), 0.0
+        return totals[:-1], totals[-1]
+
+
+class _Family(ABC):
+    """A named metric with one child per label set."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:
+        """Describe the metric; labels names its label dimensions."""
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the child for a new label set."""
+
+    def labels(self, *values: str) -> Any:
+        """Get the child for a label set, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} takes labels {self.label_names}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        """Drop every label set."""
+        with self._lock:
+            self._children.clear()
+
+    def render(self) -> list[str]:
+        """Lines for this metric in the text format."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    @abstractmethod
+    def _render_child(self, values: tuple[str, ...], child: Any) -> list[str]:
+        """Lines for one label set's child."""
+
+
+class Histogram(_Family):
+    """Distribution of observed values, such as latencies in seconds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = REQUEST_BUCKETS,
+    ) -> None:
+        """Describe the histogram; buckets are ascending upper bounds."""
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _render_child(self, values: tuple[str, ...], child: HistogramChild) -> list[str]:
+        counts, total = child.snapshot()
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+            cumulative += count
+            le = _label_text(self.label_names, values, f'le="{_number(bound)}"')
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+        labels = _label_text(self.label_names, values)
+        lines.append(f"{self.name}_sum{labels} {_number(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class GaugeChild:
+    """Current value for one label set of a gauge or counter."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        """Set the value."""
+        self.value = value
+
+
+class Gauge(_Family):
+    """A value set when metrics are collected, such as a task count."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def _render_child(self, values: tuple[str, ...], child: GaugeChild) -> list[str]:
+        return [f"{self.name}{_label_text(self.label_names, values)} {_number(child.value)}"]
+
+
+class Counter(Gauge):
+    """A monotonically increasing total, copied in when metrics are collected."""
+
+    kind = "counter"
+
+
+class Registry:
+    """The metrics a process exposes."""
+
+    def __init__(self) -> None:
+        """Start with no metrics."""
+        self._metrics: list[_Family] = []
+
+    def register(self, metric: _Family) -> Any:
+        """Add a metric and return it."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> bytes:
+        """Every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return ("\n".join(lines) + "\n").encode()
+
+
+class MetricsMiddleware:
+    """ASGI middleware observing each HTTP request's latency.
+
+    Requests are labelled with the matched route's name (its handler), so
+    GET /api/tasks/{task_id} is one series however many tasks there are.
+    """
+
+    def __init__(self, app: Any, histogram: Histogram | None = None) -> None:
+        """Wrap an ASGI app; histogram defaults to request_latency."""
+        self.app = app
+        self.histogram = histogram if histogram is not None else request_latency
+        self._children: dict[tuple[str, str | None, int], HistogramChild] = {}
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        """Time the request, from receipt to the last byte sent.
+
+        Event streams are left out: they last as long as the client stays
+        connected, which says nothing about latency.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = perf_counter()
+        status = 500
+        streaming = False
+
+        async def send_with_status(message: Any) -> None:
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streaming = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message.get("headers", ())
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            if not streaming:
+                self._observe(scope, status, perf_counter() - start)
+
+    def _observe(self, scope: Any, status: int, elapsed: float) -> None:
+        """Record one request's latency under its method, route and status."""
+        route = scope.get("route")
+        key = (scope["method"], route.name if route is not None else None, status)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self.histogram.labels(
+                key[0], key[1] or "unmatched", str(status)
+            )
+        child.observe(elapsed)
+
+
+def instrument(obj: T, histogram: Histogram, methods: Iterable[str]) -> T:
+    """Time calls to obj's named methods, labelled by method name.
+
+    The timed wrappers are set on the instance, so other instances of the
+    class are unaffected. Returns obj.
+    """
+    for name in methods:
+        setattr(obj, name, histogram.labels(name).time(getattr(obj, name)))
+    return obj
+
+
+def public_methods(cls: type) -> list[str]:
+    """Names of the public methods a class defines."""
+    return [
+        name for name, value in vars(cls).items()
+        if callable(value) and not name.startswith("_")
+    ]
+
+
+registry = Registry()
+
+request_latency: Histogram = registry.register(Histogram(
+    "task_board_request_duration_seconds",
+    "HTTP request latency by method, handler and status",
+    ("method", "handler", "status"),
+))
+service_latency: Histogram = registry.register(Histogram(
+    "task_board_service_call_duration_seconds",
+    "TaskService call latency by method",
+    ("method",),
+    CALL_BUCKETS,
+))
+repository_latency: Histogram = registry.register(Histogram(
+    "task_board_repository_call_duration_seconds",
+    "Repository call latency by method, including calls made by other methods",
+    ("method",),
+    CALL_BUCKETS,
+))
+tasks: Gauge = registry.register(Gauge(
+    "task_board_tasks",
+    "Tasks on the board by status",
+    ("status",),
+))
+tasks_by_priority: Gauge = registry.register(Gauge(
+    "task_board_tasks_by_priority",
+    "Tasks on the board by priority",
+    ("priority",),
+))
+coalesced_reads: Counter = registry.register(Counter(
+    "task_board_coalesced_reads_total",
+    "Coalesced reads by outcome: cache hit, joined a computation, or computed",
+    ("outcome",),
+))
+cache_reads: Counter = registry.register(Counter(
+    "task_board_cache_reads_total",
+    "Read-through cache lookups that hit or missed, and cache calls that failed (error)",
+    ("outcome",),
+))
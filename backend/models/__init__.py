@@ -1,6 +1,6 @@
 """Models package."""
 
-from .task_model import Task, TaskPriority
+from .task_model import PRIORITIES, PRIORITY_CODES, Task, TaskPriority
 
-__all__ = ["Task", "TaskPriority"]
+__all__ = ["Task", "TaskPriority", "PRIORITIES", "PRIORITY_CODES"]
 
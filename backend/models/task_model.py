@@ -1,11 +1,23 @@
 """Task Model - Data structure for tasks."""
 
-import uuid
-from dataclasses import dataclass, field
-from datetime import datetime
+import secrets
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_us(value: datetime) -> int:
+    """Convert a naive local datetime to integer microseconds since the epoch."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    """Convert integer microseconds since the epoch back to a naive datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
 
 class TaskPriority(str, Enum):
     """Task priority levels."""
@@ -14,24 +26,129 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
-@dataclass
+# Priorities as small integer codes, in ascending order of urgency
+PRIORITIES: tuple[TaskPriority, ...] = tuple(TaskPriority)
+PRIORITY_CODES: dict[TaskPriority, int] = {p: code for code, p in enumerate(PRIORITIES)}
+
+
+def new_task_id() -> str:
+    """Generate a compact, URL-safe random task ID (72 bits)."""
+    return secrets.token_urlsafe(9)
+
+
 class Task:
-    """Task data model."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    title: str = ""
-    completed: bool = False
-    priority: TaskPriority = TaskPriority.MEDIUM
-    created_at: datetime = field(default_factory=datetime.now)
-    completed_at: datetime | None = None
+    """Task data model.
+
+    Slotted to avoid a per-instance dict. Priority is kept as a small int
+    code and timestamps as integer epoch microseconds; the enum and datetime
+    views are built on access. revision is the data version the repository
+    stamped on the task's last change (0 if unknown), after changing its
+    fields. json_cache holds the encoded API form with the revision it was
+    encoded at, and must be reset to None by whoever mutates the task.
+    """
+
+    __slots__ = (
+        "id", "title", "completed", "priority_code", "created_us", "completed_us", "revision",
+        "json_cache",
+    )
+
+    def __init__(
+        self,
+        id: str | None = None,
+        title: str = "",
+        completed: bool = False,
+        priority: TaskPriority = TaskPriority.MEDIUM,
+        created_at: datetime | None = None,
+        completed_at: datetime | None = None,
+    ) -> None:
+        """Create a task; ID and creation time default to fresh values."""
+        self.id = id if id is not None else new_task_id()
+        self.title = title
+        self.completed = completed
+        self.priority_code = PRIORITY_CODES[priority]
+        self.created_us = to_epoch_us(created_at if created_at is not None else datetime.now())
+        self.completed_us = to_epoch_us(completed_at) if completed_at is not None else None
+        self.revision = 0
+        self.json_cache: tuple[int, bytes] | None = None
+
+    @classmethod
+    def from_raw(
+        cls,
+        id: str,
+        title: str,
+        completed: bool,
+        priority_code: int,
+        created_us: int,
+        completed_us: int | None,
+        revision: int = 0,
+    ) -> "Task":
+        """Build a task straight from its compact field values."""
+        task = cls.__new__(cls)
+        task.id = id
+        task.title = title
+        task.completed = completed
+        task.priority_code = priority_code
+        task.created_us = created_us
+        task.completed_us = completed_us
+        task.revision = revision
+        task.json_cache = None
+        return task
+
+    @property
+    def priority(self) -> TaskPriority:
+        """Task priority."""
+        return PRIORITIES[self.priority_code]
+
+    @priority.setter
+    def priority(self, value: TaskPriority) -> None:
+        self.priority_code = PRIORITY_CODES[value]
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time."""
+        return from_epoch_us(self.created_us)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self.created_us = to_epoch_us(value)
+
+    @property
+    def completed_at(self) -> datetime | None:
+        """Completion time, or None while the task is pending."""
+        return from_epoch_us(self.completed_us) if self.completed_us is not None else None
+
+    @completed_at.setter
+    def completed_at(self, value: datetime | None) -> None:
+        self.completed_us = to_epoch_us(value) if value is not None else None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare tasks field by field, ignoring storage bookkeeping."""
+        if not isinstance(other, Task):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+            if name not in ("revision", "json_cache")
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show the task's fields."""
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, completed={self.completed!r}, "
+            f"priority={self.priority!r}, created_at={self.created_at!r}, "
+            f"completed_at={self.completed_at!r})"
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert task to dictionary."""
+        completed_at = self.completed_at
         return {
             "id": self.id,
             "title": self.title,
             "completed": self.completed,
-            "priority": self.priority.value,
+            "priority": PRIORITIES[self.priority_code].value,
             "created_at": self.created_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None
+            "completed_at": completed_at.isoformat() if completed_at else None
         }
-
@@ -0,0 +1,58 @@
+"""OpenAPI - The API schema, generated ahead of time.
+
+FastAPI builds the schema from every route and model on the first request
+for it, which takes about as long as importing the app. The schema only
+changes with the code, so it is generated once with
+
+    python -m backend.openapi
+
+into backend/openapi.json, which is served instead. A test fails when the
+file no longer matches the routes. Without the file the schema is built on
+first use, as before.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+
+from backend.serialization import loads
+
+SCHEMA_PATH = Path(__file__).with_name("openapi.json")
+
+
+def build(app: FastAPI) -> dict[str, Any]:
+    """Build the app's schema from its routes, ignoring any precomputed one."""
+    cached, app.openapi_schema = app.openapi_schema, None
+    try:
+        return FastAPI.openapi(app)
+    finally:
+        app.openapi_schema = cached
+
+
+def use_precomputed(app: FastAPI, path: Path = SCHEMA_PATH) -> None:
+    """Make the app serve the schema in path, read on first use, if it exists."""
+    def openapi() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            app.openapi_schema = loads(path.read_bytes()) if path.exists() else build(app)
+        return app.openapi_schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
+
+
+def write(app: FastAPI, path: Path = SCHEMA_PATH) -> None:
+    """Write the app's schema to path, indented so changes review as diffs."""
+    path.write_text(json.dumps(build(app), indent=2, ensure_ascii=False) + "\n")
+
+
+def main() -> None:
+    """Regenerate backend/openapi.json."""
+    from backend.main import app
+
+    write(app)
+    print(f"Wrote {SCHEMA_PATH}")
+
+
+if __name__ == "__main__":
+    main()
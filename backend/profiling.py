@@ -0,0 +1,225 @@
+"""Profiling - On-demand stack sampling and slow request traces.
+
+The sampler reads every thread's Python stack at a fixed interval for as
+long as it is asked to and counts identical stacks, giving collapsed-stack
+output that flamegraph.pl, speedscope and similar tools read directly. It
+costs nothing until it runs, and a sample takes well under a millisecond.
+
+Slow request tracing times the service and repository calls each request
+makes and keeps the timeline of requests slower than a threshold. Both are
+per process: with several workers, each one profiles and traces itself.
+"""
+
+import functools
+import sys
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_INTERVAL = 0.005
+MAX_PROFILE_SECONDS = 60.0
+SLOW_REQUEST_LOG_SIZE = 100
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+# One profile at a time: concurrent samplers would only skew each other
+_profiling = threading.Lock()
+_labels: dict[Any, str] = {}
+
+
+def _label(code: Any, module: str) -> str:
+    """Name a frame's function as module:qualified name."""
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = f"{module}:{code.co_qualname}"
+    return label
+
+
+def _stack(frame: Any) -> list[str]:
+    """Labels for a thread's frames, outermost first."""
+    labels = []
+    while frame is not None:
+        labels.append(_label(frame.f_code, frame.f_globals.get("__name__", "?")))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _is_idle(stack: list[str]) -> bool:
+    """Whether a stack is an event loop or worker thread waiting for work."""
+    if not stack:
+        return True
+    if stack[-1].startswith("selectors:"):
+        return True
+    return len(stack) > 1 and stack[-2] == "queue:Queue.get"
+
+
+def sample(counts: Counter[str], include_idle: bool = False) -> None:
+    """Add one sample of every other thread's stack to counts."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    me = threading.get_ident()
+    for ident, frame in sys._current_frames().items():
+        if ident == me:
+            continue
+        stack = _stack(frame)
+        if include_idle or not _is_idle(stack):
+            counts[";".join([names.get(ident, f"thread-{ident}"), *stack])] += 1
+
+
+def profile(
+    seconds: float, interval: float = DEFAULT_INTERVAL, include_idle: bool = False
+) -> Counter[str]:
+    """Sample every thread's stack each interval for seconds.
+
+    Blocks the calling thread, whose own stack is left out. Stacks of idle
+    event loops and worker threads are dropped unless include_idle is set.
+    Raises ProfilerBusyError if a profile is already running.
+    """
+    if not _profiling.acquire(blocking=False):
+        raise ProfilerBusyError("a profile is already running")
+    try:
+        counts: Counter[str] = Counter()
+        deadline = perf_counter() + seconds
+        while perf_counter() < deadline:
+            sample(counts, include_idle)
+            time.sleep(interval)
+        return counts
+    finally:
+        _profiling.release()
+
+
+def render_collapsed(counts: Counter[str]) -> str:
+    """Format stack counts as collapsed stacks, most frequent first."""
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+
+# Calls made by the current request: (name, start, seconds), or None when
+# the request is not traced. Worker threads get a copy of the context, so
+# offloaded calls append to the same list.
+_calls: ContextVar[list[tuple[str, float, float]] | None] = ContextVar(
+    "task_board_traced_calls", default=None
+)
+
+
+def trace_calls(obj: T, prefix: str, methods: Iterable[str]) -> T:
+    """Record calls to obj's named methods in the current request's trace.
+
+    The wrappers are set on the instance, as with metrics.instrument, and
+    record nothing outside a traced request. Returns obj.
+    """
+    for name in methods:
+        setattr(obj, name, _traced(getattr(obj, name), f"{prefix}.{name}"))
+    return obj
+
+
+def _traced(func: Callable[..., T], name: str) -> Callable[..., T]:
+    """Wrap func to append its timing to the current trace, if any."""
+
+    @functools.wraps(func)
+    def traced(*args: Any, **kwargs: Any) -> T:
+        calls = _calls.get()
+        if calls is None:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            calls.append((name, start, perf_counter() - start))
+
+    return traced
+
+
+class SlowRequestLog:
+    """The most recent requests slower than a threshold, with their calls."""
+
+    def __init__(self, size: int = SLOW_REQUEST_LOG_SIZE) -> None:
+        """Keep up to size traces, dropping the oldest."""
+        self._traces: deque[dict[str, Any]] = deque(maxlen=size)
+
+    def record(self, trace: dict[str, Any]) -> None:
+        """Add a trace."""
+        self._traces.append(trace)
+
+    def recent(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Traces, newest first."""
+        traces = list(reversed(self._traces))
+        return traces if limit is None else traces[:limit]
+
+    def clear(self) -> None:
+        """Drop every trace."""
+        self._traces.clear()
+
+
+class SlowRequestMiddleware:
+    """ASGI middleware tracing HTTP requests slower than a threshold.
+
+    Every request collects the timings of traced service and repository
+    calls; only those over threshold_ms are kept, as the request, its
+    total time and each call's offset and duration in milliseconds. Event
+    streams, slow by design, are never kept.
+    """
+
+    def __init__(self, app: Any, threshold_ms: float, log: SlowRequestLog | None = None) -> None:
+        """Wrap an ASGI app; log defaults to slow_requests."""
+        self.app = app
+        self.threshold = threshold_ms / 1000
+        self.log = log if log is not None else slow_requests
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        """Run the request with a trace and keep the trace if it was slow."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        calls: list[tuple[str, float, float]] = []
+        token = _calls.set(calls)
+        start = perf_counter()
+        status = 500
+        streaming = False
+
+        async def send_with_status(message: Any) -> None:
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streaming = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message.get("headers", ())
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            _calls.reset(token)
+            if elapsed >= self.threshold and not streaming:
+                route = scope.get("route")
+                self.log.record({
+                    "at": datetime.now(UTC).isoformat(),
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "handler": route.name if route is not None else None,
+                    "status": status,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "calls": [
+                        {
+                            "call": name,
+                            "start_ms": round((call_start - start) * 1000, 3),
+                            "duration_ms": round(seconds * 1000, 3),
+                        }
+                        for name, call_start, seconds in sorted(calls, key=lambda c: c[1])
+                    ],
+                })
+
+
+slow_requests = SlowRequestLog()
@@ -0,0 +1,238 @@
+"""Task Analytics - Completion trends computed over array columns.
+
+The in-memory repository keeps each task's creation time, completion time
+and priority in TaskColumns, parallel to its creation-order index, so a
+report never walks Task objects. With NumPy installed a report is a few
+vectorized passes over the columns; without it the same report is computed
+in plain Python. NumPy takes longer to import than the rest of the app, so
+it is imported by the first report rather than at startup.
+"""
+
+import statistics
+from array import array
+from datetime import date, timedelta
+from functools import cache
+from typing import Any
+
+from backend.models.task_model import PRIORITIES, Task
+
+# Completion time of a pending task
+NO_TIME = -(1 << 63)
+
+# Priority code of a deleted task's slot
+_DEAD = -1
+
+_DAY_US = 86_400_000_000
+_EPOCH = date(1970, 1, 1)
+
+# Longest date range a report may cover, in days
+MAX_RANGE_DAYS = 3660
+
+
+@cache
+def _numpy() -> Any:
+    """Get NumPy, importing it on first use, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised only without the analytics extra
+        return None
+    return numpy
+
+
+class TaskColumns:
+    """Creation time, completion time and priority code per creation-order slot.
+
+    Times are epoch microseconds. Slots line up with the repository's
+    creation-order index: added with it, marked dead when their task is
+    deleted and compacted along with it.
+    """
+
+    def __init__(self) -> None:
+        """Start with no slots."""
+        self.created = array("q")
+        self.completed = array("q")
+        self.priority = array("b")
+
+    @classmethod
+    def from_buffers(cls, created: Any, completed: Any, priority: Any) -> "TaskColumns":
+        """Copy whole columns from buffers of int64 times and int8 codes."""
+        columns = cls()
+        columns.created.frombytes(memoryview(created).cast("B"))
+        columns.completed.frombytes(memoryview(completed).cast("B"))
+        columns.priority.frombytes(memoryview(priority).cast("B"))
+        return columns
+
+    def __len__(self) -> int:
+        """Number of slots, dead ones included."""
+        return len(self.priority)
+
+    def append(self) -> None:
+        """Add an empty slot at the end; put fills it."""
+        self.created.append(0)
+        self.completed.append(NO_TIME)
+        self.priority.append(_DEAD)
+
+    def add(self, created_us: int, completed_us: int | None, priority_code: int) -> None:
+        """Add a filled slot at the end."""
+        self.created.append(created_us)
+        self.completed.append(NO_TIME if completed_us is None else completed_us)
+        self.priority.append(priority_code)
+
+    def put(self, slot: int, task: Task) -> None:
+        """Store a task's current fields in its slot."""
+        self.created[slot] = task.created_us
+        self.completed[slot] = NO_TIME if task.completed_us is None else task.completed_us
+        self.priority[slot] = task.priority_code
+
+    def remove(self, slot: int) -> None:
+        """Mark a slot dead."""
+        self.priority[slot] = _DEAD
+
+    def compact(self, slots: list[int]) -> None:
+        """Keep only the given slots, in order."""
+        for name, typecode in (("created", "q"), ("completed", "q"), ("priority", "b")):
+            column = getattr(self, name)
+            setattr(self, name, array(typecode, [column[slot] for slot in slots]))
+
+    def clear(self) -> None:
+        """Remove every slot."""
+        self.created = array("q")
+        self.completed = array("q")
+        self.priority = array("b")
+
+    def copy(self) -> "TaskColumns":
+        """Copy the columns, so a report can run after the lock is released."""
+        columns = TaskColumns()
+        columns.created = self.created[:]
+        columns.completed = self.completed[:]
+        columns.priority = self.priority[:]
+        return columns
+
+
+def check_range(start: date, end: date, window: int) -> None:
+    """Raise ValueError unless start..end, with window days of lead-in, is a
+    valid report range.
+
+    The day after end and the first day of start's window must be dates
+    too, since reports count up to the one and from the other.
+    """
+    if start > end:
+        raise ValueError("start must not be after end")
+    if (end - start).days >= MAX_RANGE_DAYS:
+        raise ValueError(f"Date range must not exceed {MAX_RANGE_DAYS} days")
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if end >= date.max:
+        raise ValueError(f"end must be before {date.max.isoformat()}")
+    if start.toordinal() - (window - 1) < date.min.toordinal():
+        raise ValueError(f"start leaves no room for a {window}-day window before it")
+
+
+def analyze(columns: TaskColumns, start: date, end: date, window: int) -> dict[str, Any]:
+    """Report per-day counts, rolling throughput and median completion times.
+
+    Covers start to end inclusive. Throughput on a day is the mean number of
+    completions over the window days ending on it. Median times to complete,
+    in seconds and per priority, are over tasks completed within the range.
+    Raises ValueError for an invalid range.
+    """
+    check_range(start, end, window)
+    first_day = (start - _EPOCH).days
+    days = (end - start).days + 1
+    compute = _count_numpy if _numpy() is not None else _count_python
+    return report(start, window, *compute(columns, first_day, days, window))
+
+
+def report(
+    start: date,
+    window: int,
+    created: list[int],
+    completed: list[int],
+    durations: list[list[int]],
+) -> dict[str, Any]:
+    """Assemble a report from per-day counts and completion times.
+
+    completed holds window - 1 extra leading days, so the first days of the
+    range get a full rolling window. durations holds the completion times,
+    in microseconds, of each priority's tasks completed within the range.
+    """
+    sums = [0]
+    for count in completed:
+        sums.append(sums[-1] + count)
+    days = [
+        {
+            "date": (start + timedelta(days=offset)).isoformat(),
+            "created": count,
+            "completed": completed[offset + window - 1],
+            "throughput": (sums[offset + window] - sums[offset]) / window,
+        }
+        for offset, count in enumerate(created)
+    ]
+    return {
+        "start": start.isoformat(),
+        "end": (start + timedelta(days=len(created) - 1)).isoformat(),
+        "window": window,
+        "days": days,
+        "median_completion_seconds": {
+            p.value: statistics.median(values) / 1e6 if values else None
+            for p, values in zip(PRIORITIES, durations, strict=True)
+        },
+    }
+
+
+def _count_numpy(
+    columns: TaskColumns, first_day: int, days: int, window: int
+) -> tuple[list[int], list[int], list[list[int]]]:
+    """Count per day and collect durations per priority with NumPy."""
+    np = _numpy()
+    created = np.frombuffer(columns.created, dtype=np.int64)
+    completed = np.frombuffer(columns.completed, dtype=np.int64)
+    priority = np.frombuffer(columns.priority, dtype=np.int8)
+    alive = priority != _DEAD
+
+    created_day = created[alive] // _DAY_US - first_day
+    in_range = (created_day >= 0) & (created_day < days)
+    created_counts = np.bincount(created_day[in_range], minlength=days)
+
+    done = alive & (completed != NO_TIME)
+    done_day = completed // _DAY_US - (first_day - window + 1)
+    counted = done & (done_day >= 0) & (done_day < days + window - 1)
+    completed_counts = np.bincount(done_day[counted], minlength=days + window - 1)
+
+    finished = counted & (done_day >= window - 1)
+    spans = completed[finished] - created[finished]
+    codes = priority[finished]
+    # Only the middle one or two values matter to the median
+    durations = []
+    for code in range(len(PRIORITIES)):
+        values = spans[codes == code]
+        if len(values):
+            middle = sorted({(len(values) - 1) // 2, len(values) // 2})
+            values = np.partition(values, middle)[middle]
+        durations.append(values.tolist())
+    return created_counts.tolist(), completed_counts.tolist(), durations
+
+
+def _count_python(
+    columns: TaskColumns, first_day: int, days: int, window: int
+) -> tuple[list[int], list[int], list[list[int]]]:
+    """Count per day and collect durations per priority in plain Python."""
+    created_counts = [0] * days
+    completed_counts = [0] * (days + window - 1)
+    durations: list[list[int]] = [[] for _ in PRIORITIES]
+    first_completed = first_day - window + 1
+    for created_us, completed_us, code in zip(
+        columns.created, columns.completed, columns.priority, strict=True
+    ):
+        if code == _DEAD:
+            continue
+        day = created_us // _DAY_US - first_day
+        if 0 <= day < days:
+            created_counts[day] += 1
+        if completed_us != NO_TIME:
+            day = completed_us // _DAY_US - first_completed
+            if 0 <= day < days + window - 1:
+                completed_counts[day] += 1
+                if day >= window - 1:
+                    durations[code].append(completed_us - created_us)
+    return created_counts, completed_counts, durations
@@ -0,0 +1,156 @@
+"""Repository Interface - Contract shared by all task storage backends."""
+
+import base64
+import binascii
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Protocol
+
+from backend.models.task_model import Task, TaskPriority
+
+# Revisions of change history kept for delta sync; clients further behind
+# get the whole board
+CHANGE_LOG_SIZE = 10_000
+
+
+def encode_cursor(seq: int) -> str:
+    """Encode a creation sequence number as an opaque page cursor."""
+    return base64.urlsafe_b64encode(str(seq).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode an opaque page cursor back into a creation sequence number."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        seq = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor '{cursor}'") from exc
+    if seq < 0:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    return seq
+
+
+@dataclass(frozen=True)
+class TaskUpdate:
+    """Field changes for one task in a bulk update; None leaves a field as is."""
+    task_id: str
+    title: str | None = None
+    completed: bool | None = None
+    priority: TaskPriority | None = None
+
+
+@dataclass
+class TaskChanges:
+    """Tasks changed after a client's revision, as of a later revision.
+
+    tasks were created or updated (newest first) and deleted lists the IDs
+    of deleted tasks. When reset is set the changes could not be worked
+    out, because the revision is older than the history kept or comes from
+    another store, and tasks is every task, to replace the client's copy.
+    """
+    revision: int
+    tasks: list[Task]
+    deleted: list[str]
+    reset: bool = False
+
+
+class TaskRepositoryProtocol(Protocol):
+    """Interface implemented by every task repository backend."""
+
+    @property
+    def blocking(self) -> bool:
+        """True when calls may block and must stay off the event loop."""
+        ...
+
+    def create(self, title: str, priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
+        """Create a new task."""
+        ...
+
+    def get_all(self) -> list[Task]:
+        """Get all tasks, newest first."""
+        ...
+
+    def iter_tasks(self, batch_size: int = 1000) -> Iterator[list[Task]]:
+        """Yield every task, oldest first, in batches of up to batch_size.
+
+        Each batch is read on its own, so a task changed during iteration
+        may appear in either state.
+        """
+        ...
+
+    def get_page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of (optionally filtered) tasks, newest first, and the next cursor."""
+        ...
+
+    def search(self, query: str, limit: int = 20) -> list[Task]:
+        """Find the newest tasks whose titles match a query (last word as a prefix)."""
+        ...
+
+    def get_by_id(self, task_id: str) -> Task | None:
+        """Get a task by ID."""
+        ...
+
+    def update(
+        self,
+        task_id: str,
+        title: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> Task | None:
+        """Update a task."""
+        ...
+
+    def toggle(self, task_id: str) -> Task | None:
+        """Atomically flip a task's completion status."""
+        ...
+
+    def delete(self, task_id: str) -> int | None:
+        """Delete a task by ID; returns the version the deletion produced, or
+        None if there was no such task."""
+        ...
+
+    def create_many(self, items: list[tuple[str, TaskPriority]]) -> list[Task]:
+        """Create several (title, priority) tasks in one batch."""
+        ...
+
+    def import_many(self, tasks: list[Task]) -> list[bool]:
+        """Add tasks with their IDs and timestamps, as the newest ones, in one
+        batch; False marks a task whose ID is already in use."""
+        ...
+
+    def update_many(self, updates: list[TaskUpdate]) -> list[Task | None]:
+        """Apply several updates in one batch; None marks a missing task."""
+        ...
+
+    def delete_many(self, task_ids: list[str]) -> list[int | None]:
+        """Delete several tasks in one batch; returns each deletion's version,
+        None marking a missing task."""
+        ...
+
+    def get_version(self) -> int:
+        """Get the data version; it increases with every mutation."""
+        ...
+
+    def get_changes(self, since: int) -> TaskChanges:
+        """Get the tasks created, updated or deleted after revision since."""
+        ...
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get task statistics."""
+        ...
+
+    def get_analytics(self, start: date, end: date, window: int = 7) -> dict[str, Any]:
+        """Get per-day counts, rolling throughput over window days and median
+        time to complete per priority, for start to end inclusive."""
+        ...
+
+    def clear_all(self) -> int:
+        """Clear all tasks; returns the version the clear produced."""
+        ...
@@ -0,0 +1,427 @@
+"""Durable Task Repository - In-memory storage backed by a write-ahead log."""
+
+import atexit
+import os
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from datetime import date
+from itertools import compress
+from pathlib import Path
+from typing import Any
+
+from backend.models.task_model import PRIORITIES, Task, TaskPriority
+from backend.repositories.analytics import TaskColumns
+from backend.repositories.base import TaskChanges, TaskUpdate
+from backend.repositories.snapshot import ColumnarSnapshot, TaskTable, write_snapshot
+from backend.repositories.task_repo import TaskRepository
+from backend.repositories.wal import WriteAheadLog
+from backend.serialization import dumps, loads
+
+# Files in the data directory, numbered by generation. A snapshot of
+# generation N holds everything logged before wal N, so recovery loads the
+# newest snapshot and replays the logs from its generation on. Snapshots are
+# columnar (.cols); JSON-lines snapshots from older versions still load.
+_FILE_NAME = re.compile(r"(snapshot|wal)\.(\d+)\.(jsonl|cols)")
+_SUFFIXES = {"snapshot": "cols", "wal": "jsonl"}
+_CLEAR_RECORD = b'["x"]\n'
+
+# bytes.translate tables turning a column into 0/1 masks for itertools.compress
+_IS_ZERO = bytes(b == 0 for b in range(256))
+_IS_CODE = [bytes(b == code for b in range(256)) for code in range(len(PRIORITIES))]
+
+
+def _file_name(kind: str, generation: int) -> str:
+    """Name of a snapshot or wal file for a generation."""
+    return f"{kind}.{generation:08d}.{_SUFFIXES[kind]}"
+
+
+def _put_record(task: Task) -> bytes:
+    """Encode a task's full state; replaying it creates or overwrites the task."""
+    return dumps([
+        "p", task.id, task.title, task.completed,
+        task.priority_code, task.created_us, task.completed_us,
+    ]) + b"\n"
+
+
+def _delete_record(task_id: str) -> bytes:
+    """Encode the deletion of a task."""
+    return dumps(["d", task_id]) + b"\n"
+
+
+class DurableTaskRepository(TaskRepository):
+    """In-memory repository that logs every mutation to disk.
+
+    Each create/update/delete/clear appends a record to a write-ahead log
+    while the write lock is held, so the log order is the mutation order.
+    Every snapshot_every records, a background thread writes a snapshot of
+    all tasks and deletes the logs it replaces. Startup loads the newest
+    snapshot and replays the logs after it. Log records carry full task
+    state and replaying them twice is harmless, so a snapshot can be taken
+    from tasks that keep changing while it is written.
+
+    Snapshots are memory-mapped rather than parsed: tasks are materialized
+    from their rows when first accessed, the filter indexes are built from
+    whole columns at once, and titles are tokenized on the first search.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sync: str = "group",
+        interval: float | None = None,
+        snapshot_every: int = 100_000,
+        verify_stats: bool = False,
+    ) -> None:
+        """Recover the tasks stored in directory, creating it if needed.
+
+        sync is a wal.SYNC_LEVELS name; interval is the group-commit delay in
+        seconds, defaulting per level. A snapshot_every of 0 disables
+        automatic snapshots.
+        """
+        super().__init__(verify_stats)
+        self._tasks: TaskTable = TaskTable()  # type: ignore[assignment]
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        # Callers wait for the disk in these modes, so keep them off the event loop
+        self._waits_on_disk = sync in ("group", "always")
+        self._snapshot_every = snapshot_every
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_thread: threading.Thread | None = None
+        # A loaded snapshot whose rows are not in the indexes yet
+        self._unindexed: ColumnarSnapshot | None = None
+        self._generation = self._recover()
+        # Revisions restart from the clock, so clients from before get a reset
+        self._forget_changes()
+        self._log = WriteAheadLog(self._dir / _file_name("wal", self._generation), sync, interval)
+        self._snapshot_mark = 0
+        atexit.register(self.close)
+
+    @property
+    def blocking(self) -> bool:
+        """Whether calls belong in worker threads.
+
+        Besides waiting on the disk, the first calls after loading a large
+        snapshot build its indexes, which must not stall the event loop.
+        """
+        return (
+            self._waits_on_disk
+            or self._unindexed is not None
+            or not self._title_index.loaded
+        )
+
+    def _recover(self) -> int:
+        """Load the newest snapshot and replay later logs; return the next generation."""
+        files: dict[str, dict[int, Path]] = {"snapshot": {}, "wal": {}}
+        for path in self._dir.iterdir():
+            match = _FILE_NAME.fullmatch(path.name)
+            if match:
+                files[match[1]][int(match[2])] = path
+
+        start = max(files["snapshot"], default=0)
+        with self._title_index.bulk_load():
+            if files["snapshot"]:
+                snapshot = files["snapshot"][start]
+                if snapshot.suffix == ".cols":
+                    self._load_snapshot(ColumnarSnapshot(snapshot))
+                else:
+                    self._replay(snapshot)
+            for generation in sorted(g for g in files["wal"] if g >= start):
+                self._replay(files["wal"][generation])
+        # Always start a fresh log, rather than append after a torn record
+        return max([*files["snapshot"], *files["wal"]], default=0) + 1
+
+    def _load_snapshot(self, snapshot: ColumnarSnapshot) -> None:
+        """Adopt a snapshot's rows as the store, without creating any Task.
+
+        Lookups by ID and statistics work straight away; the other indexes
+        are built on first use.
+        """
+        self._tasks = TaskTable(snapshot)
+        self._completed_count = snapshot.completed_count
+        self._priority_counts = list(snapshot.priority_counts)
+        self._completed_by_day = Counter(snapshot.completed_by_day)
+        self._unindexed = snapshot
+
+    def _ensure_indexes(self) -> None:
+        """Build the indexes over a freshly loaded snapshot, once."""
+        if self._unindexed is None:
+            return
+        with self._lock.write():
+            if self._unindexed is not None:
+                self._index_snapshot(self._unindexed)
+
+    def _index_snapshot(self, snapshot: ColumnarSnapshot) -> None:
+        """Build the indexes from whole snapshot columns; the caller holds the write lock.
+
+        Row order is creation order, so row numbers serve as sequence numbers.
+        """
+        ids = snapshot.ids()
+        count = len(ids)
+        self._next_seq = count
+        self._order_seqs = list(range(count))
+        self._order_ids = list(ids)
+        self._seq_by_id = dict(zip(ids, self._order_seqs, strict=True))
+        completed = bytes(snapshot.completed)
+        self._ids_by_completed = (
+            set(compress(ids, completed.translate(_IS_ZERO))),
+            set(compress(ids, completed)),
+        )
+        priority = bytes(snapshot.priority)
+        self._ids_by_priority = [set(compress(ids, priority.translate(t))) for t in _IS_CODE]
+        self._columns = TaskColumns.from_buffers(
+            snapshot.created_us, snapshot.completed_us, snapshot.priority
+        )
+        self._title_index.defer(lambda: zip(ids, snapshot.titles(), strict=True))
+        self._unindexed = None
+
+    def _replay(self, path: Path) -> None:
+        """Apply every record in a snapshot or log file.
+
+        A last record without its newline was cut short by a crash and is
+        ignored; any other undecodable record raises ValueError.
+        """
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = loads(line)
+                except ValueError as exc:
+                    raise ValueError(f"Corrupt record in {path}: {line[:80]!r}") from exc
+                self._apply(record)
+
+    def _apply(self, record: list[object]) -> None:
+        """Apply one decoded record without logging it."""
+        if self._unindexed is not None:
+            self._index_snapshot(self._unindexed)
+        kind = record[0]
+        if kind == "p":
+            task = Task.from_raw(*record[1:])  # type: ignore[arg-type]
+            old = self._tasks.get(task.id)
+            if old is None:
+                self._insert(task)
+            else:
+                self._remove_from_indexes(old)
+                self._tasks[task.id] = task
+                self._add_to_indexes(task)
+                self._version += 1
+                task.revision = self._version
+                self._record_change(task.id)
+        elif kind == "d":
+            TaskRepository._delete(self, record[1])  # type: ignore[arg-type]
+        elif kind == "x":
+            TaskRepository._clear_all(self)
+        else:
+            raise ValueError(f"Unknown log record type {kind!r}")
+
+    def snapshot(self) -> None:
+        """Write a snapshot of every task and delete the files it supersedes."""
+        self._ensure_indexes()
+        with self._snapshot_lock:
+            with self._lock.read():
+                order = [task_id for task_id in self._order_ids if task_id is not None]
+                raw = self._tasks.raw
+                generation = self._generation + 1
+                self._log.rotate(self._dir / _file_name("wal", generation))
+                self._generation = generation
+                self._snapshot_mark = self._log.appended
+
+            # Rows are read after the lock is released; any that change or
+            # disappear meanwhile are fixed up by replaying the new log.
+            rows = (raw(task_id) for task_id in order)
+            path = self._dir / _file_name("snapshot", generation)
+            tmp = path.with_suffix(".tmp")
+            write_snapshot(tmp, (row for row in rows if row is not None))
+            os.replace(tmp, path)
+            _fsync_directory(self._dir)
+
+            for old in self._dir.iterdir():
+                match = _FILE_NAME.fullmatch(old.name)
+                if match and int(match[2]) < generation:
+                    old.unlink()
+
+    def close(self) -> None:
+        """Wait for a running snapshot, then flush and close the log."""
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+        self._log.close()
+        self._tasks.close()
+
+    def _append(self, record: bytes) -> None:
+        """Log a mutation; the caller holds the write lock."""
+        self._log.append(record)
+        due = self._log.appended - self._snapshot_mark >= self._snapshot_every > 0
+        if due and not self._snapshot_lock.locked():
+            self._snapshot_mark = self._log.appended
+            self._snapshot_thread = threading.Thread(
+                target=self.snapshot, name="task-snapshot", daemon=True
+            )
+            self._snapshot_thread.start()
+
+    def _create(self, title: str, priority: TaskPriority) -> Task:
+        """Create and log a task; the caller holds the write lock."""
+        task = super()._create(title, priority)
+        self._append(_put_record(task))
+        return task
+
+    def _import(self, task: Task) -> bool:
+        """Add and log a task as given; the caller holds the write lock."""
+        added = super()._import(task)
+        if added:
+            self._append(_put_record(task))
+        return added
+
+    def _export(self, task_id: str) -> Task:
+        """Build a task from its row, leaving snapshot rows unmaterialized.
+
+        The copy carries no revision; the caller holds a lock.
+        """
+        return Task.from_raw(*self._tasks.raw(task_id))  # type: ignore[misc]
+
+    def _update(
+        self,
+        task_id: str,
+        title: str | None,
+        completed: bool | None,
+        priority: TaskPriority | None
+    ) -> Task | None:
+        """Update and log a task; the caller holds the write lock."""
+        task = super()._update(task_id, title, completed, priority)
+        if task is not None:
+            self._append(_put_record(task))
+        return task
+
+    def _delete(self, task_id: str) -> int | None:
+        """Delete and log a task; the caller holds the write lock."""
+        version = super()._delete(task_id)
+        if version is not None:
+            self._append(_delete_record(task_id))
+        return version
+
+    def _clear_all(self) -> None:
+        """Clear and log; the caller holds the write lock."""
+        super()._clear_all()
+        self._append(_CLEAR_RECORD)
+
+    # Public methods build any pending snapshot indexes first. Mutations wait
+    # for the log after releasing the lock, so concurrent writers share one
+    # group commit.
+
+    def get_all(self) -> list[Task]:
+        """Get all tasks, newest first."""
+        self._ensure_indexes()
+        return super().get_all()
+
+    def iter_tasks(self, batch_size: int = 1000) -> Iterator[list[Task]]:
+        """Yield every task, oldest first, in batches, as copies of their rows.
+
+        Walking a freshly loaded snapshot this way keeps it unmaterialized.
+        """
+        self._ensure_indexes()
+        yield from super().iter_tasks(batch_size)
+
+    def get_page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of tasks, newest first, starting after an opaque cursor."""
+        self._ensure_indexes()
+        return super().get_page(limit, cursor, completed, priority)
+
+    def search(self, query: str, limit: int = 20) -> list[Task]:
+        """Find the newest tasks whose titles match a query."""
+        self._ensure_indexes()
+        return super().search(query, limit)
+
+    def get_changes(self, since: int) -> TaskChanges:
+        """Get the tasks created, updated or deleted after revision since."""
+        self._ensure_indexes()
+        return super().get_changes(since)
+
+    def get_analytics(self, start: date, end: date, window: int = 7) -> dict[str, Any]:
+        """Get per-day counts, rolling throughput and median completion times."""
+        self._ensure_indexes()
+        return super().get_analytics(start, end, window)
+
+    def create(self, title: str, priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
+        """Create a new task."""
+        self._ensure_indexes()
+        task = super().create(title, priority)
+        self._log.sync()
+        return task
+
+    def update(
+        self,
+        task_id: str,
+        title: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> Task | None:
+        """Update a task."""
+        self._ensure_indexes()
+        task = super().update(task_id, title, completed, priority)
+        self._log.sync()
+        return task
+
+    def toggle(self, task_id: str) -> Task | None:
+        """Atomically flip a task's completion status."""
+        self._ensure_indexes()
+        task = super().toggle(task_id)
+        self._log.sync()
+        return task
+
+    def delete(self, task_id: str) -> int | None:
+        """Delete a task by ID; returns the version the deletion produced."""
+        self._ensure_indexes()
+        version = super().delete(task_id)
+        self._log.sync()
+        return version
+
+    def create_many(self, items: list[tuple[str, TaskPriority]]) -> list[Task]:
+        """Create several tasks in one batch and one group commit."""
+        self._ensure_indexes()
+        tasks = super().create_many(items)
+        self._log.sync()
+        return tasks
+
+    def import_many(self, tasks: list[Task]) -> list[bool]:
+        """Add several tasks as given in one batch and one group commit."""
+        self._ensure_indexes()
+        added = super().import_many(tasks)
+        self._log.sync()
+        return added
+
+    def update_many(self, updates: list[TaskUpdate]) -> list[Task | None]:
+        """Apply several updates in one batch and one group commit."""
+        self._ensure_indexes()
+        tasks = super().update_many(updates)
+        self._log.sync()
+        return tasks
+
+    def delete_many(self, task_ids: list[str]) -> list[int | None]:
+        """Delete several tasks in one batch and one group commit."""
+        self._ensure_indexes()
+        deleted = super().delete_many(task_ids)
+        self._log.sync()
+        return deleted
+
+    def clear_all(self) -> int:
+        """Clear all tasks; returns the version the clear produced."""
+        self._ensure_indexes()
+        version = super().clear_all()
+        self._log.sync()
+        return version
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist renames and deletions in a directory."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
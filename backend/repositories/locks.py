@@ -0,0 +1,59 @@
+"""Locks - Synchronization primitives for repositories."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """Lock allowing many concurrent readers or one writer.
+
+    Phase-fair: a waiting writer holds back newly arriving readers, and a
+    releasing writer hands the lock to the readers that queued behind it.
+    Neither a stream of reads nor a stream of writes can starve the other.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_readers = 0
+        self._waiting_writers = 0
+        self._readers_turn = False
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of a block."""
+        with self._cond:
+            self._waiting_readers += 1
+            while self._writer or (self._waiting_writers and not self._readers_turn):
+                self._cond.wait()
+            self._waiting_readers -= 1
+            self._readers += 1
+            if not self._waiting_readers:
+                self._readers_turn = False
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of a block."""
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers or self._readers_turn:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._readers_turn = self._waiting_readers > 0
+                self._cond.notify_all()
@@ -0,0 +1,341 @@
+"""Columnar Snapshots - Memory-mapped task tables that load without parsing.
+
+A snapshot file is a header followed by fixed-width columns and a string
+heap, each section 8-byte aligned so it can be viewed in place:
+
+    header      magic, row count, id width, heap size, statistics
+    ids         count * id_width bytes, ASCII, NUL-padded
+    completed   count bytes, 0 or 1
+    priority    count bytes, priority code
+    created     count int64, epoch microseconds
+    done_at     count int64, epoch microseconds or NO_TIME
+    title_end   count uint64, end offset of each title in the heap
+    id_order    count uint32, rows sorted by id, for lookups
+    days        pairs of int64 (day, completions), for completed_today
+    heap        UTF-8 titles, back to back
+
+Rows are stored in creation order. Integers use the platform's native byte
+order, which is checked to be little-endian on both ends.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from backend.models.task_model import PRIORITIES, Task
+from backend.repositories.analytics import NO_TIME
+
+_MAGIC = b"TBCOLS01"
+_HEADER = struct.Struct(f"<8s5Q{len(PRIORITIES)}Q")
+_DAY_US = 86_400_000_000
+
+# (id, title, completed, priority code, created_us, completed_us)
+SnapshotRow = tuple[str, str, bool, int, int, int | None]
+
+
+def _check_byte_order() -> None:
+    """Refuse to read or write snapshots on big-endian machines."""
+    if sys.byteorder != "little":
+        raise ValueError("Columnar snapshots require a little-endian machine")
+
+
+def _padding(size: int) -> bytes:
+    """Zero bytes that pad size up to a multiple of 8."""
+    return b"\0" * (-size % 8)
+
+
+def write_snapshot(path: Path, rows: Iterable[SnapshotRow]) -> int:
+    """Write rows, in creation order, as a snapshot file and fsync it.
+
+    Returns the number of rows written.
+    """
+    _check_byte_order()
+    ids: list[bytes] = []
+    completed = bytearray()
+    priority = bytearray()
+    created = array("q")
+    done_at = array("q")
+    title_end = array("Q")
+    heap = bytearray()
+    priority_counts = [0] * len(PRIORITIES)
+    days: Counter[int] = Counter()
+
+    for task_id, title, is_done, code, created_us, completed_us in rows:
+        ids.append(task_id.encode("ascii"))
+        completed.append(is_done)
+        priority.append(code)
+        created.append(created_us)
+        done_at.append(NO_TIME if completed_us is None else completed_us)
+        heap += title.encode()
+        title_end.append(len(heap))
+        priority_counts[code] += 1
+        if is_done and completed_us is not None:
+            days[completed_us // _DAY_US] += 1
+
+    count = len(ids)
+    id_width = max(map(len, ids), default=0)
+    id_order = array("I", sorted(range(count), key=ids.__getitem__))
+    day_pairs = array("q", [value for item in sorted(days.items()) for value in item])
+    header = _HEADER.pack(
+        _MAGIC, count, id_width, len(heap), sum(completed), len(day_pairs) // 2,
+        *priority_counts,
+    )
+
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(header + _padding(len(header)))
+        f.write(b"".join(i.ljust(id_width, b"\0") for i in ids))
+        f.write(_padding(count * id_width))
+        for column in (completed, priority):
+            f.write(column + _padding(count))
+        for numbers in (created, done_at, title_end, id_order, day_pairs):
+            f.write(numbers.tobytes())
+            f.write(_padding(len(numbers) * numbers.itemsize))
+        f.write(heap)
+        f.flush()
+        os.fsync(f.fileno())
+    return count
+
+
+class ColumnarSnapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Opening costs a header parse no matter how many rows the file holds.
+    Columns are memoryviews over the mapping, so untouched rows stay in the
+    page cache, shared by every process that maps the same file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map the snapshot at path; raises ValueError if it is not one."""
+        _check_byte_order()
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if len(view) < _HEADER.size or view[:8] != _MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"{path} is not a columnar task snapshot")
+        magic, count, id_width, heap_size, completed, day_count, *priority_counts = (
+            _HEADER.unpack_from(view)
+        )
+        self._count = count
+        self._id_width = id_width
+        self.completed_count: int = completed
+        self.priority_counts: list[int] = priority_counts
+
+        offset = _HEADER.size + len(_padding(_HEADER.size))
+        self._ids_start = offset
+
+        def section(size: int) -> memoryview:
+            nonlocal offset
+            part = view[offset:offset + size]
+            offset += size + len(_padding(size))
+            return part
+
+        self._ids = section(count * id_width)
+        self.completed = section(count)
+        self.priority = section(count)
+        self.created_us = section(count * 8).cast("q")
+        self.completed_us = section(count * 8).cast("q")
+        self._title_end = section(count * 8).cast("Q")
+        self._id_order = section(count * 4).cast("I")
+        days = section(day_count * 16).cast("q")
+        self.completed_by_day: dict[int, int] = dict(zip(days[::2], days[1::2], strict=True))
+        self._heap = section(heap_size)
+        self._views = [
+            view, self._ids, self.completed, self.priority, self.created_us,
+            self.completed_us, self._title_end, self._id_order, days, self._heap,
+        ]
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return self._count
+
+    def ids(self) -> list[str]:
+        """Every task ID, in row order, decoded in one pass."""
+        width = self._id_width
+        if not width:
+            return [""] * self._count
+        text = self._ids.tobytes().decode("ascii")
+        ids = [text[i:i + width] for i in range(0, len(text), width)]
+        if "\0" in text:
+            ids = [i.rstrip("\0") for i in ids]
+        return ids
+
+    def id(self, row: int) -> str:
+        """Task ID of one row."""
+        start = self._ids_start + row * self._id_width
+        return self._mmap[start:start + self._id_width].rstrip(b"\0").decode("ascii")
+
+    def title(self, row: int) -> str:
+        """Title of one row."""
+        start = self._title_end[row - 1] if row else 0
+        return str(self._heap[start:self._title_end[row]], "utf-8")
+
+    def titles(self) -> Iterator[str]:
+        """Every title, in row order."""
+        heap = self._heap
+        start = 0
+        for end in self._title_end:
+            yield str(heap[start:end], "utf-8")
+            start = end
+
+    def row(self, row: int) -> SnapshotRow:
+        """All fields of one row."""
+        done_at = self.completed_us[row]
+        return (
+            self.id(row),
+            self.title(row),
+            bool(self.completed[row]),
+            self.priority[row],
+            self.created_us[row],
+            None if done_at == NO_TIME else done_at,
+        )
+
+    def task(self, row: int) -> Task:
+        """Materialize one row as a Task."""
+        return Task.from_raw(*self.row(row))
+
+    def find(self, task_id: str) -> int | None:
+        """Row holding task_id, by binary search over the sorted ID column."""
+        try:
+            key = task_id.encode("ascii").ljust(self._id_width, b"\0")
+        except UnicodeEncodeError:
+            return None
+        # Slicing the mmap itself yields bytes, which compare in order
+        width, base, data, order = self._id_width, self._ids_start, self._mmap, self._id_order
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = base + order[mid] * width
+            if data[start:start + width] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            row = order[lo]
+            start = base + row * width
+            if data[start:start + width] == key:
+                return row
+        return None
+
+    def close(self) -> None:
+        """Release the mapping."""
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+
+class TaskTable:
+    """Mapping of task ID to Task over a snapshot, materializing rows on access.
+
+    Tasks created after loading, and snapshot rows once touched, live in
+    ordinary dicts; deleted snapshot rows are remembered by ID. Iteration
+    follows creation order, like a dict filled in creation order. Replacing
+    a task requires having looked it up first, as the repository always does.
+    """
+
+    def __init__(self, snapshot: ColumnarSnapshot | None = None) -> None:
+        """Wrap a snapshot, or start empty."""
+        self._snapshot = snapshot
+        self._base_count = len(snapshot) if snapshot is not None else 0
+        self._loaded: dict[str, Task] = {}
+        self._removed: set[str] = set()
+        self._new: dict[str, Task] = {}
+
+    def get(self, task_id: str, default: Task | None = None) -> Task | None:
+        """Get a task, materializing it from the snapshot on first access."""
+        task = self._new.get(task_id)
+        if task is None:
+            task = self._loaded.get(task_id)
+        if task is not None:
+            return task
+        snapshot = self._snapshot
+        if snapshot is None or task_id in self._removed:
+            return default
+        row = snapshot.find(task_id)
+        if row is None:
+            return default
+        # Concurrent readers may race here; setdefault makes them share one
+        # object, and the second check undoes a load that lost to a delete.
+        task = self._loaded.setdefault(task_id, snapshot.task(row))
+        if task_id in self._removed:
+            self._loaded.pop(task_id, None)
+            return default
+        return task
+
+    def __getitem__(self, task_id: str) -> Task:
+        """Get a task; raises KeyError if it does not exist."""
+        task = self.get(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        return task
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        """Add a new task, or replace one that was looked up before."""
+        if task_id in self._loaded:
+            self._loaded[task_id] = task
+        else:
+            self._new[task_id] = task
+
+    def pop(self, task_id: str, default: Task | None = None) -> Task | None:
+        """Remove and return a task."""
+        task = self._new.pop(task_id, None)
+        if task is not None:
+            return task
+        task = self.get(task_id)
+        if task is None:
+            return default
+        self._removed.add(task_id)
+        del self._loaded[task_id]
+        return task
+
+    def raw(self, task_id: str) -> SnapshotRow | None:
+        """A task's fields without materializing it, or None if it is gone."""
+        task = self._new.get(task_id) or self._loaded.get(task_id)
+        if task is None:
+            snapshot = self._snapshot
+            row = None if snapshot is None or task_id in self._removed else snapshot.find(task_id)
+            return None if row is None else snapshot.row(row)  # type: ignore[union-attr]
+        return (
+            task.id, task.title, task.completed,
+            task.priority_code, task.created_us, task.completed_us,
+        )
+
+    def values(self) -> list[Task]:
+        """Every task, in creation order, materializing the snapshot's rows."""
+        tasks: list[Task] = []
+        snapshot = self._snapshot
+        if snapshot is not None:
+            loaded = self._loaded
+            for row, task_id in enumerate(snapshot.ids()):
+                if task_id not in self._removed:
+                    task = loaded.get(task_id)
+                    if task is None:
+                        task = loaded.setdefault(task_id, snapshot.task(row))
+                    tasks.append(task)
+        tasks.extend(self._new.values())
+        return tasks
+
+    def __len__(self) -> int:
+        """Number of live tasks."""
+        return self._base_count - len(self._removed) + len(self._new)
+
+    def clear(self) -> None:
+        """Remove every task, dropping the snapshot."""
+        self._snapshot = None
+        self._base_count = 0
+        self._loaded.clear()
+        self._removed.clear()
+        self._new.clear()
+
+    def close(self) -> None:
+        """Clear the table and unmap its snapshot."""
+        snapshot = self._snapshot
+        self.clear()
+        if snapshot is not None:
+            snapshot.close()
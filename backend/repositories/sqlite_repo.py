@@ -0,0 +1,546 @@
+"""SQLite Task Repository - Persistent data access layer for tasks."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from backend.models.task_model import PRIORITY_CODES, Task, TaskPriority, to_epoch_us
+from backend.repositories.analytics import TaskColumns, analyze, check_range
+from backend.repositories.base import (
+    CHANGE_LOG_SIZE,
+    TaskChanges,
+    TaskUpdate,
+    decode_cursor,
+    encode_cursor,
+)
+from backend.repositories.title_index import tokenize
+
+# Executed once per database; every statement is idempotent
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    priority TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    completed_at INTEGER,
+    revision INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks (completed_at)
+    WHERE completed_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_tasks_revision ON tasks (revision);
+
+-- Single-row counters kept up to date by triggers, so stats never scan.
+-- version is bumped by every write and seeded from the clock on creation.
+-- Deletions at or before horizon may have been pruned from task_tombstones.
+CREATE TABLE IF NOT EXISTS task_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL DEFAULT 0,
+    horizon INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    low INTEGER NOT NULL DEFAULT 0,
+    medium INTEGER NOT NULL DEFAULT 0,
+    high INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO task_stats (id, version, horizon)
+    SELECT 0, now, now
+    FROM (SELECT CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER) AS now);
+
+-- IDs of deleted tasks by the version their deletion produced, for delta sync
+CREATE TABLE IF NOT EXISTS task_tombstones (
+    revision INTEGER PRIMARY KEY,
+    id TEXT NOT NULL
+);
+
+-- Full-text index over titles, kept in sync with tasks by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title,
+    content = 'tasks',
+    content_rowid = 'seq',
+    tokenize = "unicode61 remove_diacritics 0 tokenchars '_'"
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, title) VALUES (NEW.seq, NEW.title);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title) VALUES ('delete', OLD.seq, OLD.title);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title) VALUES ('delete', OLD.seq, OLD.title);
+    INSERT INTO tasks_fts (rowid, title) VALUES (NEW.seq, NEW.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_stats_insert AFTER INSERT ON tasks BEGIN
+    UPDATE task_stats SET
+        version = version + 1,
+        total = total + 1,
+        completed = completed + NEW.completed,
+        low = low + (NEW.priority = 'low'),
+        medium = medium + (NEW.priority = 'medium'),
+        high = high + (NEW.priority = 'high');
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_stats_delete AFTER DELETE ON tasks BEGIN
+    UPDATE task_stats SET
+        version = version + 1,
+        total = total - 1,
+        completed = completed - OLD.completed,
+        low = low - (OLD.priority = 'low'),
+        medium = medium - (OLD.priority = 'medium'),
+        high = high - (OLD.priority = 'high');
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_stats_update AFTER UPDATE ON tasks BEGIN
+    UPDATE task_stats SET
+        version = version + 1,
+        completed = completed + NEW.completed - OLD.completed,
+        low = low + (NEW.priority = 'low') - (OLD.priority = 'low'),
+        medium = medium + (NEW.priority = 'medium') - (OLD.priority = 'medium'),
+        high = high + (NEW.priority = 'high') - (OLD.priority = 'high');
+END;
+"""
+
+# Databases created before delta sync get the revision columns added in place
+_ADD_REVISIONS = (
+    "ALTER TABLE tasks ADD COLUMN revision INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE task_stats ADD COLUMN horizon INTEGER NOT NULL DEFAULT 0",
+    "UPDATE task_stats SET horizon = version",
+)
+
+# Every write stamps the rows it touches with the version its trigger is
+# about to produce
+_NEXT_VERSION = "(SELECT version FROM task_stats WHERE id = 0) + 1"
+
+# Statements are kept as constants so sqlite3's per-connection cache reuses them
+_COLUMNS = "seq, id, title, completed, priority, created_at, completed_at, revision"
+_INSERT = (
+    "INSERT INTO tasks (id, title, completed, priority, created_at, revision) "
+    f"VALUES (?, ?, 0, ?, ?, {_NEXT_VERSION})"
+)
+_IMPORT = (
+    "INSERT OR IGNORE INTO tasks "
+    "(id, title, completed, priority, created_at, completed_at, revision) "
+    f"VALUES (?, ?, ?, ?, ?, ?, {_NEXT_VERSION})"
+)
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM tasks WHERE id = ?"
+_SELECT_AFTER = f"SELECT {_COLUMNS} FROM tasks WHERE seq > ? ORDER BY seq LIMIT ?"
+_SELECT_PAGE = f"SELECT {_COLUMNS} FROM tasks ORDER BY seq DESC LIMIT ?"
+_UPDATE_TITLE = f"UPDATE tasks SET title = ?, revision = {_NEXT_VERSION} WHERE id = ?"
+_UPDATE_COMPLETED = (
+    f"UPDATE tasks SET completed = ?, completed_at = ?, revision = {_NEXT_VERSION} WHERE id = ?"
+)
+_TOGGLE = (
+    "UPDATE tasks SET completed = 1 - completed, "
+    "completed_at = CASE completed WHEN 0 THEN ? ELSE NULL END, "
+    f"revision = {_NEXT_VERSION} WHERE id = ?"
+)
+_UPDATE_PRIORITY = f"UPDATE tasks SET priority = ?, revision = {_NEXT_VERSION} WHERE id = ?"
+_DELETE = "DELETE FROM tasks WHERE id = ?"
+_DELETE_ALL = "DELETE FROM tasks"
+# The delete trigger fires once per row, so a clear of an empty table
+# would otherwise leave the version where it was
+_BUMP_VERSION = "UPDATE task_stats SET version = version + 1 WHERE id = 0"
+_INSERT_TOMBSTONE = (
+    "INSERT INTO task_tombstones (revision, id) "
+    "VALUES ((SELECT version FROM task_stats WHERE id = 0), ?)"
+)
+_PRUNE_TOMBSTONES = "DELETE FROM task_tombstones WHERE revision <= ?"
+_RAISE_HORIZON = "UPDATE task_stats SET horizon = max(horizon, ?) WHERE id = 0"
+_FORGET_TOMBSTONES = "DELETE FROM task_tombstones"
+_RESET_HORIZON = "UPDATE task_stats SET horizon = version WHERE id = 0"
+_SELECT_CHANGED = f"SELECT {_COLUMNS} FROM tasks WHERE revision > ? ORDER BY seq DESC"
+_SELECT_TOMBSTONES = "SELECT id FROM task_tombstones WHERE revision > ? ORDER BY revision"
+_SEARCH = (
+    f"SELECT {_COLUMNS} FROM tasks WHERE seq IN "
+    "(SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) ORDER BY seq DESC LIMIT ?"
+)
+_SELECT_STATS = "SELECT total, completed, low, medium, high FROM task_stats WHERE id = 0"
+_SELECT_VERSION = "SELECT version FROM task_stats WHERE id = 0"
+_SELECT_HISTORY = "SELECT version, horizon FROM task_stats WHERE id = 0"
+_COUNT_COMPLETED_BETWEEN = (
+    "SELECT COUNT(*) FROM tasks WHERE completed_at >= ? AND completed_at < ?"
+)
+# Tasks created in a range or completed in a (wider) range; both use an index
+_SELECT_ANALYTICS_COLUMNS = (
+    "SELECT created_at, completed_at, priority FROM tasks "
+    "WHERE created_at >= ? AND created_at < ? OR completed_at >= ? AND completed_at < ?"
+)
+_RECOUNT_STATS = """
+SELECT
+    COUNT(*),
+    COALESCE(SUM(completed), 0),
+    COALESCE(SUM(priority = 'low'), 0),
+    COALESCE(SUM(priority = 'medium'), 0),
+    COALESCE(SUM(priority = 'high'), 0)
+FROM tasks
+"""
+
+_Row = tuple[int, str, str, int, str, int, int | None, int]
+
+
+def _row_to_task(row: _Row) -> Task:
+    """Build a Task from a row selected with _COLUMNS."""
+    _, task_id, title, completed, priority, created_at, completed_at, revision = row
+    return Task.from_raw(
+        task_id,
+        title,
+        bool(completed),
+        PRIORITY_CODES[TaskPriority(priority)],
+        created_at,
+        completed_at,
+        revision,
+    )
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a connection in autocommit mode with WAL journaling.
+
+    WAL lets readers proceed while one writer commits, across threads and
+    across worker processes sharing the file.
+    """
+    conn = sqlite3.connect(
+        path,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=256,
+    )
+    # Set the timeout first: workers starting together race to enable WAL
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+class SqliteTaskRepository:
+    """Repository for task data operations - SQLite storage.
+
+    Each thread gets its own connection, so reads run concurrently under
+    WAL. Writes use short IMMEDIATE transactions.
+    """
+
+    # Disk I/O: callers on an event loop must run these calls in a thread
+    blocking = True
+
+    def __init__(self, path: str, verify_stats: bool = False) -> None:
+        """Open (creating if needed) the database at path."""
+        self._path = path
+        self._verify_stats = verify_stats
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        with self._transaction() as conn:
+            fts_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+            ).fetchone()
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+            if columns and "revision" not in columns:
+                for statement in _ADD_REVISIONS:
+                    conn.execute(statement)
+        conn.executescript(_SCHEMA)
+        if not fts_exists:
+            # Index titles of tasks stored before the full-text table existed
+            conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect(self._path)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in a write transaction on this thread's connection."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Run several reads against one consistent snapshot."""
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close every connection opened by this repository."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def create(self, title: str, priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
+        """Create a new task."""
+        return self.create_many([(title, priority)])[0]
+
+    def get_all(self) -> list[Task]:
+        """Get all tasks, newest first."""
+        return [_row_to_task(row) for row in self._conn().execute(_SELECT_PAGE, (-1,))]
+
+    def iter_tasks(self, batch_size: int = 1000) -> Iterator[list[Task]]:
+        """Yield every task, oldest first, in batches of up to batch_size.
+
+        Each batch is one primary key range query resuming after the last
+        row seen, so no transaction stays open between batches and each may
+        run on a different thread.
+        """
+        after = 0
+        while True:
+            rows = self._conn().execute(_SELECT_AFTER, (after, batch_size)).fetchall()
+            if not rows:
+                return
+            after = rows[-1][0]
+            yield [_row_to_task(row) for row in rows]
+
+    def get_page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of tasks, newest first, starting after an opaque cursor.
+
+        Optionally only tasks with the given completion status and/or
+        priority are returned, using the column indexes. Returns the page and
+        the cursor for the next page, or None when no older match remains.
+        Raises ValueError for a malformed cursor.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if cursor is not None:
+            conditions.append("seq < ?")
+            params.append(decode_cursor(cursor))
+        if completed is not None:
+            conditions.append("completed = ?")
+            params.append(int(completed))
+        if priority is not None:
+            conditions.append("priority = ?")
+            params.append(priority.value)
+        # Fetch one extra row to learn whether another page follows
+        params.append(-1 if limit is None else limit + 1)
+
+        # Only a handful of distinct statements exist, so they stay cached
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        sql = f"SELECT {_COLUMNS} FROM tasks {where}ORDER BY seq DESC LIMIT ?"
+        rows = self._conn().execute(sql, params).fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][0])
+        return [_row_to_task(row) for row in rows], next_cursor
+
+    def search(self, query: str, limit: int = 20) -> list[Task]:
+        """Find the newest tasks whose titles match a query.
+
+        Every query word must appear in the title; the last one may be a prefix.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        match = " ".join(f'"{token}"' for token in tokens) + "*"
+        return [_row_to_task(row) for row in self._conn().execute(_SEARCH, (match, limit))]
+
+    def get_by_id(self, task_id: str) -> Task | None:
+        """Get a task by ID."""
+        row = self._conn().execute(_SELECT_BY_ID, (task_id,)).fetchone()
+        return _row_to_task(row) if row else None
+
+    def update(
+        self,
+        task_id: str,
+        title: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> Task | None:
+        """Update a task."""
+        return self.update_many([TaskUpdate(task_id, title, completed, priority)])[0]
+
+    def toggle(self, task_id: str) -> Task | None:
+        """Atomically flip a task's completion status in one statement."""
+        with self._transaction() as conn:
+            conn.execute(_TOGGLE, (to_epoch_us(datetime.now()), task_id))
+            row = conn.execute(_SELECT_BY_ID, (task_id,)).fetchone()
+        return _row_to_task(row) if row else None
+
+    def delete(self, task_id: str) -> int | None:
+        """Delete a task by ID; returns the version the deletion produced, or
+        None if there was no such task."""
+        return self.delete_many([task_id])[0]
+
+    def create_many(self, items: list[tuple[str, TaskPriority]]) -> list[Task]:
+        """Create several (title, priority) tasks in one transaction."""
+        tasks = [Task(title=title, priority=priority) for title, priority in items]
+        with self._transaction() as conn:
+            conn.executemany(
+                _INSERT,
+                [
+                    (task.id, task.title, task.priority.value, task.created_us)
+                    for task in tasks
+                ],
+            )
+            version = conn.execute(_SELECT_VERSION).fetchone()[0]
+        # Each insert bumped the version by one
+        for offset, task in enumerate(reversed(tasks)):
+            task.revision = version - offset
+        return tasks
+
+    def import_many(self, tasks: list[Task]) -> list[bool]:
+        """Add tasks with their IDs and timestamps in one transaction; False
+        marks a task whose ID is already in use."""
+        results = []
+        with self._transaction() as conn:
+            version = conn.execute(_SELECT_VERSION).fetchone()[0]
+            for task in tasks:
+                added = conn.execute(_IMPORT, (
+                    task.id, task.title, int(task.completed), task.priority.value,
+                    task.created_us, task.completed_us,
+                )).rowcount > 0
+                if added:
+                    # Each insert bumps the version by one
+                    version += 1
+                    task.revision = version
+                results.append(added)
+        return results
+
+    def update_many(self, updates: list[TaskUpdate]) -> list[Task | None]:
+        """Apply several updates in one transaction; None marks a missing task."""
+        results: list[Task | None] = []
+        with self._transaction() as conn:
+            for update in updates:
+                if update.title is not None:
+                    conn.execute(_UPDATE_TITLE, (update.title, update.task_id))
+
+                if update.completed is not None:
+                    completed_at = to_epoch_us(datetime.now()) if update.completed else None
+                    conn.execute(
+                        _UPDATE_COMPLETED,
+                        (int(update.completed), completed_at, update.task_id),
+                    )
+
+                if update.priority is not None:
+                    conn.execute(_UPDATE_PRIORITY, (update.priority.value, update.task_id))
+
+                row = conn.execute(_SELECT_BY_ID, (update.task_id,)).fetchone()
+                results.append(_row_to_task(row) if row else None)
+        return results
+
+    def delete_many(self, task_ids: list[str]) -> list[int | None]:
+        """Delete several tasks in one transaction; returns each deletion's
+        version, None marking a missing task.
+
+        Each deletion leaves a tombstone for delta sync. Tombstones more than
+        CHANGE_LOG_SIZE versions old are pruned, raising the horizon.
+        """
+        results: list[int | None] = []
+        with self._transaction() as conn:
+            version = conn.execute(_SELECT_VERSION).fetchone()[0]
+            for task_id in task_ids:
+                if conn.execute(_DELETE, (task_id,)).rowcount > 0:
+                    # Each delete bumps the version by one
+                    version += 1
+                    conn.execute(_INSERT_TOMBSTONE, (task_id,))
+                    results.append(version)
+                else:
+                    results.append(None)
+            if any(result is not None for result in results):
+                cutoff = version - CHANGE_LOG_SIZE
+                if conn.execute(_PRUNE_TOMBSTONES, (cutoff,)).rowcount:
+                    conn.execute(_RAISE_HORIZON, (cutoff,))
+        return results
+
+    def get_version(self) -> int:
+        """Get the data version; it increases with every mutation."""
+        version: int = self._conn().execute(_SELECT_VERSION).fetchone()[0]
+        return version
+
+    def get_changes(self, since: int) -> TaskChanges:
+        """Get the tasks created, updated or deleted after revision since.
+
+        Reads the tasks stamped with a later revision (through the revision
+        index) and the tombstones left since, in one snapshot. A revision
+        older than the horizon, or newer than the data, gets a reset with
+        every task.
+        """
+        with self._snapshot() as conn:
+            version, horizon = conn.execute(_SELECT_HISTORY).fetchone()
+            if not horizon <= since <= version:
+                rows = conn.execute(_SELECT_PAGE, (-1,)).fetchall()
+                return TaskChanges(version, [_row_to_task(row) for row in rows], [], reset=True)
+            tasks = [_row_to_task(row) for row in conn.execute(_SELECT_CHANGED, (since,))]
+            tombstones = conn.execute(_SELECT_TOMBSTONES, (since,)).fetchall()
+        # An imported task may reuse the ID of one deleted earlier
+        live = {task.id for task in tasks}
+        deleted = list(dict.fromkeys(task_id for (task_id,) in tombstones if task_id not in live))
+        return TaskChanges(version, tasks, deleted)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get task statistics from the trigger-maintained counters."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        with self._snapshot() as conn:
+            total, completed, low, medium, high = conn.execute(_SELECT_STATS).fetchone()
+            completed_today = conn.execute(
+                _COUNT_COMPLETED_BETWEEN,
+                (to_epoch_us(today), to_epoch_us(today + timedelta(days=1))),
+            ).fetchone()[0]
+            recount = conn.execute(_RECOUNT_STATS).fetchone() if self._verify_stats else None
+
+        stats = {
+            "total": total,
+            "completed": completed,
+            "pending": total - completed,
+            "progress_percentage": (completed / total * 100) if total > 0 else 0,
+            "by_priority": {"low": low, "medium": medium, "high": high},
+            "completed_today": completed_today,
+        }
+        if recount is not None and recount != (total, completed, low, medium, high):
+            raise AssertionError(f"Stats drifted: counters={stats} recount={recount}")
+        return stats
+
+    def get_analytics(self, start: date, end: date, window: int = 7) -> dict[str, Any]:
+        """Get per-day created and completed counts, rolling throughput and
+        median time to complete per priority, for start to end inclusive.
+
+        Only the rows the report can count are read, into array columns.
+        Raises ValueError for an invalid range.
+        """
+        check_range(start, end, window)
+        start_us = to_epoch_us(datetime.combine(start, time()))
+        end_us = to_epoch_us(datetime.combine(end + timedelta(days=1), time()))
+        first_us = to_epoch_us(datetime.combine(start - timedelta(days=window - 1), time()))
+        columns = TaskColumns()
+        rows = self._conn().execute(
+            _SELECT_ANALYTICS_COLUMNS, (start_us, end_us, first_us, end_us)
+        )
+        for created_at, completed_at, priority in rows:
+            columns.add(created_at, completed_at, PRIORITY_CODES[TaskPriority(priority)])
+        return analyze(columns, start, end, window)
+
+    def clear_all(self) -> int:
+        """Clear all tasks; returns the version the clear produced."""
+        with self._transaction() as conn:
+            conn.execute(_DELETE_ALL)
+            conn.execute(_BUMP_VERSION)
+            conn.execute(_FORGET_TOMBSTONES)
+            conn.execute(_RESET_HORIZON)
+            version: int = conn.execute(_SELECT_VERSION).fetchone()[0]
+        return version
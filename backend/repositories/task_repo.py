@@ -1,34 +1,253 @@
 """Task Repository - Data access layer for tasks."""
 
-from datetime import datetime
+import heapq
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from collections.abc import Iterator
+from datetime import date, datetime
 from typing import Any
 
-from backend.models.task_model import Task, TaskPriority
+from backend.config import Settings, settings
+from backend.metrics import instrument, public_methods, repository_latency
+from backend.models.task_model import (
+    PRIORITIES,
+    PRIORITY_CODES,
+    Task,
+    TaskPriority,
+    to_epoch_us,
+)
+from backend.profiling import trace_calls
+from backend.repositories.analytics import TaskColumns, analyze
+from backend.repositories.base import (
+    CHANGE_LOG_SIZE,
+    TaskChanges,
+    TaskRepositoryProtocol,
+    TaskUpdate,
+    decode_cursor,
+    encode_cursor,
+)
+from backend.repositories.locks import ReadWriteLock
+from backend.repositories.sqlite_repo import SqliteTaskRepository
+from backend.repositories.title_index import TitleIndex
+
+# Compact the creation-order index once this many slots are tombstoned
+_COMPACT_THRESHOLD = 64
+
+_DAY_US = 86_400_000_000
 
 
 class TaskRepository:
-    """Repository for task data operations - In-memory storage."""
+    """Repository for task data operations - In-memory storage.
+
+    Safe to share between threads: reads hold a shared lock and mutations,
+    including whole batches, an exclusive one.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the repository with empty storage."""
+    def __init__(self, verify_stats: bool = False) -> None:
+        """Initialize the repository with empty storage.
+
+        With verify_stats enabled, every get_stats call checks the incremental
+        counters against a full recount and raises AssertionError on drift.
+        """
         self._tasks: dict[str, Task] = {}
+        self._lock = ReadWriteLock()
+        self._verify_stats = verify_stats
+        # Bumped by every mutation. Seeded from the UTC clock so versions keep
+        # increasing across restarts even though the data does not survive;
+        # local time would step back when daylight saving time ends.
+        self._version = time.time_ns() // 1000
+        # Change log for delta sync: (revision, task ID) for the latest
+        # mutations. Changes at or before the horizon may have been dropped.
+        self._changes: deque[tuple[int, str]] = deque(maxlen=CHANGE_LOG_SIZE)
+        self._horizon = self._version
+        # Incrementally maintained statistics
+        self._completed_count = 0
+        self._priority_counts = [0] * len(PRIORITIES)
+        # Completions per day, keyed by days since the epoch
+        self._completed_by_day: Counter[int] = Counter()
+        # Creation-order index: parallel lists of sequence numbers and task IDs,
+        # ascending by sequence. Deleted slots hold None until compaction.
+        self._next_seq = 0
+        self._order_seqs: list[int] = []
+        self._order_ids: list[str | None] = []
+        self._seq_by_id: dict[str, int] = {}
+        self._tombstones = 0
+        # Creation and completion times and priorities, slot for slot with
+        # the creation-order index, for analytics
+        self._columns = TaskColumns()
+        # Secondary indexes: task IDs by completion status and by priority code
+        self._ids_by_completed: tuple[set[str], set[str]] = (set(), set())
+        self._ids_by_priority: list[set[str]] = [set() for _ in PRIORITIES]
+        self._title_index = TitleIndex(lambda task_id: self._tasks[task_id].title)
+
+    @property
+    def blocking(self) -> bool:
+        """Pure in-memory work is cheap enough to run on the event loop."""
+        return False
 
     def create(self, title: str, priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
         """Create a new task."""
+        with self._lock.write():
+            return self._create(title, priority)
+
+    def _create(self, title: str, priority: TaskPriority) -> Task:
+        """Create a new task; the caller holds the write lock."""
         task = Task(title=title, priority=priority)
-        self._tasks[task.id] = task
+        self._insert(task)
         return task
 
+    def _insert(self, task: Task) -> None:
+        """Add a task as the newest one; the caller holds the write lock."""
+        self._tasks[task.id] = task
+        self._index_append(task.id)
+        self._add_to_indexes(task)
+        self._version += 1
+        task.revision = self._version
+        self._record_change(task.id)
+
     def get_all(self) -> list[Task]:
-        """Get all tasks sorted by creation date."""
-        return sorted(
-            self._tasks.values(),
-            key=lambda t: t.created_at,
-            reverse=True
-        )
+        """Get all tasks, newest first."""
+        # Dicts keep insertion order, which is creation order
+        with self._lock.read():
+            return list(reversed(self._tasks.values()))
+
+    def iter_tasks(self, batch_size: int = 1000) -> Iterator[list[Task]]:
+        """Yield every task, oldest first, in batches of up to batch_size.
+
+        Each batch holds the read lock only while it is collected, resuming
+        after the last sequence number seen, so writers are not held up for
+        the whole walk. A task changed meanwhile may appear in either state.
+        """
+        after = -1
+        while True:
+            with self._lock.read():
+                i = bisect_right(self._order_seqs, after)
+                ids = []
+                while i < len(self._order_ids) and len(ids) < batch_size:
+                    task_id = self._order_ids[i]
+                    if task_id is not None:
+                        ids.append(task_id)
+                    i += 1
+                if not ids:
+                    return
+                after = self._order_seqs[i - 1]
+                batch = [self._export(task_id) for task_id in ids]
+            yield batch
+
+    def _export(self, task_id: str) -> Task:
+        """Get a live task for iter_tasks; the caller holds a lock."""
+        return self._tasks[task_id]
+
+    def get_page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        completed: bool | None = None,
+        priority: TaskPriority | None = None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of tasks, newest first, starting after an opaque cursor.
+
+        Optionally only tasks with the given completion status and/or
+        priority are returned. Returns the page and the cursor for the next
+        page, or None when no older match remains. Raises ValueError for a
+        malformed cursor.
+        """
+        before = decode_cursor(cursor) if cursor is not None else None
+        with self._lock.read():
+            if completed is not None or priority is not None:
+                return self._get_filtered_page(limit, before, completed, priority)
+            return self._get_page(limit, before)
+
+    def _get_page(self, limit: int | None, before: int | None) -> tuple[list[Task], str | None]:
+        """Get a page from the creation-order index; the caller holds a lock."""
+
+        end = len(self._order_seqs)
+        if before is not None:
+            end = bisect_left(self._order_seqs, before)
+
+        page: list[Task] = []
+        i = end - 1
+        while i >= 0 and (limit is None or len(page) < limit):
+            task_id = self._order_ids[i]
+            if task_id is not None:
+                page.append(self._tasks[task_id])
+            i -= 1
+
+        # Only hand out a cursor if an older live task remains
+        while i >= 0 and self._order_ids[i] is None:
+            i -= 1
+        next_cursor = None
+        if i >= 0 and page:
+            next_cursor = encode_cursor(self._seq_by_id[page[-1].id])
+        return page, next_cursor
+
+    def _get_filtered_page(
+        self,
+        limit: int | None,
+        before: int | None,
+        completed: bool | None,
+        priority: TaskPriority | None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of filtered tasks from the secondary indexes.
+
+        Costs O(matches), plus a log factor to order them, instead of a scan.
+        """
+        candidates = []
+        if completed is not None:
+            candidates.append(self._ids_by_completed[completed])
+        if priority is not None:
+            candidates.append(self._ids_by_priority[PRIORITY_CODES[priority]])
+        candidates.sort(key=len)
+        matches = candidates[0] if len(candidates) == 1 else candidates[0] & candidates[1]
+
+        seq_of = self._seq_by_id.__getitem__
+        ids = iter(matches) if before is None else (i for i in matches if seq_of(i) < before)
+        if limit is None:
+            return [self._tasks[i] for i in sorted(ids, key=seq_of, reverse=True)], None
+
+        top = heapq.nlargest(limit + 1, ids, key=seq_of)
+        next_cursor = encode_cursor(seq_of(top[limit - 1])) if len(top) > limit else None
+        return [self._tasks[i] for i in top[:limit]], next_cursor
+
+    def search(self, query: str, limit: int = 20) -> list[Task]:
+        """Find the newest tasks whose titles match a query.
+
+        Every query word must appear in the title; the last one may be a prefix.
+        """
+        with self._lock.read():
+            return self._search(query, limit)
+
+    def _search(self, query: str, limit: int) -> list[Task]:
+        """Search titles; the caller holds a lock."""
+        matches = self._title_index.search(query)
+        if len(matches) ** 2 <= limit * len(self._tasks):
+            top = heapq.nlargest(limit, matches, key=self._seq_by_id.__getitem__)
+            return [self._tasks[i] for i in top]
+
+        # Broad match: walking newest-first finds limit hits after ~limit * n / m steps
+        page: list[Task] = []
+        for task_id in reversed(self._order_ids):
+            if len(page) >= limit:
+                break
+            if task_id in matches:
+                page.append(self._tasks[task_id])
+        return page
+
+    def get_analytics(self, start: date, end: date, window: int = 7) -> dict[str, Any]:
+        """Get per-day created and completed counts, rolling throughput and
+        median time to complete per priority, for start to end inclusive.
+
+        The columns are copied under the lock and analyzed outside it.
+        Raises ValueError for an invalid range.
+        """
+        with self._lock.read():
+            columns = self._columns.copy()
+        return analyze(columns, start, end, window)
 
     def get_by_id(self, task_id: str) -> Task | None:
         """Get a task by ID."""
+        # A single dict lookup is atomic, so no lock is needed
         return self._tasks.get(task_id)
 
     def update(
@@ -39,31 +258,165 @@ class TaskRepository:
         priority: TaskPriority | None = None
     ) -> Task | None:
         """Update a task."""
+        with self._lock.write():
+            return self._update(task_id, title, completed, priority)
+
+    def toggle(self, task_id: str) -> Task | None:
+        """Atomically flip a task's completion status."""
+        with self._lock.write():
+            task = self._tasks.get(task_id)
+            if not task:
+                return None
+            return self._update(task_id, None, not task.completed, None)
+
+    def _update(
+        self,
+        task_id: str,
+        title: str | None,
+        completed: bool | None,
+        priority: TaskPriority | None
+    ) -> Task | None:
+        """Update a task; the caller holds the write lock."""
         task = self._tasks.get(task_id)
         if not task:
             return None
 
         if title is not None:
+            self._title_index.remove(task_id, task.title)
             task.title = title
+            self._title_index.add(task_id, title)
 
         if completed is not None:
+            self._uncount_completion(task)
+            self._ids_by_completed[task.completed].discard(task_id)
             task.completed = completed
             task.completed_at = datetime.now() if completed else None
+            self._ids_by_completed[task.completed].add(task_id)
+            self._count_completion(task)
 
         if priority is not None:
+            self._priority_counts[task.priority_code] -= 1
+            self._ids_by_priority[task.priority_code].discard(task_id)
             task.priority = priority
+            self._ids_by_priority[task.priority_code].add(task_id)
+            self._priority_counts[task.priority_code] += 1
 
+        if completed is not None or priority is not None:
+            self._columns.put(self._slot(task_id), task)
+        task.json_cache = None
+        self._version += 1
+        task.revision = self._version
+        self._record_change(task_id)
         return task
 
-    def delete(self, task_id: str) -> bool:
-        """Delete a task by ID."""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-            return True
-        return False
+    def delete(self, task_id: str) -> int | None:
+        """Delete a task by ID; returns the version the deletion produced, or
+        None if there was no such task."""
+        with self._lock.write():
+            return self._delete(task_id)
+
+    def _delete(self, task_id: str) -> int | None:
+        """Delete a task by ID; the caller holds the write lock."""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+        self._index_remove(task_id)
+        self._remove_from_indexes(task)
+        self._version += 1
+        self._record_change(task_id)
+        return self._version
+
+    def create_many(self, items: list[tuple[str, TaskPriority]]) -> list[Task]:
+        """Create several (title, priority) tasks in one batch, under one lock."""
+        with self._lock.write():
+            return [self._create(title, priority) for title, priority in items]
+
+    def import_many(self, tasks: list[Task]) -> list[bool]:
+        """Add tasks with their IDs and timestamps in one batch, under one lock;
+        False marks a task whose ID is already in use."""
+        with self._lock.write():
+            return [self._import(task) for task in tasks]
+
+    def _import(self, task: Task) -> bool:
+        """Add a task as given unless its ID is taken; the caller holds the write lock."""
+        if self._tasks.get(task.id) is not None:
+            return False
+        self._insert(task)
+        return True
+
+    def update_many(self, updates: list[TaskUpdate]) -> list[Task | None]:
+        """Apply several updates in one batch, under one lock; None marks a missing task."""
+        with self._lock.write():
+            return [
+                self._update(u.task_id, u.title, u.completed, u.priority)
+                for u in updates
+            ]
+
+    def delete_many(self, task_ids: list[str]) -> list[int | None]:
+        """Delete several tasks in one batch, under one lock; returns each
+        deletion's version, None marking a missing task."""
+        with self._lock.write():
+            return [self._delete(task_id) for task_id in task_ids]
+
+    def get_version(self) -> int:
+        """Get the data version; it increases with every mutation."""
+        return self._version
+
+    def get_changes(self, since: int) -> TaskChanges:
+        """Get the tasks created, updated or deleted after revision since.
+
+        Walks the change log back to since, so this costs O(changes). A
+        revision older than the log, or newer than the data, gets a reset
+        with every task.
+        """
+        with self._lock.read():
+            if not self._horizon <= since <= self._version:
+                tasks = list(reversed(self._tasks.values()))
+                return TaskChanges(self._version, tasks, [], reset=True)
+            changed: dict[str, None] = {}
+            for revision, task_id in reversed(self._changes):
+                if revision <= since:
+                    break
+                changed[task_id] = None
+            tasks = []
+            deleted = []
+            for task_id in changed:
+                task = self._tasks.get(task_id)
+                if task is None:
+                    deleted.append(task_id)
+                else:
+                    tasks.append(task)
+            tasks.sort(key=lambda task: self._seq_by_id[task.id], reverse=True)
+            return TaskChanges(self._version, tasks, deleted)
 
     def get_stats(self) -> dict[str, Any]:
-        """Get task statistics."""
+        """Get task statistics from the incrementally maintained counters."""
+        with self._lock.read():
+            return self._get_stats()
+
+    def _get_stats(self) -> dict[str, Any]:
+        """Get task statistics; the caller holds a lock."""
+        total = len(self._tasks)
+        completed = self._completed_count
+
+        stats = {
+            "total": total,
+            "completed": completed,
+            "pending": total - completed,
+            "progress_percentage": (completed / total * 100) if total > 0 else 0,
+            "by_priority": {
+                p.value: count for p, count in zip(PRIORITIES, self._priority_counts, strict=True)
+            },
+            "completed_today": self._completed_by_day[to_epoch_us(datetime.now()) // _DAY_US],
+        }
+        if self._verify_stats:
+            expected = self._recount_stats()
+            if stats != expected:
+                raise AssertionError(f"Stats drifted: counters={stats} recount={expected}")
+        return stats
+
+    def _recount_stats(self) -> dict[str, Any]:
+        """Compute task statistics with a full scan, for consistency checks."""
         tasks = list(self._tasks.values())
         total = len(tasks)
         completed = sum(1 for t in tasks if t.completed)
@@ -92,11 +445,124 @@ class TaskRepository:
             "completed_today": completed_today,
         }
 
-    def clear_all(self) -> None:
-        """Clear all tasks."""
+    def clear_all(self) -> int:
+        """Clear all tasks; returns the version the clear produced."""
+        with self._lock.write():
+            self._clear_all()
+            return self._version
+
+    def _clear_all(self) -> None:
+        """Clear all tasks; the caller holds the write lock."""
+        self._version += 1
+        self._forget_changes()
         self._tasks.clear()
+        self._completed_count = 0
+        self._priority_counts = [0] * len(PRIORITIES)
+        self._completed_by_day.clear()
+        self._order_seqs.clear()
+        self._order_ids.clear()
+        self._seq_by_id.clear()
+        self._tombstones = 0
+        self._columns.clear()
+        for ids in (*self._ids_by_completed, *self._ids_by_priority):
+            ids.clear()
+        self._title_index.clear()
+
+    def _record_change(self, task_id: str) -> None:
+        """Log a change to a task at the current version."""
+        if len(self._changes) == self._changes.maxlen:
+            self._horizon = self._changes[0][0]
+        self._changes.append((self._version, task_id))
+
+    def _forget_changes(self) -> None:
+        """Drop the change log; older revisions get a reset from now on."""
+        self._changes.clear()
+        self._horizon = self._version
+
+    def _add_to_indexes(self, task: Task) -> None:
+        """Add a task to the secondary indexes and statistics counters."""
+        self._ids_by_completed[task.completed].add(task.id)
+        self._ids_by_priority[task.priority_code].add(task.id)
+        self._title_index.add(task.id, task.title)
+        self._columns.put(self._slot(task.id), task)
+        self._priority_counts[task.priority_code] += 1
+        self._count_completion(task)
+
+    def _remove_from_indexes(self, task: Task) -> None:
+        """Remove a task from the secondary indexes and statistics counters."""
+        self._ids_by_completed[task.completed].discard(task.id)
+        self._ids_by_priority[task.priority_code].discard(task.id)
+        self._title_index.remove(task.id, task.title)
+        self._priority_counts[task.priority_code] -= 1
+        self._uncount_completion(task)
+
+    def _count_completion(self, task: Task) -> None:
+        """Add a task's completion to the counters, if it is completed."""
+        if task.completed:
+            self._completed_count += 1
+            if task.completed_us is not None:
+                self._completed_by_day[task.completed_us // _DAY_US] += 1
+
+    def _uncount_completion(self, task: Task) -> None:
+        """Remove a task's completion from the counters, if it is completed."""
+        if task.completed:
+            self._completed_count -= 1
+            if task.completed_us is not None:
+                day = task.completed_us // _DAY_US
+                self._completed_by_day[day] -= 1
+                if not self._completed_by_day[day]:
+                    del self._completed_by_day[day]
+
+    def _index_append(self, task_id: str) -> None:
+        """Append a task to the creation-order index."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._order_seqs.append(seq)
+        self._order_ids.append(task_id)
+        self._seq_by_id[task_id] = seq
+        self._columns.append()
+
+    def _index_remove(self, task_id: str) -> None:
+        """Tombstone a task's slot in the creation-order index."""
+        slot = self._slot(task_id)
+        del self._seq_by_id[task_id]
+        self._order_ids[slot] = None
+        self._columns.remove(slot)
+        self._tombstones += 1
+        if self._tombstones > _COMPACT_THRESHOLD and self._tombstones * 2 > len(self._order_ids):
+            live = [i for i, task_id in enumerate(self._order_ids) if task_id is not None]
+            self._order_seqs = [self._order_seqs[i] for i in live]
+            self._order_ids = [self._order_ids[i] for i in live]
+            self._columns.compact(live)
+            self._tombstones = 0
+
+    def _slot(self, task_id: str) -> int:
+        """Position of a live task in the creation-order index."""
+        return bisect_left(self._order_seqs, self._seq_by_id[task_id])
+
+
+def create_task_repository(config: Settings = settings) -> TaskRepositoryProtocol:
+    """Create the repository for the configured storage backend."""
+    if config.storage_backend == "memory":
+        if config.wal_dir is None:
+            return TaskRepository()
+        # Imported here: the durable repository subclasses TaskRepository
+        from backend.repositories.durable_repo import DurableTaskRepository
+        return DurableTaskRepository(
+            config.wal_dir,
+            sync=config.wal_sync,
+            interval=None if config.wal_interval_ms is None else config.wal_interval_ms / 1000,
+            snapshot_every=config.snapshot_every,
+        )
+    if config.storage_backend == "sqlite":
+        return SqliteTaskRepository(config.sqlite_path)
+    raise ValueError(f"Unknown storage backend '{config.storage_backend}'")
 
 
-# Singleton instance for in-memory storage
-task_repository = TaskRepository()
+# Singleton instance for the configured storage backend
+task_repository = create_task_repository()
+if settings.metrics:
+    instrument(task_repository, repository_latency, public_methods(TaskRepositoryProtocol))
+if settings.slow_request_ms is not None:
+    trace_calls(task_repository, "repository", public_methods(TaskRepositoryProtocol))
 
@@ -0,0 +1,171 @@
+"""Title Index - Inverted index over task titles for search."""
+
+import re
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Edits queued while loading is deferred before the load is forced
+_MAX_PENDING = 65_536
+
+# Sorts after any character a token can contain
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into case-folded word tokens."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class TitleIndex:
+    """Inverted index from title tokens to task IDs.
+
+    A sorted vocabulary next to the postings makes prefix lookups a binary
+    search. title_of looks up an indexed task's current title, so a few
+    candidates can be checked directly instead of expanding a short prefix.
+
+    Like the repository around it, the index expects adds and removes to be
+    serialized with everything else; only searches may run concurrently.
+    """
+
+    def __init__(self, title_of: Callable[[str], str]) -> None:
+        """Initialize an empty index."""
+        self._title_of = title_of
+        self._postings: dict[str, set[str]] = {}
+        self._vocabulary: list[str] = []
+        self._vocabulary_sorted = True
+        # Deferred load: titles to index on first search, and edits made since
+        self._loader: Callable[[], Iterable[tuple[str, str]]] | None = None
+        self._pending: list[tuple[bool, str, str]] = []
+        self._load_lock = threading.Lock()
+
+    def defer(self, loader: Callable[[], Iterable[tuple[str, str]]]) -> None:
+        """Replace the contents with (task_id, title) pairs, indexed when first needed.
+
+        Until the first search, adds and removes are queued and applied on top
+        of the loaded titles, so a large board starts without tokenizing.
+        """
+        self.clear()
+        self._loader = loader
+
+    def _load(self) -> None:
+        """Run a deferred load, then replay the edits queued behind it."""
+        with self._load_lock:
+            loader = self._loader
+            if loader is None:
+                return
+            with self.bulk_load():
+                for task_id, title in loader():
+                    self._add(task_id, title)
+                for added, task_id, title in self._pending:
+                    (self._add if added else self._remove)(task_id, title)
+            self._pending.clear()
+            self._loader = None
+
+    def add(self, task_id: str, title: str) -> None:
+        """Index a task's title."""
+        if self._loader is not None:
+            self._pending.append((True, task_id, title))
+            if len(self._pending) > _MAX_PENDING:
+                self._load()
+            return
+        self._add(task_id, title)
+
+    def _add(self, task_id: str, title: str) -> None:
+        """Index a task's title now."""
+        for token in set(tokenize(title)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                if self._vocabulary_sorted:
+                    insort(self._vocabulary, token)
+            postings.add(task_id)
+
+    def remove(self, task_id: str, title: str) -> None:
+        """Remove a task's title from the index."""
+        if self._loader is not None:
+            self._pending.append((False, task_id, title))
+            if len(self._pending) > _MAX_PENDING:
+                self._load()
+            return
+        self._remove(task_id, title)
+
+    def _remove(self, task_id: str, title: str) -> None:
+        """Remove a task's title from the index now."""
+        for token in set(tokenize(title)):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(task_id)
+            if not postings:
+                del self._postings[token]
+                if self._vocabulary_sorted:
+                    del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Defer sorting the vocabulary until many titles have been indexed.
+
+        Each insort is linear in the vocabulary size, so loading many distinct
+        tokens one at a time is quadratic; this sorts once at the end instead.
+        The index must not be searched until the block exits.
+        """
+        self._vocabulary_sorted = False
+        try:
+            yield
+        finally:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_sorted = True
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a deferred load has run, or none was pending."""
+        return self._loader is None
+
+    def clear(self) -> None:
+        """Remove everything from the index."""
+        self._loader = None
+        self._pending.clear()
+        self._postings.clear()
+        self._vocabulary.clear()
+
+    def search(self, query: str) -> set[str]:
+        """Find IDs of tasks whose titles contain every query token.
+
+        The last token also matches as a prefix, for type-ahead.
+        """
+        if self._loader is not None:
+            self._load()
+        tokens = tokenize(query)
+        if not tokens:
+            return set()
+
+        *words, prefix = tokens
+        word_sets = []
+        for word in words:
+            postings = self._postings.get(word)
+            if not postings:
+                return set()
+            word_sets.append(postings)
+
+        # Vocabulary slice holding every token that starts with the prefix
+        lo = bisect_left(self._vocabulary, prefix)
+        hi = bisect_left(self._vocabulary, prefix + _MAX_CHAR, lo)
+        if lo == hi:
+            return set()
+
+        if not word_sets:
+            return set().union(*(self._postings[t] for t in self._vocabulary[lo:hi]))
+
+        word_sets.sort(key=len)
+        matches = word_sets[0].intersection(*word_sets[1:])
+        # Re-check a few candidates' titles rather than expanding a broad prefix
+        if len(matches) <= hi - lo:
+            return {
+                i for i in matches
+                if any(t.startswith(prefix) for t in tokenize(self._title_of(i)))
+            }
+        return matches.intersection(*(self._postings[t] for t in self._vocabulary[lo:hi]))
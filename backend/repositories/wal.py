@@ -0,0 +1,137 @@
+"""Write-Ahead Log - Append-only record file with group commit."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+# How hard append/sync work to get records onto disk:
+#   none      flushed to the OS every interval, never fsynced
+#   interval  fsynced every interval; a crash loses at most one interval
+#   group     fsynced in batches, and sync() waits for the batch to land
+#   always    every record is fsynced before append returns
+SYNC_LEVELS = ("none", "interval", "group", "always")
+
+# Seconds the flusher waits to batch records, by sync level. Group commit
+# batches naturally (writers queue up behind the running fsync), so any
+# extra delay there only pays off when fsyncs are slow.
+DEFAULT_INTERVALS = {"none": 0.01, "interval": 0.01, "group": 0.0, "always": 0.0}
+
+
+class WriteAheadLog:
+    """An append-only file of newline-terminated records.
+
+    Outside "always" mode a background thread flushes the file. It wakes on
+    the first new record and waits out the interval so that later records
+    join the batch, then writes and fsyncs them together. In "group" mode a
+    lone writer would only lose that wait, so it is skipped unless other
+    writers are already waiting for a commit; records that arrive during an
+    fsync still share the next one.
+    """
+
+    def __init__(self, path: Path, sync: str = "group", interval: float | None = None) -> None:
+        """Open path for appending; interval is the batching delay in seconds."""
+        if sync not in SYNC_LEVELS:
+            raise ValueError(f"Unknown sync level '{sync}'; expected one of {SYNC_LEVELS}")
+        self.path = path
+        self._sync = sync
+        self._interval = DEFAULT_INTERVALS[sync] if interval is None else interval
+        self._file = open(path, "ab", buffering=1 << 20)
+        self._cond = threading.Condition()
+        # Serializes fsync with rotate, which swaps the file underneath
+        self._io_lock = threading.Lock()
+        self._appended = 0
+        self._flushed = 0
+        self._durable = 0
+        self._waiting = 0
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+        if sync != "always":
+            self._flusher = threading.Thread(target=self._run, name="wal-flusher", daemon=True)
+            self._flusher.start()
+
+    @property
+    def appended(self) -> int:
+        """Number of records appended since the log was opened."""
+        return self._appended
+
+    def append(self, record: bytes) -> None:
+        """Append one record, which must end with a newline."""
+        with self._cond:
+            if self._closed:
+                raise ValueError("write to closed log")
+            self._file.write(record)
+            self._appended += 1
+            if self._sync == "always":
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._flushed = self._durable = self._appended
+            elif self._appended == self._flushed + 1:
+                self._cond.notify_all()
+
+    def sync(self) -> None:
+        """In "group" mode, wait until every record appended so far is on disk."""
+        if self._sync != "group":
+            return
+        with self._cond:
+            target = self._appended
+            self._waiting += 1
+            while self._durable < target:
+                self._cond.wait()
+            self._waiting -= 1
+
+    def rotate(self, path: Path) -> None:
+        """Make every record so far durable, then append to path from now on."""
+        with self._io_lock:
+            with self._cond:
+                self._file.flush()
+                old, self._file = self._file, open(path, "ab", buffering=1 << 20)
+                self.path = path
+                target = self._flushed = self._appended
+            os.fsync(old.fileno())
+            old.close()
+            self._mark_durable(target)
+
+    def close(self) -> None:
+        """Flush and fsync outstanding records and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._io_lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+        self._mark_durable(self._appended)
+
+    def _run(self) -> None:
+        """Flush batches of records until the log is closed."""
+        while True:
+            with self._cond:
+                while self._flushed == self._appended and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                gather = self._sync != "group" or self._waiting > 1
+            if gather:
+                time.sleep(self._interval)
+            self._flush()
+
+    def _flush(self) -> None:
+        """Hand buffered records to the OS, then fsync them unless sync is "none"."""
+        with self._io_lock:
+            with self._cond:
+                self._file.flush()
+                target = self._flushed = self._appended
+            if self._sync != "none":
+                os.fsync(self._file.fileno())
+        self._mark_durable(target)
+
+    def _mark_durable(self, target: int) -> None:
+        """Record that the first target records are on disk and wake waiters."""
+        with self._cond:
+            self._durable = max(self._durable, target)
+            self._cond.notify_all()
@@ -1,6 +1,8 @@
 """Routers package."""
 
+from .admin_router import router as admin_router
+from .metrics_router import router as metrics_router
 from .task_router import router as task_router
 
-__all__ = ["task_router"]
+__all__ = ["task_router", "metrics_router", "admin_router"]
 
@@ -0,0 +1,75 @@
+"""Admin Router - Live diagnosis endpoints behind a bearer token.
+
+The endpoints exist only when TASK_BOARD_ADMIN_TOKEN is set, and every
+request must send it as "Authorization: Bearer <token>".
+"""
+
+import secrets
+
+import anyio.to_thread
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+
+from backend.config import settings
+from backend.profiling import (
+    DEFAULT_INTERVAL,
+    MAX_PROFILE_SECONDS,
+    ProfilerBusyError,
+    profile,
+    render_collapsed,
+    slow_requests,
+)
+
+
+def require_admin(authorization: str | None = Header(None)) -> None:
+    """Reject requests without the admin token; hide the endpoints if none is set."""
+    if settings.admin_token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        token.encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Admin token required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/profile", response_class=Response)
+async def get_profile(
+    seconds: float = Query(10.0, gt=0, le=MAX_PROFILE_SECONDS, description="How long to sample"),
+    interval_ms: float = Query(
+        DEFAULT_INTERVAL * 1000, ge=1, le=1000, description="Time between samples"
+    ),
+    include_idle: bool = Query(False, description="Keep idle event loop and worker threads"),
+) -> Response:
+    """Sample every thread's stack for a while and return collapsed stacks.
+
+    Each line is a thread name and its frames, outermost first, separated
+    by semicolons, then the number of samples that caught that stack: the
+    input format of flamegraph.pl and speedscope. One profile runs at a
+    time; the service keeps serving requests while it samples.
+    """
+    try:
+        counts = await anyio.to_thread.run_sync(
+            profile, seconds, interval_ms / 1000, include_idle
+        )
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    return Response(render_collapsed(counts), media_type="text/plain")
+
+
+@router.get("/slow-requests")
+async def get_slow_requests(
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of traces"),
+) -> dict[str, object]:
+    """Get the most recent requests over the slow request threshold, newest
+    first, with the service and repository calls each one made.
+    """
+    return {
+        "threshold_ms": settings.slow_request_ms,
+        "requests": slow_requests.recent(limit),
+    }
@@ -0,0 +1,41 @@
+"""Metrics Router - Prometheus scrape endpoint."""
+
+from fastapi import APIRouter, Response
+
+from backend.metrics import (
+    CONTENT_TYPE,
+    cache_reads,
+    coalesced_reads,
+    registry,
+    tasks,
+    tasks_by_priority,
+)
+from backend.services.task_service import async_task_service, task_service
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=Response)
+async def get_metrics() -> Response:
+    """Get request, service and repository latency histograms and task
+    counts in the Prometheus text format.
+
+    Each worker process reports its own latencies; task counts come from
+    the shared store.
+    """
+    stats = await async_task_service.get_task_stats()
+    tasks.labels("completed").set(stats["completed"])
+    tasks.labels("pending").set(stats["pending"])
+    for priority, count in stats["by_priority"].items():
+        tasks_by_priority.labels(priority).set(count)
+    reads = async_task_service.reads
+    if reads is not None:
+        coalesced_reads.labels("hit").set(reads.hits)
+        coalesced_reads.labels("joined").set(reads.coalesced)
+        coalesced_reads.labels("computed").set(reads.misses)
+    cache = task_service.cache
+    if cache is not None:
+        cache_reads.labels("hit").set(cache.hits)
+        cache_reads.labels("miss").set(cache.misses)
+        cache_reads.labels("error").set(cache.errors)
+    return Response(registry.render(), media_type=CONTENT_TYPE)
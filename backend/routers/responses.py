@@ -0,0 +1,38 @@
+"""Response Classes - Responses for pre-encoded JSON bodies, and conditional requests."""
+
+from typing import Any
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+
+from backend.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that passes pre-encoded bytes through unchanged."""
+
+    def render(self, content: Any) -> bytes:
+        """Encode content, unless it is already JSON bytes."""
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches an entity tag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str, headers: dict[str, str] | None = None) -> Response:
+    """Build a 304 response for an unchanged resource, with any other headers
+    a 200 would have carried for caches.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **(headers or {})}
+    )
@@ -1,97 +1,453 @@
-"""Task Router - API endpoints for task operations."""
+"""Task Router - API endpoints for task operations.
 
-from fastapi import APIRouter, HTTPException, status
+Handlers return pre-encoded JSON (see backend.serialization); the schemas
+still validate requests and document responses.
+"""
 
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import date
+from itertools import compress
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from backend.compression import accepts_encoding
+from backend.models.task_model import Task
+from backend.routers.responses import FastJSONResponse, etag_matches, not_modified
 from backend.schemas.task_schema import (
+    TaskAnalyticsSchema,
+    TaskBulkCreateSchema,
+    TaskBulkDeleteSchema,
+    TaskBulkResponseSchema,
+    TaskBulkUpdateSchema,
+    TaskChangesResponseSchema,
     TaskCreateSchema,
+    TaskImportResponseSchema,
     TaskListResponseSchema,
+    TaskPriorityEnum,
     TaskResponseSchema,
+    TaskSearchResponseSchema,
     TaskStatsSchema,
     TaskUpdateSchema,
 )
-from backend.services.task_service import task_service
+from backend.serialization import (
+    render_bulk_results,
+    render_ndjson,
+    render_task_changes,
+    render_task_list,
+    render_task_search,
+    task_from_json,
+    task_json,
+)
+from backend.services.task_service import async_task_service
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
+# Clients must revalidate, but may reuse a cached body after a 304
+_REVALIDATE = {"Cache-Control": "no-cache"}
+
+
+def _revision(revisions: Iterable[int | None]) -> dict[str, str]:
+    """Build the X-Revision header for a mutation response.
+
+    The revision is the latest version the mutation produced. One that
+    changed nothing gets no header: the data version could include other
+    clients' writes, which a client syncing from it would miss.
+    """
+    revision = max((r for r in revisions if r is not None), default=None)
+    return {} if revision is None else {"X-Revision": str(revision)}
+
+
+def _task_revisions(tasks: Iterable[Task | None]) -> Iterator[int]:
+    """Revisions of the tasks a mutation wrote."""
+    return (task.revision for task in tasks if task is not None)
+
+
+# Idle connections get a comment line this often so proxies keep them open
+_KEEPALIVE_SECONDS = 15.0
+
+
+async def _event_stream(since: int) -> AsyncIterator[bytes]:
+    """Encode the change events after seq since as server-sent events.
+
+    The subscription is made once the response starts streaming, so that
+    it is always dropped when the stream ends, however it ends.
+    """
+    subscription = async_task_service.subscribe_changes(since)
+    try:
+        while True:
+            try:
+                event = await subscription.get(timeout=_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if event is None:
+                seq = async_task_service.get_change_seq()
+                yield f'id: {seq}\nevent: reset\ndata: {{"seq":{seq}}}\n\n'.encode()
+            else:
+                yield b"id: %d\nevent: %s\ndata: %s\n\n" % (
+                    event.seq, event.type.encode(), event.data
+                )
+    finally:
+        async_task_service.unsubscribe_changes(subscription)
+
+
+# Tasks read or written per repository call by export and import
+_TRANSFER_BATCH = 1000
+# Exports are compressed for throughput rather than size
+_GZIP_LEVEL = 1
+# Longest import line accepted; real lines are a few hundred bytes
+_MAX_LINE = 64 * 1024
+# Most bytes inflated from a gzipped import at a time
+_INFLATE_CHUNK = 256 * 1024
+
+
+async def _export_stream(compress: bool) -> AsyncIterator[bytes]:
+    """Encode every task as NDJSON, one repository batch at a time."""
+    deflate = zlib.compressobj(_GZIP_LEVEL, wbits=31) if compress else None
+    async for batch in async_task_service.export_tasks(_TRANSFER_BATCH):
+        chunk = render_ndjson(batch)
+        if deflate is not None:
+            chunk = deflate.compress(chunk)
+        if chunk:
+            yield chunk
+    if deflate is not None:
+        yield deflate.flush()
+
+
+def _bad_body(detail: str) -> HTTPException:
+    """Build the 400 error for an unreadable import body."""
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+async def _body_lines(request: Request) -> AsyncIterator[bytes]:
+    """Split a request body, gzipped or not, into lines as it arrives.
+
+    Holds at most one received chunk and one partial line, so memory stays
+    constant however large the body is.
+    """
+    encoding = request.headers.get("content-encoding", "identity").strip().lower()
+    if encoding not in ("identity", "gzip"):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported Content-Encoding '{encoding}'"
+        )
+    inflate = zlib.decompressobj(wbits=31) if encoding == "gzip" else None
+    pending = b""
+    async for chunk in request.stream():
+        while chunk:
+            if inflate is None:
+                data, chunk = chunk, b""
+            else:
+                try:
+                    data = inflate.decompress(chunk, _INFLATE_CHUNK)
+                except zlib.error as exc:
+                    raise _bad_body(f"Invalid gzip body: {exc}") from exc
+                chunk = inflate.unconsumed_tail
+            lines = (pending + data).split(b"\n")
+            pending = lines.pop()
+            if len(pending) > _MAX_LINE:
+                raise _bad_body(f"Line longer than {_MAX_LINE} bytes")
+            for line in lines:
+                yield line
+    if inflate is not None and not inflate.eof:
+        raise _bad_body("Truncated gzip body")
+    if pending:
+        yield pending
+
+
+def _not_found(task_id: str) -> HTTPException:
+    """Build the 404 error for a missing task."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Task with ID '{task_id}' not found"
+    )
+
+
 @router.get("", response_model=TaskListResponseSchema)
-async def get_all_tasks() -> TaskListResponseSchema:
-    """Get all tasks with statistics."""
-    data = task_service.get_tasks_with_stats()
-    return TaskListResponseSchema(**data)
+async def get_all_tasks(
+    limit: int | None = Query(None, ge=1, le=1000, description="Page size (all tasks if omitted)"),
+    cursor: str | None = Query(None, description="Opaque cursor from a previous page"),
+    completed: bool | None = Query(None, description="Only completed (true) or pending (false)"),
+    priority: TaskPriorityEnum | None = Query(None, description="Only tasks with this priority"),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Get tasks, newest first, with statistics, with ETag / If-None-Match support."""
+    # A matching If-None-Match is answered from the data version without
+    # reading any tasks. Filters are served from index sets, so a filtered
+    # page costs O(matches), and concurrent identical requests share one
+    # read, cached until the next mutation.
+    version = await async_task_service.get_version()
+    etag = f'"{version}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    try:
+        tasks, next_cursor = await async_task_service.get_task_page(
+            limit=limit,
+            cursor=cursor,
+            completed=completed,
+            priority=priority.value if priority else None,
+            version=version
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        ) from exc
+    stats = await async_task_service.get_task_stats(version=version)
+    return FastJSONResponse(
+        render_task_list(tasks, stats, next_cursor),
+        headers={"ETag": etag, "X-Revision": str(version), **_REVALIDATE}
+    )
 
 
 @router.post("", response_model=TaskResponseSchema, status_code=status.HTTP_201_CREATED)
-async def create_task(task_data: TaskCreateSchema) -> TaskResponseSchema:
+async def create_task(task_data: TaskCreateSchema) -> Response:
     """Create a new task."""
-    task = task_service.create_task(
+    task = await async_task_service.create_task(
         title=task_data.title,
         priority=task_data.priority.value
     )
-    return TaskResponseSchema(**task.to_dict())
+    return FastJSONResponse(
+        task_json(task), status_code=status.HTTP_201_CREATED, headers=_revision([task.revision])
+    )
+
+
+@router.post("/bulk", response_model=TaskBulkResponseSchema, status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(bulk_data: TaskBulkCreateSchema) -> Response:
+    """Create several tasks in one batch."""
+    tasks = await async_task_service.create_tasks(
+        [(item.title, item.priority.value) for item in bulk_data.tasks]
+    )
+    body = render_bulk_results([(task.id, status.HTTP_201_CREATED, task) for task in tasks])
+    return FastJSONResponse(
+        body, status_code=status.HTTP_201_CREATED, headers=_revision(_task_revisions(tasks))
+    )
+
+
+@router.patch("/bulk", response_model=TaskBulkResponseSchema)
+async def update_tasks_bulk(bulk_data: TaskBulkUpdateSchema) -> Response:
+    """Update several tasks in one batch; missing tasks get a 404 result."""
+    tasks = await async_task_service.update_tasks([
+        {
+            "task_id": item.id,
+            "title": item.title,
+            "completed": item.completed,
+            "priority": item.priority.value if item.priority else None,
+        }
+        for item in bulk_data.tasks
+    ])
+    return FastJSONResponse(render_bulk_results([
+        (item.id, status.HTTP_404_NOT_FOUND if task is None else status.HTTP_200_OK, task)
+        for item, task in zip(bulk_data.tasks, tasks, strict=True)
+    ]), headers=_revision(_task_revisions(tasks)))
+
+
+@router.delete("/bulk", response_model=TaskBulkResponseSchema)
+async def delete_tasks_bulk(bulk_data: TaskBulkDeleteSchema) -> Response:
+    """Delete several tasks in one batch; missing tasks get a 404 result."""
+    deleted = await async_task_service.delete_tasks(bulk_data.ids)
+    return FastJSONResponse(render_bulk_results([
+        (
+            task_id,
+            status.HTTP_404_NOT_FOUND if version is None else status.HTTP_204_NO_CONTENT,
+            None,
+        )
+        for task_id, version in zip(bulk_data.ids, deleted, strict=True)
+    ]), headers=_revision(deleted))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(accept_encoding: str | None = Header(None)) -> StreamingResponse:
+    """Export every task as newline-delimited JSON, oldest first."""
+    # Tasks are read and encoded a batch at a time, so memory use does not
+    # grow with the board; tasks changed mid-export may appear in either state
+    compress = accepts_encoding(accept_encoding, "gzip")
+    headers = {
+        "Content-Disposition": 'attachment; filename="tasks.ndjson"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        _export_stream(compress), media_type="application/x-ndjson", headers=headers
+    )
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResponseSchema,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "description": "Tasks as written by /tasks/export, one JSON object per line",
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def import_tasks(request: Request) -> Response:
+    """Import tasks from a /tasks/export body, skipping IDs already in use."""
+    # The body is parsed as it arrives and stored in batches. Skipping known
+    # IDs lets an interrupted import simply be sent again; a malformed line
+    # stops it with a 400, and the full batches before it stay imported.
+    imported = skipped = 0
+    # The latest revision each batch produced
+    revisions: list[int | None] = []
+    batch: list[Task] = []
+
+    async def flush() -> None:
+        nonlocal imported, skipped
+        added = await async_task_service.import_tasks(batch)
+        imported += sum(added)
+        skipped += len(added) - sum(added)
+        revisions.append(max(_task_revisions(compress(batch, added)), default=None))
+        batch.clear()
+
+    number = 0
+    async for line in _body_lines(request):
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            batch.append(task_from_json(line))
+        except ValueError as exc:
+            raise _bad_body(f"Line {number}: {exc}") from exc
+        if len(batch) == _TRANSFER_BATCH:
+            await flush()
+    if batch:
+        await flush()
+    return FastJSONResponse(
+        {"imported": imported, "skipped": skipped}, headers=_revision(revisions)
+    )
+
+
+@router.get("/search", response_model=TaskSearchResponseSchema)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in titles"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+) -> Response:
+    """Search task titles, newest first; the last word matches as a prefix."""
+    tasks = await async_task_service.search_tasks(q, limit=limit)
+    return FastJSONResponse(render_task_search(tasks))
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_task_events(
+    since: int | None = Query(None, description="Resume after this event sequence number"),
+    last_event_id: int | None = Header(None),
+) -> StreamingResponse:
+    """Stream task changes as server-sent events."""
+    # An `imported` event stands for a whole imported batch. A `reset` event
+    # means events were missed (too far behind, or a slow reader), so the
+    # client should refetch the task list.
+    if since is None:
+        since = last_event_id
+    if since is None:
+        # Events published before the stream starts are still delivered
+        since = async_task_service.get_change_seq()
+    return StreamingResponse(
+        _event_stream(since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/changes", response_model=TaskChangesResponseSchema)
+async def get_task_changes(
+    since: int = Query(..., ge=0, description="Revision the client last synced to"),
+) -> Response:
+    """Get the tasks changed after a revision, with statistics."""
+    # Clients start from the X-Revision of a full list and pass back each
+    # response's revision. When it is too old to work out the changes, reset
+    # is set and tasks is the whole board.
+    version = await async_task_service.get_version()
+    changes = await async_task_service.get_task_changes(since, version=version)
+    stats = await async_task_service.get_task_stats(version=version)
+    return FastJSONResponse(render_task_changes(changes, stats), headers=_REVALIDATE)
 
 
 @router.get("/stats", response_model=TaskStatsSchema)
-async def get_task_stats() -> TaskStatsSchema:
-    """Get task statistics."""
-    stats = task_service.get_task_stats()
-    return TaskStatsSchema(**stats)
+async def get_task_stats(if_none_match: str | None = Header(None)) -> Response:
+    """Get task statistics, with ETag / If-None-Match support."""
+    # completed_today rolls over at midnight, so the date is part of the tag
+    version = await async_task_service.get_version()
+    etag = f'"{version}-{date.today().isoformat()}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    stats = await async_task_service.get_task_stats(version=version)
+    return FastJSONResponse(stats, headers={"ETag": etag, **_REVALIDATE})
+
+
+@router.get("/analytics", response_model=TaskAnalyticsSchema)
+async def get_task_analytics(
+    start: date | None = Query(None, description="First day (defaults to 29 days before end)"),
+    end: date | None = Query(None, description="Last day (defaults to today)"),
+    window: int = Query(7, ge=1, le=365, description="Days per rolling throughput window"),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Get per-day task counts, throughput and time to complete."""
+    # The default range ends today, so the date is part of the tag
+    version = await async_task_service.get_version()
+    etag = f'"{version}-{date.today().isoformat()}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    try:
+        analytics = await async_task_service.get_task_analytics(
+            start, end, window, version=version
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        ) from exc
+    return FastJSONResponse(analytics, headers={"ETag": etag, **_REVALIDATE})
 
 
 @router.get("/{task_id}", response_model=TaskResponseSchema)
-async def get_task(task_id: str) -> TaskResponseSchema:
+async def get_task(task_id: str) -> Response:
     """Get a single task by ID."""
-    task = task_service.get_task(task_id)
+    task = await async_task_service.get_task(task_id)
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID '{task_id}' not found"
-        )
-    return TaskResponseSchema(**task.to_dict())
+        raise _not_found(task_id)
+    return FastJSONResponse(task_json(task))
 
 
 @router.patch("/{task_id}", response_model=TaskResponseSchema)
-async def update_task(task_id: str, task_data: TaskUpdateSchema) -> TaskResponseSchema:
+async def update_task(task_id: str, task_data: TaskUpdateSchema) -> Response:
     """Update a task."""
-    task = task_service.update_task(
+    task = await async_task_service.update_task(
         task_id=task_id,
         title=task_data.title,
         completed=task_data.completed,
         priority=task_data.priority.value if task_data.priority else None
     )
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID '{task_id}' not found"
-        )
-    return TaskResponseSchema(**task.to_dict())
+        raise _not_found(task_id)
+    return FastJSONResponse(task_json(task), headers=_revision([task.revision]))
 
 
 @router.patch("/{task_id}/toggle", response_model=TaskResponseSchema)
-async def toggle_task_completion(task_id: str) -> TaskResponseSchema:
+async def toggle_task_completion(task_id: str) -> Response:
     """Toggle task completion status."""
-    task = task_service.toggle_task_completion(task_id)
+    task = await async_task_service.toggle_task_completion(task_id)
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID '{task_id}' not found"
-        )
-    return TaskResponseSchema(**task.to_dict())
+        raise _not_found(task_id)
+    return FastJSONResponse(task_json(task), headers=_revision([task.revision]))
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task(task_id: str) -> None:
+async def delete_task(task_id: str, response: Response) -> None:
     """Delete a task."""
-    success = task_service.delete_task(task_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID '{task_id}' not found"
-        )
+    version = await async_task_service.delete_task(task_id)
+    if version is None:
+        raise _not_found(task_id)
+    response.headers.update(_revision([version]))
 
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
-async def clear_all_tasks() -> None:
+async def clear_all_tasks(response: Response) -> None:
     """Clear all tasks."""
-    task_service.clear_all_tasks()
-
+    version = await async_task_service.clear_all_tasks()
+    response.headers.update(_revision([version]))
@@ -1,10 +1,21 @@
 """Schemas package."""
 
 from .task_schema import (
+    TaskAnalyticsDaySchema,
+    TaskAnalyticsSchema,
+    TaskBulkCreateSchema,
+    TaskBulkDeleteSchema,
+    TaskBulkResponseSchema,
+    TaskBulkResultSchema,
+    TaskBulkUpdateItemSchema,
+    TaskBulkUpdateSchema,
+    TaskChangesResponseSchema,
     TaskCreateSchema,
+    TaskImportResponseSchema,
     TaskListResponseSchema,
     TaskPriorityEnum,
     TaskResponseSchema,
+    TaskSearchResponseSchema,
     TaskStatsSchema,
     TaskUpdateSchema,
 )
@@ -14,7 +25,18 @@ __all__ = [
     "TaskUpdateSchema",
     "TaskResponseSchema",
     "TaskListResponseSchema",
+    "TaskSearchResponseSchema",
     "TaskStatsSchema",
     "TaskPriorityEnum",
+    "TaskBulkCreateSchema",
+    "TaskBulkUpdateItemSchema",
+    "TaskBulkUpdateSchema",
+    "TaskBulkDeleteSchema",
+    "TaskBulkResultSchema",
+    "TaskBulkResponseSchema",
+    "TaskAnalyticsDaySchema",
+    "TaskAnalyticsSchema",
+    "TaskChangesResponseSchema",
+    "TaskImportResponseSchema",
 ]
 
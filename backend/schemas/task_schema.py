@@ -1,6 +1,6 @@
 """Task Schemas - Pydantic models for request/response validation."""
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
 from pydantic import BaseModel, Field
@@ -45,6 +45,64 @@ class TaskListResponseSchema(BaseModel):
     completed: int
     pending: int
     progress_percentage: float
+    next_cursor: str | None = Field(None, description="Cursor for the next page, if any")
+
+
+class TaskChangesResponseSchema(BaseModel):
+    """Schema for the tasks changed since a revision, with statistics."""
+    tasks: list[TaskResponseSchema] = Field(
+        ..., description="Created or updated tasks, newest first (every task on a reset)"
+    )
+    revision: int = Field(..., description="Revision to pass as since next time")
+    reset: bool = Field(..., description="Whether tasks replaces the client's copy")
+    deleted: list[str] = Field(..., description="IDs of deleted tasks")
+    total: int
+    completed: int
+    pending: int
+    progress_percentage: float
+
+
+class TaskSearchResponseSchema(BaseModel):
+    """Schema for title search results, newest first."""
+    tasks: list[TaskResponseSchema]
+
+
+class TaskBulkCreateSchema(BaseModel):
+    """Schema for creating several tasks at once."""
+    tasks: list[TaskCreateSchema] = Field(..., min_length=1, max_length=1000)
+
+
+class TaskBulkUpdateItemSchema(TaskUpdateSchema):
+    """Schema for one task's changes in a bulk update."""
+    id: str
+
+
+class TaskBulkUpdateSchema(BaseModel):
+    """Schema for updating several tasks at once."""
+    tasks: list[TaskBulkUpdateItemSchema] = Field(..., min_length=1, max_length=1000)
+
+
+class TaskBulkDeleteSchema(BaseModel):
+    """Schema for deleting several tasks at once."""
+    ids: list[str] = Field(..., min_length=1, max_length=1000)
+
+
+class TaskBulkResultSchema(BaseModel):
+    """Schema for the outcome of one item in a bulk operation."""
+    id: str
+    status: int = Field(..., description="HTTP status the item would get on its own")
+    task: TaskResponseSchema | None = None
+
+
+class TaskBulkResponseSchema(BaseModel):
+    """Schema for bulk operation results, in request order."""
+    results: list[TaskBulkResultSchema]
+
+
+class TaskImportResponseSchema(BaseModel):
+    """Schema for the outcome of an import."""
+    imported: int = Field(..., description="Tasks added")
+    skipped: int = Field(..., description="Tasks left out because their ID was already in use")
 
 
 class TaskStatsSchema(BaseModel):
@@ -56,3 +114,19 @@ class TaskStatsSchema(BaseModel):
     by_priority: dict[str, int]
     completed_today: int
 
+
+class TaskAnalyticsDaySchema(BaseModel):
+    """Schema for one day of task analytics."""
+    date: date
+    created: int
+    completed: int
+    throughput: float = Field(..., description="Mean completions per day over the window")
+
+
+class TaskAnalyticsSchema(BaseModel):
+    """Schema for task completion trends over a date range."""
+    start: date
+    end: date
+    window: int
+    days: list[TaskAnalyticsDaySchema]
+    median_completion_seconds: dict[str, float | None]
@@ -0,0 +1,188 @@
+"""Serialization - Fast JSON encoding for API responses.
+
+Uses orjson when it is installed and falls back to the standard library.
+Task lists are assembled from cached per-task JSON fragments, so listing
+costs a byte join instead of building and validating one model per task.
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from backend.models.task_model import PRIORITY_CODES, Task, TaskPriority, to_epoch_us
+
+if TYPE_CHECKING:
+    # The durable repository encodes with this module, so importing the
+    # repositories package here would be circular
+    from backend.repositories.base import TaskChanges
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the speedups extra
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a JSON-compatible value as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON, as produced by dumps."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _cached_json(task: Task) -> bytes | None:
+    """Get a task's cached JSON fragment, if it was encoded at its current revision."""
+    cached = task.json_cache
+    if cached is None or cached[0] != task.revision:
+        return None
+    return cached[1]
+
+
+def task_json(task: Task) -> bytes:
+    """Get a task's JSON, reusing its cached fragment when still valid.
+
+    Encoding runs outside the repository lock, so a write can land while it
+    does. The fragment is stored under the revision read before encoding,
+    which the write then moves on from, so a stale fragment is never reused.
+    """
+    fragment = _cached_json(task)
+    if fragment is None:
+        revision = task.revision
+        fragment = dumps(task.to_dict())
+        task.json_cache = (revision, fragment)
+    return fragment
+
+
+def _task_array(tasks: Iterable[Task]) -> bytes:
+    """Encode tasks as a JSON array from their cached fragments."""
+    return b"[" + b",".join(task_json(task) for task in tasks) + b"]"
+
+
+def render_task_list(tasks: list[Task], stats: dict[str, Any], next_cursor: str | None) -> bytes:
+    """Encode a task list response body with its statistics."""
+    summary = dumps({
+        "total": stats["total"],
+        "completed": stats["completed"],
+        "pending": stats["pending"],
+        "progress_percentage": float(stats["progress_percentage"]),
+        "next_cursor": next_cursor,
+    })
+    return b'{"tasks":' + _task_array(tasks) + b"," + summary[1:]
+
+
+def render_task_changes(changes: "TaskChanges", stats: dict[str, Any]) -> bytes:
+    """Encode a delta sync response body with the board's statistics."""
+    summary = dumps({
+        "revision": changes.revision,
+        "reset": changes.reset,
+        "deleted": changes.deleted,
+        "total": stats["total"],
+        "completed": stats["completed"],
+        "pending": stats["pending"],
+        "progress_percentage": float(stats["progress_percentage"]),
+    })
+    return b'{"tasks":' + _task_array(changes.tasks) + b"," + summary[1:]
+
+
+def render_task_search(tasks: list[Task]) -> bytes:
+    """Encode a title search response body."""
+    return b'{"tasks":' + _task_array(tasks) + b"}"
+
+
+def render_ndjson(tasks: Iterable[Task]) -> bytes:
+    """Encode tasks as newline-delimited JSON, one task per line.
+
+    Cached fragments are reused but not filled in, so exporting a whole
+    board leaves no per-task cache behind.
+    """
+    return b"".join(
+        (_cached_json(task) or dumps(task.to_dict())) + b"\n" for task in tasks
+    )
+
+
+# Same limit as TaskCreateSchema
+_MAX_TITLE = 200
+# IDs stay URL-safe ASCII, as generated ones are: they appear in paths and
+# snapshots store them as fixed-width ASCII
+_MAX_ID = 64
+_VALID_ID = re.compile(rf"[A-Za-z0-9_-]{{1,{_MAX_ID}}}")
+
+
+def task_from_json(line: bytes) -> Task:
+    """Decode one line written by render_ndjson back into a task.
+
+    Raises ValueError naming the first field that is missing or invalid.
+    """
+    try:
+        data = loads(line)
+    except ValueError as exc:
+        raise ValueError("invalid JSON") from exc
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    try:
+        task_id = data["id"]
+        title = data["title"]
+        completed = data["completed"]
+        priority = data["priority"]
+        created_at = data["created_at"]
+    except KeyError as exc:
+        raise ValueError(f"missing field {exc.args[0]!r}") from None
+    completed_at = data.get("completed_at")
+    if not isinstance(task_id, str) or not _VALID_ID.fullmatch(task_id):
+        raise ValueError(
+            f"id must be 1 to {_MAX_ID} letters, digits, hyphens or underscores"
+        )
+    if not isinstance(title, str) or not 1 <= len(title) <= _MAX_TITLE:
+        raise ValueError(f"title must be a string of 1 to {_MAX_TITLE} characters")
+    if not isinstance(completed, bool):
+        raise ValueError("completed must be a boolean")
+    try:
+        priority_code = PRIORITY_CODES[TaskPriority(priority)]
+    except ValueError:
+        raise ValueError(f"unknown priority {priority!r}") from None
+    return Task.from_raw(
+        task_id,
+        title,
+        completed,
+        priority_code,
+        _epoch_us(created_at, "created_at"),
+        None if completed_at is None else _epoch_us(completed_at, "completed_at"),
+    )
+
+
+def _epoch_us(value: Any, field: str) -> int:
+    """Parse an ISO 8601 timestamp field into epoch microseconds.
+
+    Times with an offset are converted to naive local time, like the rest.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be an ISO 8601 timestamp") from None
+    try:
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return to_epoch_us(parsed)
+    except OverflowError:
+        # Converting to local time can leave the calendar near its bounds
+        raise ValueError(f"{field} is out of range") from None
+
+
+def render_bulk_results(results: list[tuple[str, int, Task | None]]) -> bytes:
+    """Encode bulk operation results given as (id, status, task) tuples."""
+    items = [
+        dumps({"id": task_id, "status": status})[:-1]
+        + b',"task":'
+        + (task_json(task) if task is not None else b"null")
+        + b"}"
+        for task_id, status, task in results
+    ]
+    return b'{"results":[' + b",".join(items) + b"]}"
@@ -1,6 +1,6 @@
 """Services package."""
 
-from .task_service import TaskService, task_service
+from .task_service import AsyncTaskService, TaskService, async_task_service, task_service
 
-__all__ = ["TaskService", "task_service"]
+__all__ = ["TaskService", "task_service", "AsyncTaskService", "async_task_service"]
 
@@ -0,0 +1,383 @@
+"""Task Cache - Read-through cache of tasks, task pages and statistics.
+
+TaskService reads single tasks, pages and statistics through it, so hot
+reads stop reaching storage. There are two backends: an in-process LRU
+whose entries expire after a TTL, and a client for a Redis-protocol server
+(Redis, Valkey, KeyDB, ...) that several worker processes can share.
+
+The in-process backend keeps the Task objects themselves, so a hit costs a
+lookup and reuses each task's cached JSON fragment; the shared backend
+stores tasks as JSON field lists and rebuilds them on a hit.
+
+Tasks are cached by ID. Every write puts the tasks it returns in the cache
+(a delete puts a "no such task" marker), while reads only add entries that
+are missing, so a read that raced a write cannot replace what the write
+stored. Pages and statistics are cached under the data version, so any
+mutation makes them unreachable at once; they age out by LRU or TTL.
+Clearing the board clears the cache. The TTL bounds any staleness that
+slips through, such as a racing read whose entry was evicted meanwhile.
+"""
+
+import socket
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import date
+from time import monotonic
+from typing import Any, BinaryIO, Protocol, TypeVar
+from urllib.parse import unquote, urlsplit
+
+from backend.config import Settings, settings
+from backend.models.task_model import Task
+from backend.serialization import dumps, loads
+
+T = TypeVar("T")
+
+# Returned by Cache.get for a key that holds no value
+MISS: Any = object()
+
+
+class CacheError(Exception):
+    """Raised when a cache server cannot be reached or rejects a command."""
+
+
+class Cache(Protocol):
+    """Interface implemented by every cache backend.
+
+    Values must not be modified once stored or returned. They must be
+    JSON-compatible unless the backend shares values.
+    """
+
+    # Whether values are kept in this process and returned as stored
+    shares_values: bool
+
+    def get(self, key: str) -> Any:
+        """Get a value, or MISS."""
+        ...
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+        ...
+
+    def add(self, key: str, value: Any) -> None:
+        """Store a value unless the key already holds one."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every value."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache whose entries expire ttl seconds after being stored.
+
+    Safe to share between threads. Values are kept as they are, not
+    encoded.
+    """
+
+    shares_values = True
+
+    def __init__(self, size: int, ttl: float) -> None:
+        """Hold up to size entries for up to ttl seconds each."""
+        self._size = size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Get a value, or MISS if it is absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            if entry[0] <= monotonic():
+                del self._entries[key]
+                return MISS
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+        with self._lock:
+            self._store(key, value)
+
+    def add(self, key: str, value: Any) -> None:
+        """Store a value unless the key holds an unexpired one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= monotonic():
+                self._store(key, value)
+
+    def clear(self) -> None:
+        """Drop every value."""
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: str, value: Any) -> None:
+        """Store a value as the most recently used; the caller holds the lock."""
+        self._entries[key] = (monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+
+def _encode_command(args: tuple[bytes | str | int, ...]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def _read_reply(stream: BinaryIO) -> Any:
+    """Read one RESP2 reply; error replies raise CacheError."""
+    line = stream.readline()
+    if not line.endswith(b"\r\n"):
+        raise CacheError("connection closed by the cache server")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest
+    if kind == b"-":
+        raise CacheError(rest.decode(errors="replace"))
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        length = int(rest)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise CacheError("connection closed by the cache server")
+        return data[:-2]
+    if kind == b"*":
+        count = int(rest)
+        return None if count < 0 else [_read_reply(stream) for _ in range(count)]
+    raise CacheError(f"unexpected reply {line[:40]!r}")
+
+
+class RespCache:
+    """Cache in a Redis-protocol server, shared by every process that uses it.
+
+    Speaks RESP2 over one connection per thread, with every key under
+    prefix and a TTL on every value. Failures raise CacheError after
+    dropping the connection, which is reopened on the next call.
+    """
+
+    shares_values = False
+
+    def __init__(
+        self, url: str, ttl: float, prefix: str = "task_board:", timeout: float = 0.5
+    ) -> None:
+        """Use the server at a redis://[[user]:password@]host[:port][/db] URL.
+
+        Nothing connects until the first call. Raises ValueError for a
+        malformed URL.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "redis" or not parts.hostname:
+            raise ValueError(f"Unsupported cache URL '{url}'")
+        self._address = (parts.hostname, parts.port or 6379)
+        self._username = unquote(parts.username) if parts.username else None
+        self._password = unquote(parts.password) if parts.password else None
+        self._db = int(parts.path.lstrip("/") or 0)
+        self._ttl_ms = max(1, round(ttl * 1000))
+        self._prefix = prefix
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def get(self, key: str) -> Any:
+        """Get a value, or MISS."""
+        data = self._command("GET", self._prefix + key)
+        return MISS if data is None else loads(data)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+        self._command("SET", self._prefix + key, dumps(value), "PX", self._ttl_ms)
+
+    def add(self, key: str, value: Any) -> None:
+        """Store a value unless the key already holds one."""
+        self._command("SET", self._prefix + key, dumps(value), "PX", self._ttl_ms, "NX")
+
+    def clear(self) -> None:
+        """Delete every key under the prefix."""
+        cursor = b"0"
+        while True:
+            cursor, keys = self._command("SCAN", cursor, "MATCH", self._prefix + "*", "COUNT", 1000)
+            if keys:
+                self._command("DEL", *keys)
+            if cursor == b"0":
+                return
+
+    def close(self) -> None:
+        """Close this thread's connection, if open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn[0].close()
+
+    def _command(self, *args: bytes | str | int) -> Any:
+        """Send a command on this thread's connection and read its reply."""
+        try:
+            sock, stream = self._connection()
+            sock.sendall(_encode_command(args))
+            return _read_reply(stream)
+        except (OSError, CacheError) as exc:
+            self.close()
+            if isinstance(exc, CacheError):
+                raise
+            raise CacheError(f"cache server unavailable: {exc}") from exc
+
+    def _connection(self) -> tuple[socket.socket, BinaryIO]:
+        """Get this thread's connection, opening and preparing it on first use."""
+        conn: tuple[socket.socket, BinaryIO] | None = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.create_connection(self._address, timeout=self._timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = self._local.conn = (sock, sock.makefile("rb"))
+            setup: list[tuple[bytes | str | int, ...]] = []
+            if self._password is not None:
+                auth = (self._username, self._password) if self._username else (self._password,)
+                setup.append(("AUTH", *auth))
+            if self._db:
+                setup.append(("SELECT", self._db))
+            for args in setup:
+                sock.sendall(_encode_command(args))
+                _read_reply(conn[1])
+        return conn
+
+
+def _task_fields(task: Task | None) -> list[Any] | None:
+    """A task as its raw field values, for Task.from_raw."""
+    if task is None:
+        return None
+    return [
+        task.id, task.title, task.completed, task.priority_code,
+        task.created_us, task.completed_us, task.revision,
+    ]
+
+
+def _from_fields(fields: list[Any] | None) -> Task | None:
+    """Rebuild a task stored by _task_fields."""
+    return Task.from_raw(*fields) if fields is not None else None
+
+
+class TaskCache:
+    """Read-through cache of tasks, task pages and statistics over a backend.
+
+    A backend that fails is bypassed: reads go to storage and writes are
+    skipped, leaving at most TTL-old entries behind.
+    """
+
+    def __init__(self, backend: Cache) -> None:
+        """Cache in backend."""
+        self.backend = backend
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get_task(self, task_id: str, load: Callable[[str], Task | None]) -> Task | None:
+        """Get a task (or None for no such task), loading it on a miss."""
+        return self._read(
+            f"task:{task_id}", lambda: load(task_id), _task_fields, _from_fields
+        )
+
+    def get_page(
+        self,
+        version: int,
+        params: tuple[Any, ...],
+        load: Callable[[], tuple[list[Task], str | None]],
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of tasks at a data version, loading it on a miss.
+
+        params are the page's limit, cursor and filters.
+        """
+        def encode(page: tuple[list[Task], str | None]) -> list[Any]:
+            return [[_task_fields(task) for task in page[0]], page[1]]
+
+        def decode(value: list[Any]) -> tuple[list[Task], str | None]:
+            return [Task.from_raw(*fields) for fields in value[0]], value[1]
+
+        key = "page:" + ":".join(map(str, (version, *params)))
+        return self._read(key, load, encode, decode)
+
+    def get_stats(self, version: int, load: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Get task statistics at a data version, loading them on a miss."""
+        key = f"stats:{version}:{date.today().isoformat()}"
+        return self._read(key, load, _identity, _identity)
+
+    def put(self, tasks: Iterable[Task | None]) -> None:
+        """Store the state a write left tasks in; None entries are skipped."""
+        shared = self.backend.shares_values
+        for task in tasks:
+            if task is not None:
+                value = task if shared else _task_fields(task)
+                self._write(self.backend.set, f"task:{task.id}", value)
+
+    def forget(self, task_ids: Iterable[str]) -> None:
+        """Record that tasks no longer exist."""
+        for task_id in task_ids:
+            self._write(self.backend.set, f"task:{task_id}", None)
+
+    def clear(self) -> None:
+        """Drop everything cached."""
+        try:
+            self.backend.clear()
+        except CacheError:
+            self.errors += 1
+
+    def _read(
+        self,
+        key: str,
+        load: Callable[[], T],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+    ) -> T:
+        """Return the cached value for key, or load it and cache it if absent.
+
+        Values are encoded for backends that do not share them.
+        """
+        try:
+            cached = self.backend.get(key)
+        except CacheError:
+            self.errors += 1
+            return load()
+        shared = self.backend.shares_values
+        if cached is not MISS:
+            self.hits += 1
+            return cached if shared else decode(cached)  # type: ignore[no-any-return]
+        self.misses += 1
+        value = load()
+        self._write(self.backend.add, key, value if shared else encode(value))
+        return value
+
+    def _write(self, method: Callable[[str, Any], None], key: str, value: Any) -> None:
+        """Call a backend write, counting rather than raising a failure."""
+        try:
+            method(key, value)
+        except CacheError:
+            self.errors += 1
+
+
+def _identity(value: T) -> T:
+    """Return value as is."""
+    return value
+
+
+def create_task_cache(config: Settings = settings) -> TaskCache | None:
+    """Build the cache chosen by config.cache; None when caching is off.
+
+    Raises ValueError for an unknown cache type or a malformed URL.
+    """
+    if config.cache == "none":
+        return None
+    if config.cache == "memory":
+        return TaskCache(MemoryCache(config.cache_size, config.cache_ttl))
+    if config.cache == "redis":
+        return TaskCache(RespCache(config.cache_url, config.cache_ttl))
+    raise ValueError(f"Unknown cache '{config.cache}'")
+
+
+# Cache for the running process
+task_cache = create_task_cache()
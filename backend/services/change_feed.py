@@ -0,0 +1,256 @@
+"""Change Feed - Publishes task mutations to streaming subscribers."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import anyio
+
+from backend.config import Settings, settings
+from backend.models.task_model import Task
+from backend.repositories.sqlite_repo import connect
+from backend.serialization import dumps, task_json
+
+# Events table for SqliteChangeFeed; lives in the same file as the tasks
+_CREATE_EVENTS = """
+CREATE TABLE IF NOT EXISTS task_events (
+    seq INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    data BLOB NOT NULL
+)
+"""
+_SELECT_LATEST_EVENT = "SELECT MAX(seq) FROM task_events"
+_SELECT_RECENT_EVENTS = (
+    "SELECT seq, type, data FROM "
+    "(SELECT seq, type, data FROM task_events ORDER BY seq DESC LIMIT ?) ORDER BY seq"
+)
+_SELECT_EVENTS_AFTER = "SELECT seq, type, data FROM task_events WHERE seq > ? ORDER BY seq"
+_INSERT_EVENT = "INSERT INTO task_events (seq, type, data) VALUES (?, ?, ?)"
+_PRUNE_EVENTS = (
+    "DELETE FROM task_events WHERE seq < "
+    "(SELECT seq FROM task_events ORDER BY seq DESC LIMIT 1 OFFSET ?)"
+)
+
+
+def _now_us() -> int:
+    """Current UTC time in epoch microseconds, which never steps back at DST changes."""
+    return time.time_ns() // 1000
+
+
+def _encode(seq: int, event_type: str, task: Task | None, task_id: str | None) -> bytes:
+    """Encode an event payload, reusing the task's cached JSON."""
+    task_id = task.id if task is not None else task_id
+    data = dumps({"seq": seq, "type": event_type, "task_id": task_id})
+    if task is not None:
+        data = data[:-1] + b',"task":' + task_json(task) + b"}"
+    return data
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One task mutation, with its JSON payload encoded once for all clients."""
+    seq: int
+    type: str
+    data: bytes
+
+
+class Subscription:
+    """A subscriber's bounded queue of pending events.
+
+    When a slow client lets the queue fill up, pending events are dropped
+    and the next read returns None, telling the client to refetch.
+    """
+
+    def __init__(self, feed: "ChangeFeed", max_pending: int) -> None:
+        """Create an empty subscription bound to the running event loop."""
+        self._feed = feed
+        self._max_pending = max_pending
+        self._pending: deque[ChangeEvent] = deque()
+        self._overflowed = False
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+
+    def _push(self, event: ChangeEvent) -> None:
+        """Queue an event; called with the feed lock held, from any thread."""
+        if self._overflowed:
+            return
+        if len(self._pending) >= self._max_pending:
+            self._pending.clear()
+            self._overflowed = True
+        else:
+            self._pending.append(event)
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _reset(self) -> None:
+        """Mark the subscription as needing a refetch."""
+        self._pending.clear()
+        self._overflowed = True
+        self._wakeup.set()
+
+    async def get(self, timeout: float | None = None) -> ChangeEvent | None:
+        """Wait for the next event; None means events were lost, so refetch.
+
+        Raises TimeoutError if nothing arrives within timeout seconds.
+        """
+        while True:
+            with self._feed._lock:
+                if self._overflowed:
+                    self._overflowed = False
+                    return None
+                if self._pending:
+                    return self._pending.popleft()
+                self._wakeup.clear()
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+
+class ChangeFeed:
+    """Fan-out of task change events, with a replay buffer for resuming.
+
+    Sequence numbers are seeded from the clock so that they keep increasing
+    across restarts; a client resuming from an unknown point is reset.
+    """
+
+    def __init__(self, history: int = 1000, max_pending: int = 256) -> None:
+        """Create a feed keeping the last history events for replay."""
+        self._lock = threading.Lock()
+        self._seq = _now_us()
+        self._history: deque[ChangeEvent] = deque(maxlen=history)
+        self._subscribers: set[Subscription] = set()
+        self._max_pending = max_pending
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the latest event."""
+        return self._seq
+
+    def publish(self, event_type: str, task: Task | None = None, task_id: str | None = None) -> None:
+        """Publish a created/updated/deleted/cleared event to every subscriber."""
+        with self._lock:
+            seq = self._seq + 1
+            self._deliver(ChangeEvent(seq, event_type, _encode(seq, event_type, task, task_id)))
+
+    def _deliver(self, event: ChangeEvent) -> None:
+        """Record an event and fan it out; called with the lock held."""
+        self._seq = event.seq
+        self._history.append(event)
+        for subscription in self._subscribers:
+            subscription._push(event)
+
+    def subscribe(self, since: int | None = None) -> Subscription:
+        """Subscribe to new events, first replaying any after seq since."""
+        subscription = Subscription(self, self._max_pending)
+        with self._lock:
+            if since is not None:
+                oldest = self._history[0].seq if self._history else self._seq + 1
+                if since > self._seq or since < oldest - 1:
+                    subscription._reset()
+                else:
+                    for event in self._history:
+                        if event.seq > since:
+                            subscription._push(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscription."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+class SqliteChangeFeed(ChangeFeed):
+    """Change feed shared by worker processes through an events table.
+
+    Each worker appends its events to the table and polls it for everyone
+    else's, so subscribers see one sequence in one order whichever worker
+    serves them. Sequence numbers are assigned inside the write transaction
+    and never lag the clock, so a worker that starts later still picks up
+    every event committed after it started.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        history: int = 1000,
+        max_pending: int = 256,
+        poll_interval: float = 0.25,
+    ) -> None:
+        """Open the events table in the database at path."""
+        super().__init__(history, max_pending)
+        self._path = path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._poll_interval = poll_interval
+        self._retain = history
+        self._published = 0
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(_CREATE_EVENTS)
+            # Reload recent events so clients can resume across restarts
+            for seq, event_type, data in conn.execute(_SELECT_RECENT_EVENTS, (history,)):
+                self._deliver(ChangeEvent(seq, event_type, data))
+        finally:
+            conn.execute("COMMIT")
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect(self._path)
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def publish(self, event_type: str, task: Task | None = None, task_id: str | None = None) -> None:
+        """Append an event to the shared table, then deliver it and any before it."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            latest = conn.execute(_SELECT_LATEST_EVENT).fetchone()[0]
+            seq = max(latest + 1 if latest is not None else 0, _now_us())
+            data = _encode(seq, event_type, task, task_id)
+            conn.execute(_INSERT_EVENT, (seq, event_type, data))
+            self._published += 1
+            if self._published % self._retain == 0:
+                conn.execute(_PRUNE_EVENTS, (self._retain,))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self.poll()
+
+    def poll(self) -> None:
+        """Deliver events committed by any worker since the last poll."""
+        conn = self._conn()
+        with self._lock:
+            rows = conn.execute(_SELECT_EVENTS_AFTER, (self._seq,)).fetchall()
+            for seq, event_type, data in rows:
+                self._deliver(ChangeEvent(seq, event_type, data))
+
+    async def run(self) -> None:
+        """Poll for other workers' events until cancelled."""
+        while True:
+            await anyio.to_thread.run_sync(self.poll)
+            await anyio.sleep(self._poll_interval)
+
+    def close(self) -> None:
+        """Close every connection opened by this feed."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def create_change_feed(config: Settings) -> ChangeFeed:
+    """Build the change feed, shared through SQLite when running several workers."""
+    if config.shared:
+        return SqliteChangeFeed(config.sqlite_path)
+    return ChangeFeed()
+
+
+# Shared feed for all task mutations in this process
+change_feed = create_change_feed(settings)
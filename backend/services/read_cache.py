@@ -0,0 +1,99 @@
+"""Read Coalescing - Single-flight reads cached until the next mutation.
+
+A burst of identical reads (a thundering herd of dashboard refreshes, say)
+costs one computation: the first caller computes, concurrent callers with
+the same key wait for its result, and later callers reuse it until the data
+version moves on.
+"""
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+import anyio
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A computation in progress that identical reads wait on."""
+
+    __slots__ = ("done", "finished", "result", "error")
+
+    def __init__(self) -> None:
+        """Start unfinished."""
+        self.done = anyio.Event()
+        # False once done means the computation was cancelled
+        self.finished = False
+        self.result: Any = None
+        self.error: Exception | None = None
+
+
+class ReadCoalescer:
+    """Single-flight, version-keyed result cache for one event loop.
+
+    Results are shared between callers and must be treated as read-only.
+    The cache holds up to size results, evicting the least recently used,
+    and is dropped whenever a newer data version is seen.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create an empty cache holding up to size results."""
+        self._size = size
+        self._version: int | None = None
+        self._results: OrderedDict[Hashable, Any] = OrderedDict()
+        self._flights: dict[tuple[int, Hashable], _Flight] = {}
+        # Counters for monitoring
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    async def get(self, key: Hashable, version: int, compute: Callable[[], Awaitable[T]]) -> T:
+        """Get the result for key at a data version, computing it at most once.
+
+        version must be read before calling, so a mutation that lands while
+        computing only makes the result stale for one version.
+        """
+        if self._version is None or version > self._version:
+            self._version = version
+            self._results.clear()
+        if version == self._version and key in self._results:
+            self._results.move_to_end(key)
+            self.hits += 1
+            result: T = self._results[key]
+            return result
+
+        flight = self._flights.get((version, key))
+        if flight is not None:
+            self.coalesced += 1
+        while flight is not None:
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if flight.finished:
+                shared: T = flight.result
+                return shared
+            # The computing caller was cancelled: take over, or join a new flight
+            flight = self._flights.get((version, key))
+
+        self.misses += 1
+        flight = self._flights[(version, key)] = _Flight()
+        try:
+            # Shielded, so a caller that goes away doesn't abort the waiters'
+            # computation; a cancel the shield can't stop makes them retry
+            with anyio.CancelScope(shield=True):
+                flight.result = await compute()
+            flight.finished = True
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            del self._flights[(version, key)]
+            flight.done.set()
+
+        if version == self._version:
+            self._results[key] = flight.result
+            if len(self._results) > self._size:
+                self._results.popitem(last=False)
+        computed: T = flight.result
+        return computed
@@ -1,17 +1,42 @@
 """Task Service - Business logic layer for tasks."""
 
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from datetime import date
+from functools import partial
+from itertools import compress
+from typing import Any, TypeVar
 
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from backend.config import settings
+from backend.metrics import instrument, public_methods, service_latency
 from backend.models.task_model import Task, TaskPriority
+from backend.profiling import trace_calls
+from backend.repositories.base import TaskChanges, TaskUpdate
 from backend.repositories.task_repo import task_repository
+from backend.services.cache import TaskCache, task_cache
+from backend.services.change_feed import Subscription, change_feed
+from backend.services.read_cache import ReadCoalescer
+
+T = TypeVar("T")
+
+# Days covered by an analytics report when no start date is given
+ANALYTICS_DAYS = 30
 
 
 class TaskService:
-    """Service layer for task business logic."""
+    """Service layer for task business logic.
+
+    With a cache configured, single tasks, pages and statistics are read
+    through it, and every write updates it before its change is published.
+    """
 
     def __init__(self) -> None:
-        """Initialize service with repository."""
+        """Initialize service with repository, change feed and cache."""
         self._repo = task_repository
+        self._feed = change_feed
+        self.cache: TaskCache | None = task_cache
 
     def create_task(self, title: str, priority: str = "medium") -> Task:
         """Create a new task with validation."""
@@ -21,15 +46,84 @@ class TaskService:
         except ValueError:
             task_priority = TaskPriority.MEDIUM
 
-        return self._repo.create(title=title.strip(), priority=task_priority)
+        task = self._repo.create(title=title.strip(), priority=task_priority)
+        self._cache_writes([task])
+        self._feed.publish("created", task)
+        return task
+
+    def create_tasks(self, items: list[tuple[str, str]]) -> list[Task]:
+        """Create several (title, priority) tasks in one batch."""
+        prepared = []
+        for title, priority in items:
+            try:
+                task_priority = TaskPriority(priority)
+            except ValueError:
+                task_priority = TaskPriority.MEDIUM
+            prepared.append((title.strip(), task_priority))
+
+        tasks = self._repo.create_many(prepared)
+        self._cache_writes(tasks)
+        for task in tasks:
+            self._feed.publish("created", task)
+        return tasks
+
+    def import_tasks(self, tasks: list[Task]) -> list[bool]:
+        """Add tasks exported from a board, keeping their IDs and timestamps.
+
+        False marks a task whose ID is already in use, which is left as is.
+        One "imported" event announces the batch, rather than one event per
+        task.
+        """
+        added = self._repo.import_many(tasks)
+        imported = list(compress(tasks, added))
+        if imported:
+            self._cache_writes(imported)
+            self._feed.publish("imported")
+        return added
+
+    def export_tasks(self, batch_size: int = 1000) -> Iterator[list[Task]]:
+        """Get every task, oldest first, in batches of up to batch_size."""
+        return self._repo.iter_tasks(batch_size)
 
     def get_all_tasks(self) -> list[Task]:
         """Get all tasks."""
         return self._repo.get_all()
 
+    def get_task_page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        completed: bool | None = None,
+        priority: str | None = None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of tasks, newest first, and the cursor for the next page.
+
+        Raises ValueError for a malformed cursor or an unknown priority.
+        """
+        task_priority = TaskPriority(priority) if priority else None
+
+        def load() -> tuple[list[Task], str | None]:
+            return self._repo.get_page(
+                limit=limit,
+                cursor=cursor,
+                completed=completed,
+                priority=task_priority
+            )
+
+        if self.cache is None:
+            return load()
+        version = self._repo.get_version()
+        return self.cache.get_page(version, (limit, cursor, completed, priority), load)
+
+    def search_tasks(self, query: str, limit: int = 20) -> list[Task]:
+        """Search task titles; the last query word matches as a prefix."""
+        return self._repo.search(query, limit=limit)
+
     def get_task(self, task_id: str) -> Task | None:
         """Get a single task by ID."""
-        return self._repo.get_by_id(task_id)
+        if self.cache is None:
+            return self._repo.get_by_id(task_id)
+        return self.cache.get_task(task_id, self._repo.get_by_id)
 
     def update_task(
         self,
@@ -46,47 +140,318 @@ class TaskService:
             except ValueError:
                 pass
 
-        return self._repo.update(
+        task = self._repo.update(
             task_id=task_id,
             title=title.strip() if title else None,
             completed=completed,
             priority=task_priority
         )
+        if task:
+            self._cache_writes([task])
+            self._feed.publish("updated", task)
+        return task
+
+    def update_tasks(self, updates: list[dict[str, Any]]) -> list[Task | None]:
+        """Apply several updates, given as update_task keyword dicts, in one batch."""
+        prepared = []
+        for update in updates:
+            task_priority = None
+            if update.get("priority"):
+                try:
+                    task_priority = TaskPriority(update["priority"])
+                except ValueError:
+                    pass
+            title = update.get("title")
+            prepared.append(TaskUpdate(
+                task_id=update["task_id"],
+                title=title.strip() if title else None,
+                completed=update.get("completed"),
+                priority=task_priority,
+            ))
+
+        tasks = self._repo.update_many(prepared)
+        self._cache_writes(tasks)
+        for task in tasks:
+            if task:
+                self._feed.publish("updated", task)
+        return tasks
 
     def toggle_task_completion(self, task_id: str) -> Task | None:
-        """Toggle task completion status."""
-        task = self._repo.get_by_id(task_id)
-        if not task:
-            return None
+        """Toggle task completion status atomically."""
+        task = self._repo.toggle(task_id)
+        if task:
+            self._cache_writes([task])
+            self._feed.publish("updated", task)
+        return task
+
+    def delete_task(self, task_id: str) -> int | None:
+        """Delete a task; returns the version the deletion produced, or None
+        if there was no such task."""
+        version = self._repo.delete(task_id)
+        if version is not None:
+            self._cache_deletes([task_id])
+            self._feed.publish("deleted", task_id=task_id)
+        return version
+
+    def delete_tasks(self, task_ids: list[str]) -> list[int | None]:
+        """Delete several tasks in one batch; None marks a missing task."""
+        deleted = self._repo.delete_many(task_ids)
+        gone = [
+            task_id
+            for task_id, version in zip(task_ids, deleted, strict=True)
+            if version is not None
+        ]
+        self._cache_deletes(gone)
+        for task_id in gone:
+            self._feed.publish("deleted", task_id=task_id)
+        return deleted
+
+    def get_version(self) -> int:
+        """Get the data version; it increases with every mutation."""
+        return self._repo.get_version()
 
-        return self._repo.update(task_id=task_id, completed=not task.completed)
+    def subscribe_changes(self, since: int | None = None) -> Subscription:
+        """Subscribe to task change events, replaying those after seq since."""
+        return self._feed.subscribe(since)
 
-    def delete_task(self, task_id: str) -> bool:
-        """Delete a task."""
-        return self._repo.delete(task_id)
+    def unsubscribe_changes(self, subscription: Subscription) -> None:
+        """Stop a change event subscription."""
+        self._feed.unsubscribe(subscription)
+
+    def get_change_seq(self) -> int:
+        """Get the sequence number of the latest change event."""
+        return self._feed.seq
+
+    def get_task_changes(self, since: int) -> TaskChanges:
+        """Get the tasks created, updated or deleted after revision since."""
+        return self._repo.get_changes(since)
 
     def get_task_stats(self) -> dict[str, Any]:
         """Get task statistics."""
-        return self._repo.get_stats()
+        if self.cache is None:
+            return self._repo.get_stats()
+        return self.cache.get_stats(self._repo.get_version(), self._repo.get_stats)
+
+    def get_task_analytics(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        window: int = 7
+    ) -> dict[str, Any]:
+        """Get completion trends; by default for the ANALYTICS_DAYS days up to today.
+
+        Raises ValueError for an invalid date range.
+        """
+        end = end or date.today()
+        # Clamped, so a range near date.min is rejected as a range
+        start = start or date.fromordinal(max(end.toordinal() - ANALYTICS_DAYS + 1, 1))
+        return self._repo.get_analytics(start, end, window)
+
+    def clear_all_tasks(self) -> int:
+        """Clear all tasks; returns the version the clear produced."""
+        version = self._repo.clear_all()
+        if self.cache is not None:
+            self.cache.clear()
+        self._feed.publish("cleared")
+        return version
+
+    def _cache_writes(self, tasks: Iterable[Task | None]) -> None:
+        """Put the state a write left tasks in into the cache, if any."""
+        if self.cache is not None:
+            self.cache.put(tasks)
+
+    def _cache_deletes(self, task_ids: Iterable[str]) -> None:
+        """Record deleted tasks in the cache, if any."""
+        if self.cache is not None:
+            self.cache.forget(task_ids)
+
+
+class AsyncTaskService:
+    """Async facade over TaskService for request handlers.
+
+    When the repository does blocking I/O, each call runs in a worker
+    thread (bounded by a capacity limiter) so the event loop never waits on
+    storage. In-memory calls are cheap and run inline.
+
+    Page, change, stats and analytics reads are coalesced: concurrent identical
+    reads share one computation, whose result is reused until the data
+    version changes. Their results are shared and must not be modified.
+    """
+
+    def __init__(
+        self,
+        service: TaskService,
+        threads: int = settings.blocking_io_threads,
+        read_cache_size: int = settings.read_cache_size,
+    ) -> None:
+        """Wrap a service; threads caps concurrent blocking calls and
+        read_cache_size the coalesced results kept (0 disables coalescing)."""
+        self._service = service
+        self._limiter = CapacityLimiter(threads)
+        self.reads = ReadCoalescer(read_cache_size) if read_cache_size > 0 else None
+
+    @property
+    def offloads(self) -> bool:
+        """Whether calls run in worker threads."""
+        return self._service._repo.blocking
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call a service method, in a worker thread if storage blocks."""
+        if not self.offloads:
+            return func(*args, **kwargs)
+        return await anyio.to_thread.run_sync(
+            partial(func, *args, **kwargs), limiter=self._limiter
+        )
+
+    async def _read(
+        self, key: tuple[Any, ...], version: int | None, func: Callable[..., T], *args: Any
+    ) -> T:
+        """Call a read-only service method through the read coalescer.
+
+        version, if given, must have been read just before the call.
+        """
+        if self.reads is None:
+            return await self._run(func, *args)
+        if version is None:
+            version = await self._run(self._service.get_version)
+        return await self.reads.get(key, version, partial(self._run, func, *args))
+
+    async def create_task(self, title: str, priority: str = "medium") -> Task:
+        """Create a new task with validation."""
+        return await self._run(self._service.create_task, title, priority)
+
+    async def create_tasks(self, items: list[tuple[str, str]]) -> list[Task]:
+        """Create several (title, priority) tasks in one batch."""
+        return await self._run(self._service.create_tasks, items)
+
+    async def import_tasks(self, tasks: list[Task]) -> list[bool]:
+        """Add tasks exported from a board, keeping their IDs and timestamps."""
+        return await self._run(self._service.import_tasks, tasks)
+
+    async def export_tasks(self, batch_size: int = 1000) -> AsyncIterator[list[Task]]:
+        """Get every task, oldest first, in batches of up to batch_size.
+
+        Each batch is read separately, so only one is in memory at a time.
+        """
+        batches = self._service.export_tasks(batch_size)
+        while (batch := await self._run(next, batches, None)) is not None:
+            yield batch
+
+    async def get_task_page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        completed: bool | None = None,
+        priority: str | None = None,
+        version: int | None = None
+    ) -> tuple[list[Task], str | None]:
+        """Get a page of tasks, newest first, and the cursor for the next page.
+
+        Pass the data version if the caller has just read it.
+        """
+        return await self._read(
+            ("page", limit, cursor, completed, priority),
+            version,
+            self._service.get_task_page,
+            limit,
+            cursor,
+            completed,
+            priority
+        )
+
+    async def search_tasks(self, query: str, limit: int = 20) -> list[Task]:
+        """Search task titles; the last query word matches as a prefix."""
+        return await self._run(self._service.search_tasks, query, limit=limit)
+
+    async def get_task(self, task_id: str) -> Task | None:
+        """Get a single task by ID."""
+        return await self._run(self._service.get_task, task_id)
+
+    async def update_task(
+        self,
+        task_id: str,
+        title: str | None = None,
+        completed: bool | None = None,
+        priority: str | None = None
+    ) -> Task | None:
+        """Update a task."""
+        return await self._run(
+            self._service.update_task,
+            task_id,
+            title=title,
+            completed=completed,
+            priority=priority
+        )
+
+    async def update_tasks(self, updates: list[dict[str, Any]]) -> list[Task | None]:
+        """Apply several updates in one batch."""
+        return await self._run(self._service.update_tasks, updates)
+
+    async def toggle_task_completion(self, task_id: str) -> Task | None:
+        """Toggle task completion status atomically."""
+        return await self._run(self._service.toggle_task_completion, task_id)
+
+    async def delete_task(self, task_id: str) -> int | None:
+        """Delete a task; returns the version the deletion produced, if any."""
+        return await self._run(self._service.delete_task, task_id)
+
+    async def delete_tasks(self, task_ids: list[str]) -> list[int | None]:
+        """Delete several tasks in one batch."""
+        return await self._run(self._service.delete_tasks, task_ids)
+
+    async def get_version(self) -> int:
+        """Get the data version; it increases with every mutation."""
+        return await self._run(self._service.get_version)
+
+    async def get_task_changes(self, since: int, version: int | None = None) -> TaskChanges:
+        """Get the tasks changed after revision since; pass the data version if just read."""
+        return await self._read(("changes", since), version, self._service.get_task_changes, since)
+
+    async def get_task_stats(self, version: int | None = None) -> dict[str, Any]:
+        """Get task statistics; pass the data version if just read."""
+        return await self._read(("stats", date.today()), version, self._service.get_task_stats)
+
+    async def get_task_analytics(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        window: int = 7,
+        version: int | None = None
+    ) -> dict[str, Any]:
+        """Get completion trends over a date range; pass the data version if just read."""
+        return await self._read(
+            ("analytics", start, end, window, date.today()),
+            version,
+            self._service.get_task_analytics,
+            start,
+            end,
+            window
+        )
+
+    async def clear_all_tasks(self) -> int:
+        """Clear all tasks; returns the version the clear produced."""
+        return await self._run(self._service.clear_all_tasks)
+
+    # The change feed is in-process and loop-bound, so these never offload
 
-    def get_tasks_with_stats(self) -> dict[str, Any]:
-        """Get all tasks with statistics."""
-        tasks = self._repo.get_all()
-        stats = self._repo.get_stats()
+    def subscribe_changes(self, since: int | None = None) -> Subscription:
+        """Subscribe to task change events, replaying those after seq since."""
+        return self._service.subscribe_changes(since)
 
-        return {
-            "tasks": [task.to_dict() for task in tasks],
-            "total": stats["total"],
-            "completed": stats["completed"],
-            "pending": stats["pending"],
-            "progress_percentage": stats["progress_percentage"],
-        }
+    def unsubscribe_changes(self, subscription: Subscription) -> None:
+        """Stop a change event subscription."""
+        self._service.unsubscribe_changes(subscription)
 
-    def clear_all_tasks(self) -> None:
-        """Clear all tasks."""
-        self._repo.clear_all()
+    def get_change_seq(self) -> int:
+        """Get the sequence number of the latest change event."""
+        return self._service.get_change_seq()
 
 
-# Singleton service instance
+# Singleton service instances
 task_service = TaskService()
+if settings.metrics:
+    instrument(task_service, service_latency, public_methods(TaskService))
+if settings.slow_request_ms is not None:
+    trace_calls(task_service, "service", public_methods(TaskService))
+async_task_service = AsyncTaskService(task_service)
 
@@ -0,0 +1,123 @@
+"""Static Frontend - The built frontend, served from an in-memory file table.
+
+The build directory is walked once, by the first request for a file, so
+startup does not touch it and later requests cost a dictionary lookup
+instead of stat calls. Files with a fresh .br or .gz sibling (see
+backend.compression) are sent in the best encoding the client accepts,
+without compressing anything per request.
+
+Vite names everything under assets/ after a hash of its content, so those
+files are cached for a year without revalidation. Everything else,
+index.html included, must be revalidated, which its ETag makes a 304.
+Other paths get index.html for client-side routing, except under assets/,
+where a missing file is a 404 rather than HTML in place of a script.
+Rebuilding the frontend needs a restart.
+"""
+
+import mimetypes
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from fastapi import Response, status
+from fastapi.responses import FileResponse, PlainTextResponse
+from starlette.datastructures import Headers
+
+from backend.compression import SUFFIXES, choose_encoding
+from backend.routers.responses import etag_matches, not_modified
+
+# Hashed names change with their content, so they never need revalidating
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_REVALIDATE = "no-cache"
+
+
+@dataclass(frozen=True)
+class _Variant:
+    """One encoding of a file on disk."""
+    path: Path
+    stat: os.stat_result
+    etag: str
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    """A servable file: its headers and a variant per available encoding."""
+    media_type: str
+    cache_control: str
+    # "identity" first, then precompressed variants, most preferred first
+    variants: dict[str, _Variant]
+
+
+def _variant(path: Path, stat: os.stat_result) -> _Variant:
+    """Describe one file on disk, tagged by its modification time and size."""
+    return _Variant(path, stat, f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"')
+
+
+def scan(directory: Path) -> dict[str, StaticFile]:
+    """Map every file under directory, by its relative URL path.
+
+    A .br or .gz sibling becomes a variant of its file when it is at least
+    as new; older siblings are left out as stale.
+    """
+    stats = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = Path(root, name)
+            stats[path] = path.stat()
+
+    sibling_suffixes = set(SUFFIXES.values())
+    files = {}
+    for path, stat in stats.items():
+        if path.suffix in sibling_suffixes and path.with_suffix("") in stats:
+            continue
+        variants = {"identity": _variant(path, stat)}
+        for encoding, suffix in SUFFIXES.items():
+            sibling = path.with_name(path.name + suffix)
+            sibling_stat = stats.get(sibling)
+            if sibling_stat is not None and sibling_stat.st_mtime_ns >= stat.st_mtime_ns:
+                variants[encoding] = _variant(sibling, sibling_stat)
+        url_path = path.relative_to(directory).as_posix()
+        files[url_path] = StaticFile(
+            media_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            cache_control=_IMMUTABLE if url_path.startswith("assets/") else _REVALIDATE,
+            variants=variants,
+        )
+    return files
+
+
+class FrontendFiles:
+    """Responses for the files of a frontend build."""
+
+    def __init__(self, directory: Path) -> None:
+        """Serve the build in directory, as it is at the first request."""
+        self.directory = directory
+
+    @cached_property
+    def files(self) -> dict[str, StaticFile]:
+        """The build's files by URL path, scanned on first use."""
+        return scan(self.directory)
+
+    def response(self, path: str, headers: Headers) -> Response:
+        """Answer a GET for a path relative to the site root."""
+        file = self.files.get(path)
+        if file is None:
+            if path.startswith("assets/") or "index.html" not in self.files:
+                return PlainTextResponse("Not Found", status_code=status.HTTP_404_NOT_FOUND)
+            file = self.files["index.html"]
+
+        encoding = choose_encoding(headers.get("accept-encoding"), list(file.variants)[1:])
+        variant = file.variants[encoding]
+        response_headers = {"Cache-Control": file.cache_control}
+        if len(file.variants) > 1:
+            response_headers["Vary"] = "Accept-Encoding"
+        if etag_matches(headers.get("if-none-match"), variant.etag):
+            return not_modified(variant.etag, response_headers)
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        return FileResponse(
+            variant.path,
+            stat_result=variant.stat,
+            media_type=file.media_type,
+            headers={"ETag": variant.etag, **response_headers},
+        )
@@ -0,0 +1,83 @@
+"""Analytics benchmark - array columns with and without NumPy vs. Task objects.
+
+Run with: python -m benchmarks.bench_analytics [count]
+
+Builds count tasks spread over a year, half of them completed, and times a
+90-day report over the repository's columns with NumPy, with the plain
+Python fallback, and as a loop over Task objects like get_stats' recount.
+"""
+
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from backend.models.task_model import PRIORITIES, Task
+from backend.repositories import analytics
+from backend.repositories.analytics import TaskColumns, analyze
+
+_DAY_US = 86_400_000_000
+
+
+def build(count: int) -> tuple[TaskColumns, list[Task]]:
+    """Return columns and Task objects for count random tasks over the last year."""
+    now_us = (date.today() - date(1970, 1, 1)).days * _DAY_US
+    rng = random.Random(0)
+    columns = TaskColumns()
+    tasks = []
+    for i in range(count):
+        created = now_us - rng.randrange(365 * _DAY_US)
+        done = created + rng.randrange(7 * _DAY_US) if i % 2 else None
+        code = rng.randrange(len(PRIORITIES))
+        columns.add(created, done, code)
+        tasks.append(Task.from_raw(str(i), "Task", done is not None, code, created, done))
+    return columns, tasks
+
+
+def object_report(tasks: list[Task], start: date, end: date) -> tuple[Counter[int], list[float]]:
+    """Count per day and take median durations by walking Task objects."""
+    first, last = (start - date(1970, 1, 1)).days, (end - date(1970, 1, 1)).days
+    per_day: Counter[int] = Counter()
+    durations: list[list[int]] = [[] for _ in PRIORITIES]
+    for task in tasks:
+        per_day[task.created_us // _DAY_US] += 1
+        if task.completed_us is not None:
+            day = task.completed_us // _DAY_US
+            per_day[day] += 1
+            if first <= day <= last:
+                durations[task.priority_code].append(task.completed_us - task.created_us)
+    return per_day, [statistics.median(d) for d in durations if d]
+
+
+def timed(func: object, *args: object) -> float:
+    """Return the best of three runs of func(*args), in milliseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)  # type: ignore[operator]
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    """Time each way of building the report and print the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    columns, tasks = build(count)
+    end = date.today()
+    start = end - timedelta(days=89)
+
+    print(f"90-day report over {count:,} tasks")
+    if analytics.np is not None:
+        print(f"  numpy columns   {timed(analyze, columns, start, end, 7):8.1f} ms")
+    numpy, analytics.np = analytics.np, None
+    try:
+        print(f"  python columns  {timed(analyze, columns, start, end, 7):8.1f} ms")
+    finally:
+        analytics.np = numpy
+    print(f"  Task objects    {timed(object_report, tasks, start, end):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
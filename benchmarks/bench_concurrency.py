@@ -0,0 +1,77 @@
+"""Concurrency stress benchmark - read throughput across threads.
+
+Run with: python -m benchmarks.bench_concurrency [tasks] [seconds]
+
+Each thread issues list-page and stats reads against a shared repository
+while one writer thread keeps mutating it. Reads scale with threads only
+where they can run in parallel: on free-threaded CPython, or for SQLite,
+whose queries release the GIL.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from backend.models.task_model import TaskPriority
+from backend.repositories.base import TaskRepositoryProtocol
+from backend.repositories.sqlite_repo import SqliteTaskRepository
+from backend.repositories.task_repo import TaskRepository
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def run(repo: TaskRepositoryProtocol, threads: int, seconds: float) -> float:
+    """Return reads per second achieved by threads readers plus one writer."""
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def reader(slot: int) -> None:
+        while not stop.is_set():
+            repo.get_page(limit=20)
+            repo.get_stats()
+            counts[slot] += 2
+
+    def writer() -> None:
+        while not stop.is_set():
+            task = repo.create("Churn", TaskPriority.HIGH)
+            repo.toggle(task.id)
+            repo.delete(task.id)
+
+    workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    """Measure read scaling for each backend and print the results."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{size:,} tasks, {seconds:g}s per run, GIL {'enabled' if gil else 'disabled'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends: dict[str, TaskRepositoryProtocol] = {
+            "memory": TaskRepository(),
+            "sqlite": SqliteTaskRepository(str(Path(tmp) / "bench.db")),
+        }
+        for name, repo in backends.items():
+            repo.create_many([(f"Task {i}", TaskPriority.MEDIUM) for i in range(size)])
+            baseline = 0.0
+            for threads in THREAD_COUNTS:
+                rate = run(repo, threads, seconds)
+                baseline = baseline or rate
+                print(f"  {name:<7} {threads} readers  {rate:10,.0f} reads/s  x{rate / baseline:.2f}")
+            if isinstance(repo, SqliteTaskRepository):
+                repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Durability benchmark - write throughput per sync level and recovery time.
+
+Run with: python -m benchmarks.bench_durability [recovery_tasks] [seconds]
+
+Writers create and toggle tasks from 1 and 8 threads against the plain
+in-memory repository and against the write-ahead-logged one at each sync
+level. Group commit pays off with concurrent writers, which share fsyncs.
+Recovery is timed at recovery_tasks tasks (default 10^6), once replaying
+the log alone and once from a columnar snapshot, where opening maps the
+file and the first page and first search pay for building the indexes.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from backend.models.task_model import TaskPriority
+from backend.repositories.base import TaskRepositoryProtocol
+from backend.repositories.durable_repo import DurableTaskRepository
+from backend.repositories.task_repo import TaskRepository
+from backend.repositories.wal import SYNC_LEVELS
+
+WRITER_COUNTS = (1, 8)
+
+
+def write_rate(repo: TaskRepositoryProtocol, threads: int, seconds: float) -> float:
+    """Return mutations per second achieved by threads concurrent writers."""
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def writer(slot: int) -> None:
+        while not stop.is_set():
+            task = repo.create("Logged", TaskPriority.HIGH)
+            repo.toggle(task.id)
+            counts[slot] += 2
+
+    workers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / seconds
+
+
+def recovery_time(directory: Path) -> float:
+    """Return seconds taken to recover the repository stored in directory."""
+    start = time.perf_counter()
+    repo = DurableTaskRepository(str(directory), sync="none", snapshot_every=0)
+    elapsed = time.perf_counter() - start
+    repo.close()
+    return elapsed
+
+
+def cold_start(directory: Path) -> tuple[float, float, float]:
+    """Return seconds to open a snapshotted store, fetch a page, then search it."""
+    start = time.perf_counter()
+    repo = DurableTaskRepository(str(directory), sync="none", snapshot_every=0)
+    opened = time.perf_counter()
+    repo.get_page(limit=50)
+    paged = time.perf_counter()
+    repo.search("task")
+    searched = time.perf_counter()
+    repo.close()
+    return opened - start, paged - opened, searched - paged
+
+
+def main() -> None:
+    """Measure write throughput and recovery time and print the results."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+
+    print(f"Write throughput, {seconds:g}s per run")
+    with tempfile.TemporaryDirectory() as tmp:
+        for threads in WRITER_COUNTS:
+            rate = write_rate(TaskRepository(), threads, seconds)
+            print(f"  {'memory':<9} {threads} writers  {rate:10,.0f} writes/s")
+            for sync in SYNC_LEVELS:
+                repo = DurableTaskRepository(
+                    str(Path(tmp) / f"{sync}-{threads}"), sync=sync, snapshot_every=0
+                )
+                rate = write_rate(repo, threads, seconds)
+                repo.close()
+                print(f"  {sync:<9} {threads} writers  {rate:10,.0f} writes/s")
+
+    print(f"Recovery of {size:,} tasks")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "data"
+        repo = DurableTaskRepository(str(directory), sync="none", snapshot_every=0)
+        batch = [(f"Task {i}", TaskPriority.MEDIUM) for i in range(10_000)]
+        for _ in range(size // len(batch)):
+            repo.create_many(batch)
+        repo.close()
+        log_bytes = sum(p.stat().st_size for p in directory.iterdir())
+        print(f"  log only       {recovery_time(directory):6.2f}s  ({log_bytes / 1e6:,.0f} MB)")
+
+        repo = DurableTaskRepository(str(directory), sync="none", snapshot_every=0)
+        repo.snapshot()
+        repo.close()
+        snapshot_bytes = sum(p.stat().st_size for p in directory.iterdir())
+        print(f"  snapshot       {recovery_time(directory):6.2f}s  ({snapshot_bytes / 1e6:,.0f} MB)")
+        opened, paged, searched = cold_start(directory)
+        print(f"    open {opened * 1e3:.1f}ms, first page +{paged:.2f}s, first search +{searched:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Load benchmark - requests per second and latency for each task API endpoint.
+
+Run with: python -m benchmarks.bench_load [--tasks 10000] [--requests 2000]
+    [--concurrency 16] [--json PATH]
+
+Drives the application in process through ASGI, with no sockets or HTTP
+parsing, so results measure routing, validation, the service and the
+repository, and response encoding. concurrency clients issue requests back
+to back against a board seeded with tasks tasks, and each endpoint's
+throughput and p50/p99 latency are reported. The event stream (which never
+ends) and clearing the board (which would empty it) are left out. Results
+can be written as JSON for benchmarks.compare.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from backend.main import app
+from backend.models.task_model import PRIORITIES
+from backend.serialization import dumps
+from backend.services.task_service import task_service
+from benchmarks.harness import percentile, write_results
+
+# Method, path with query string, and body
+Request = tuple[str, str, bytes]
+
+
+@dataclass
+class Endpoint:
+    """A route to load, with its requests built from a request number.
+
+    Endpoints that delete tasks are given consumes new tasks per request,
+    whose IDs their request builders receive.
+    """
+
+    name: str
+    request: Callable[[int, list[str]], Request]
+    consumes: int = 0
+
+
+async def call(method: str, path: str, body: bytes = b"") -> int:
+    """Send one request to the app and return the response status."""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def seed(count: int) -> list[str]:
+    """Create count tasks, a third of them completed, and return their IDs."""
+    tasks = task_service.create_tasks(
+        [(f"Task {i}", PRIORITIES[i % len(PRIORITIES)].value) for i in range(count)]
+    )
+    task_service.update_tasks([{"task_id": task.id, "completed": True} for task in tasks[::3]])
+    return [task.id for task in tasks]
+
+
+def endpoints(ids: list[str]) -> list[Endpoint]:
+    """The task_router endpoints, reading and updating the seeded tasks ids."""
+    def any_id(i: int) -> str:
+        return ids[i * 7919 % len(ids)]
+
+    def get(path: str) -> Callable[[int, list[str]], Request]:
+        return lambda i, fresh: ("GET", path, b"")
+
+    return [
+        Endpoint("GET /api/tasks", get("/api/tasks")),
+        Endpoint("GET /api/tasks?limit=50", get("/api/tasks?limit=50")),
+        Endpoint(
+            "GET /api/tasks?completed=false&limit=50",
+            get("/api/tasks?completed=false&limit=50"),
+        ),
+        Endpoint("GET /api/tasks/{id}", lambda i, fresh: ("GET", f"/api/tasks/{any_id(i)}", b"")),
+        Endpoint("GET /api/tasks/stats", get("/api/tasks/stats")),
+        Endpoint("GET /api/tasks/analytics", get("/api/tasks/analytics")),
+        Endpoint(
+            "GET /api/tasks/changes",
+            get(f"/api/tasks/changes?since={task_service.get_version() - 100}"),
+        ),
+        Endpoint(
+            "GET /api/tasks/search",
+            lambda i, fresh: ("GET", f"/api/tasks/search?q=task+{i % 100}", b""),
+        ),
+        Endpoint(
+            "POST /api/tasks",
+            lambda i, fresh: ("POST", "/api/tasks", dumps({"title": f"New {i}"})),
+        ),
+        Endpoint(
+            "PATCH /api/tasks/{id}",
+            lambda i, fresh: (
+                "PATCH", f"/api/tasks/{any_id(i)}", dumps({"title": f"Renamed {i}"})
+            ),
+        ),
+        Endpoint(
+            "PATCH /api/tasks/{id}/toggle",
+            lambda i, fresh: ("PATCH", f"/api/tasks/{any_id(i)}/toggle", b""),
+        ),
+        Endpoint(
+            "POST /api/tasks/bulk",
+            lambda i, fresh: (
+                "POST", "/api/tasks/bulk", dumps({"tasks": [{"title": f"Bulk {i}"}] * 10})
+            ),
+        ),
+        Endpoint(
+            "PATCH /api/tasks/bulk",
+            lambda i, fresh: ("PATCH", "/api/tasks/bulk", dumps({"tasks": [
+                {"id": any_id(i * 10 + j), "priority": PRIORITIES[j % 3].value} for j in range(10)
+            ]})),
+        ),
+        Endpoint(
+            "DELETE /api/tasks/{id}",
+            lambda i, fresh: ("DELETE", f"/api/tasks/{fresh[i]}", b""),
+            consumes=1,
+        ),
+        Endpoint(
+            "DELETE /api/tasks/bulk",
+            lambda i, fresh: (
+                "DELETE", "/api/tasks/bulk", dumps({"ids": fresh[i * 10:i * 10 + 10]})
+            ),
+            consumes=10,
+        ),
+    ]
+
+
+async def run(endpoint: Endpoint, requests: int, concurrency: int) -> dict[str, float]:
+    """Send requests requests from concurrency clients and summarize them."""
+    fresh = seed(requests * endpoint.consumes) if endpoint.consumes else []
+    planned = [endpoint.request(i, fresh) for i in range(requests)]
+
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(planned)
+
+    async def client() -> None:
+        nonlocal errors
+        for method, path, body in queue:
+            start = time.perf_counter()
+            status = await call(method, path, body)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "median": percentile(latencies, 0.5),
+        "p50": percentile(latencies, 0.5),
+        "p99": percentile(latencies, 0.99),
+        "max": latencies[-1],
+    }
+
+
+async def load(tasks: int, requests: int, concurrency: int) -> list[dict[str, Any]]:
+    """Seed the board and run every endpoint in turn."""
+    task_service.clear_all_tasks()
+    results = []
+    for endpoint in endpoints(seed(tasks)):
+        # Warm up, then measure
+        await run(endpoint, min(requests, 200), concurrency)
+        stats = await run(endpoint, requests, concurrency)
+        results.append({
+            "name": endpoint.name,
+            "group": "load",
+            "params": {"tasks": tasks, "concurrency": concurrency},
+            "stats": stats,
+        })
+        print(
+            f"{endpoint.name:<42} {stats['rps']:>9,.0f} req/s"
+            f"  p50 {stats['p50'] * 1e3:7.2f}ms  p99 {stats['p99'] * 1e3:7.2f}ms"
+            + (f"  {stats['errors']} errors" if stats["errors"] else "")
+        )
+    return results
+
+
+def main() -> None:
+    """Load each endpoint and print throughput and latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000, help="Tasks on the board")
+    parser.add_argument("--requests", type=int, default=2_000, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    print(f"{args.concurrency} clients, {args.requests:,} requests per endpoint, {args.tasks:,} tasks")
+    results = asyncio.run(load(args.tasks, args.requests, args.concurrency))
+    if args.json:
+        write_results(args.json, "load", results)
+
+
+if __name__ == "__main__":
+    main()
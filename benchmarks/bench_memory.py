@@ -0,0 +1,64 @@
+"""Memory benchmark - compact Task model vs. the original dataclass.
+
+Run with: python -m benchmarks.bench_memory [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from backend.models.task_model import Task, TaskPriority
+
+
+@dataclass
+class LegacyTask:
+    """The original task model: a plain dataclass with UUIDs and datetimes."""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    title: str = ""
+    completed: bool = False
+    priority: TaskPriority = TaskPriority.MEDIUM
+    created_at: datetime = field(default_factory=datetime.now)
+    completed_at: datetime | None = None
+
+
+def measure(factory: Callable[[int], Any], count: int) -> int:
+    """Return the bytes allocated while building count tasks with factory."""
+    gc.collect()
+    tracemalloc.start()
+    tasks = [factory(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return current
+
+
+def main() -> None:
+    """Compare per-task memory for both models and print the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    now = datetime.now()
+    factories: dict[str, Callable[[int], Any]] = {
+        "legacy dataclass": lambda i: LegacyTask(
+            title=f"Task {i}", completed=i % 2 == 0, completed_at=now if i % 2 == 0 else None
+        ),
+        "compact Task": lambda i: Task(
+            title=f"Task {i}", completed=i % 2 == 0, completed_at=now if i % 2 == 0 else None
+        ),
+    }
+
+    results = {name: measure(factory, count) for name, factory in factories.items()}
+    baseline = results["legacy dataclass"]
+    print(f"{count:,} tasks")
+    for name, total in results.items():
+        print(
+            f"  {name:<18} {total / 2**20:8.1f} MiB  {total / count:6.0f} B/task"
+            f"  ({total / baseline:.0%} of legacy)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Micro-benchmarks - repository reads and writes and response encoding by board size.
+
+Run with: python -m benchmarks.bench_micro [--sizes 1000,10000,100000,1000000] [--json PATH]
+
+At each board size, times the in-memory repository's get_all, get_stats and
+create, Task.to_dict over every task, and encoding the whole board as a
+task list response: with the cached JSON fragments the API sends, and
+through the Pydantic response schemas. Results can be written as JSON for
+benchmarks.compare.
+"""
+
+import argparse
+from collections.abc import Callable
+from typing import Any
+
+from backend.models.task_model import PRIORITIES, Task
+from backend.repositories.task_repo import TaskRepository
+from backend.schemas.task_schema import TaskListResponseSchema
+from backend.serialization import render_task_list
+from benchmarks.harness import MAX_SECONDS, measure, write_results
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def build(size: int) -> TaskRepository:
+    """Return a repository holding size tasks, a third of them completed."""
+    repo = TaskRepository()
+    for start in range(0, size, 10_000):
+        batch = [
+            (f"Task {i}", PRIORITIES[i % len(PRIORITIES)])
+            for i in range(start, min(size, start + 10_000))
+        ]
+        for task in repo.create_many(batch)[::3]:
+            repo.toggle(task.id)
+    return repo
+
+
+def schema_list(tasks: list[Task], stats: dict[str, Any]) -> bytes:
+    """Encode a task list through the Pydantic response schemas."""
+    return TaskListResponseSchema.model_validate({
+        "tasks": tasks,
+        "total": stats["total"],
+        "completed": stats["completed"],
+        "pending": stats["pending"],
+        "progress_percentage": stats["progress_percentage"],
+    }, from_attributes=True).model_dump_json().encode()
+
+
+def cases(repo: TaskRepository) -> dict[str, tuple[Callable[[], Any], Callable[[], Any] | None]]:
+    """Benchmarks over repo, by name, as (function, per-round setup)."""
+    tasks = repo.get_all()
+    stats = repo.get_stats()
+    created: list[str] = []
+
+    def create() -> None:
+        created.append(repo.create("Benchmark task").id)
+
+    def forget_created() -> None:
+        # Keep the board at its size however many rounds run
+        repo.delete_many(created)
+        created.clear()
+
+    return {
+        "repository.get_all": (repo.get_all, None),
+        "repository.get_stats": (repo.get_stats, None),
+        "repository.create": (create, forget_created),
+        "task.to_dict": (lambda: [task.to_dict() for task in tasks], None),
+        "serialization.render_task_list": (lambda: render_task_list(tasks, stats, None), None),
+        "schema.task_list": (lambda: schema_list(tasks, stats), None),
+    }
+
+
+def main() -> None:
+    """Run every micro-benchmark at each size and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Board sizes, comma-separated")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS, help="Time budget per benchmark")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'benchmark':<32} {'tasks':>9} {'median':>12} {'p99':>12} {'ops/s':>12}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        repo = build(size)
+        for name, (func, setup) in cases(repo).items():
+            stats = measure(func, args.max_seconds, setup=setup)
+            results.append({"name": name, "group": name, "params": {"tasks": size}, "stats": stats})
+            print(
+                f"{name:<32} {size:>9,} {stats['median'] * 1e6:>10,.1f}us"
+                f" {stats['p99'] * 1e6:>10,.1f}us {stats['ops']:>12,.0f}"
+            )
+    if args.json:
+        write_results(args.json, "micro", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Startup benchmark - time to first request of a fresh process.
+
+Run with: python -m benchmarks.bench_startup [--runs 5] [--profile] [--json PATH]
+
+Each run starts a new interpreter that imports backend.main, then sends
+its first API request and its first OpenAPI schema request through ASGI,
+the way a server scaled to zero pays for them on the first request after
+a cold start. The phases are timed inside the process; the whole process,
+interpreter startup and exit included, is timed from outside. --profile
+adds an import-time profile of the app: the modules that cost most to
+import, by total time, and the time spent under each top-level package.
+Results can be written as JSON for benchmarks.compare.
+
+tests/test_startup.py holds startup to BUDGET_SECONDS when run with
+TASK_BOARD_CHECK_STARTUP=1; being wall-clock, the check is off by default.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any
+
+from benchmarks.harness import write_results
+
+# Most seconds from interpreter start to the first response, checked by
+# tests/test_startup.py when TASK_BOARD_CHECK_STARTUP is set
+BUDGET_SECONDS = 1.5
+
+# Runs in the fresh process; prints the timings as JSON
+_CHILD = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+from backend.main import app
+imported = time.perf_counter()
+
+
+async def get(path):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    if status != 200:
+        raise RuntimeError(f"GET {path} returned {status}")
+
+
+asyncio.run(get("/api/tasks"))
+served = time.perf_counter()
+modules = sorted({name.partition(".")[0] for name in sys.modules})
+asyncio.run(get("/openapi.json"))
+documented = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "first_request": served - imported,
+    "openapi": documented - served,
+    "modules": modules,
+}))
+"""
+
+
+def cold_start() -> dict[str, Any]:
+    """Time one fresh process; returns its phases in seconds and loaded packages.
+
+    "ready" is the time from launching the interpreter to the first
+    response, an upper bound that includes the parent's spawn overhead.
+    """
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD], capture_output=True, check=True, text=True
+    ).stdout
+    phases = json.loads(output)
+    process = time.perf_counter() - started
+    phases["process"] = process
+    phases["ready"] = process - phases["openapi"]
+    return phases
+
+
+def import_profile() -> list[tuple[str, int, int]]:
+    """Import backend.main under -X importtime.
+
+    Returns (module, self, cumulative) times in microseconds, in import
+    order.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.main"],
+        capture_output=True, check=True, text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, total, name = line.removeprefix("import time:").split("|")
+        rows.append((name.strip(), int(own), int(total)))
+    return rows
+
+
+def print_profile(rows: list[tuple[str, int, int]], top: int = 15) -> None:
+    """Print the most expensive imports and the time under each package."""
+    print(f"\n{'module':<48} {'self ms':>8} {'total ms':>9}")
+    for name, own, total in sorted(rows, key=lambda row: row[2], reverse=True)[:top]:
+        print(f"{name:<48} {own / 1e3:8.1f} {total / 1e3:9.1f}")
+    packages: dict[str, int] = defaultdict(int)
+    for name, own, _ in rows:
+        packages[name.partition(".")[0]] += own
+    print(f"\n{'package':<48} {'self ms':>8}")
+    for package, own in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{package:<48} {own / 1e3:8.1f}")
+
+
+def run(runs: int) -> list[dict[str, Any]]:
+    """Time runs cold starts and print the median of each phase."""
+    samples = [cold_start() for _ in range(runs)]
+    results = []
+    print(f"{'phase':<16} {'median ms':>10} {'max ms':>8}")
+    for phase in ("import", "first_request", "openapi", "ready", "process"):
+        values = sorted(sample[phase] for sample in samples)
+        median = statistics.median(values)
+        print(f"{phase:<16} {median * 1e3:10.1f} {values[-1] * 1e3:8.1f}")
+        results.append({
+            "name": phase,
+            "group": "startup",
+            "params": {"runs": runs},
+            "stats": {"median": median, "max": values[-1], "rounds": runs},
+        })
+    ready = statistics.median(sample["ready"] for sample in samples)
+    print(f"budget {BUDGET_SECONDS * 1e3:.0f} ms: {'ok' if ready <= BUDGET_SECONDS else 'OVER'}")
+    return results
+
+
+def main() -> None:
+    """Parse arguments, time the cold starts and optionally save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes to time")
+    parser.add_argument("--profile", action="store_true", help="print an import-time profile")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if args.profile:
+        print_profile(import_profile())
+    if args.json:
+        write_results(args.json, "startup", results)
+
+
+if __name__ == "__main__":
+    main()
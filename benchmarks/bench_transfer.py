@@ -0,0 +1,182 @@
+"""Transfer benchmark - streaming NDJSON export and import of a whole board.
+
+Run with: python -m benchmarks.bench_transfer [--tasks 1000000] [--json PATH]
+
+Drives /api/tasks/export and /api/tasks/import in process through ASGI,
+like bench_load, streaming bodies to and from temporary files in 64 KiB
+chunks. The board is seeded with tasks tasks, exported plain and gzipped,
+then cleared and imported from each file. Throughput is reported in tasks
+and megabytes per second. One more export and import are traced with
+tracemalloc for their transient heap: the peak above what the call kept
+(the imported tasks themselves), which stays flat however many tasks
+there are. Results can be written as JSON for benchmarks.compare.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, BinaryIO
+
+from backend.main import app
+from backend.models.task_model import PRIORITIES
+from backend.services.task_service import task_service
+from benchmarks.harness import write_results
+
+CHUNK = 64 * 1024
+
+
+async def transfer(
+    method: str, path: str, headers: dict[str, str], body: BinaryIO | None, sink: BinaryIO | None
+) -> int:
+    """Send one request to the app, streaming body in and the response to sink.
+
+    Returns the response status.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")] + [
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = 0
+    sent = False
+    finished = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        nonlocal sent
+        if sent:
+            # Streaming responses listen for a disconnect until they finish
+            await finished.wait()
+            return {"type": "http.disconnect"}
+        chunk = body.read(CHUNK) if body is not None else b""
+        sent = len(chunk) < CHUNK
+        return {"type": "http.request", "body": chunk, "more_body": not sent}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            if sink is not None:
+                sink.write(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return status
+
+
+def export(path: Path, compress: bool) -> None:
+    """Export the board into a file."""
+    encoding = "gzip" if compress else "identity"
+    with open(path, "wb") as sink:
+        status = asyncio.run(
+            transfer("GET", "/api/tasks/export", {"Accept-Encoding": encoding}, None, sink)
+        )
+    if status != 200:
+        raise RuntimeError(f"export failed with status {status}")
+
+
+def import_(path: Path, compress: bool) -> None:
+    """Import a file into the board."""
+    headers = {"Content-Type": "application/x-ndjson"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    with open(path, "rb") as body:
+        status = asyncio.run(transfer("POST", "/api/tasks/import", headers, body, None))
+    if status != 200:
+        raise RuntimeError(f"import failed with status {status}")
+
+
+def seed(count: int) -> None:
+    """Fill the board with count tasks, a third of them completed."""
+    task_service.clear_all_tasks()
+    for start in range(0, count, 10_000):
+        tasks = task_service.create_tasks([
+            (f"Task {i} for the transfer benchmark", PRIORITIES[i % 3].value)
+            for i in range(start, min(start + 10_000, count))
+        ])
+        task_service.update_tasks([{"task_id": t.id, "completed": True} for t in tasks[::3]])
+
+
+def timed(func: Any, *args: Any) -> float:
+    """Return seconds taken by one call."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def transient_heap(func: Any, *args: Any) -> int:
+    """Return the peak bytes one call allocated beyond what it kept allocated."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        kept, peak = tracemalloc.get_traced_memory()
+        return peak - kept
+    finally:
+        tracemalloc.stop()
+
+
+def run(tasks: int, directory: Path) -> list[dict[str, Any]]:
+    """Seed the board, time each transfer and print a line per result."""
+    seed(tasks)
+    expected = task_service.get_task_stats()
+    results = []
+    print(f"{'transfer':<16} {'seconds':>8} {'tasks/s':>12} {'MB':>8} {'MB/s':>8}")
+    for compress in (False, True):
+        path = directory / ("tasks.ndjson.gz" if compress else "tasks.ndjson")
+        label = "gzip" if compress else "plain"
+        for name, func in (("export", export), ("import", import_)):
+            if func is import_:
+                task_service.clear_all_tasks()
+            seconds = timed(func, path, compress)
+            size = path.stat().st_size / 1e6
+            print(
+                f"{name + ' ' + label:<16} {seconds:8.2f} {tasks / seconds:12,.0f} "
+                f"{size:8.1f} {size / seconds:8.1f}"
+            )
+            results.append({
+                "name": f"{name}_{label}",
+                "group": "transfer",
+                "params": {"tasks": tasks},
+                "stats": {"median": seconds, "ops": tasks / seconds, "mb": size},
+            })
+        if task_service.get_task_stats()["total"] != expected["total"]:
+            raise RuntimeError("import did not restore the board")
+
+    path = directory / "tasks.ndjson.gz"
+    exported = transient_heap(export, path, True)
+    task_service.clear_all_tasks()
+    imported = transient_heap(import_, path, True)
+    print(f"transient heap: export {exported / 1e6:.1f} MB, import {imported / 1e6:.1f} MB")
+    return results
+
+
+def main() -> None:
+    """Parse arguments, run the transfers and optionally save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        results = run(args.tasks, Path(tmp))
+    if args.json:
+        write_results(args.json, "transfer", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare two benchmark result files and flag regressions.
+
+Run with: python -m benchmarks.compare BASELINE CURRENT [--stat median] [--threshold 10]
+
+Matches benchmarks by name and parameters across two files written with
+--json by bench_micro or bench_load, and prints the change in a timing
+statistic (median by default; p99 also works for both). Exits with status 1
+if any benchmark got slower by more than threshold percent, so a release
+check can run it against the previous release's results.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _key(benchmark: dict[str, Any]) -> tuple[str, str]:
+    """Identify a benchmark by its name and parameters."""
+    return benchmark["name"], json.dumps(benchmark.get("params", {}), sort_keys=True)
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], stat: str = "median"
+) -> list[tuple[str, str, float, float, float]]:
+    """Pair up the benchmarks in two result documents.
+
+    Returns (name, params, baseline, current, percent change) for each
+    benchmark present in both, in the current document's order.
+    """
+    before = {_key(b): b["stats"][stat] for b in baseline["benchmarks"]}
+    rows = []
+    for benchmark in current["benchmarks"]:
+        name, params = _key(benchmark)
+        if (name, params) not in before:
+            continue
+        old, new = before[name, params], benchmark["stats"][stat]
+        change = (new / old - 1) * 100 if old else 0.0
+        rows.append((name, params, old, new, change))
+    return rows
+
+
+def main() -> None:
+    """Print the changes between two result files; exit 1 on a regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="Results to compare against")
+    parser.add_argument("current", help="Results to check")
+    parser.add_argument("--stat", default="median", help="Timing statistic to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Percent slowdown counted as a regression"
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    regressions = 0
+    for name, params, old, new, change in compare(baseline, current, args.stat):
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{name:<42} {params:<36} {old * 1e6:>12,.1f}us -> {new * 1e6:>12,.1f}us"
+            f" {change:>+7.1f}%{flag}"
+        )
+    if regressions:
+        print(f"{regressions} regression(s) over {args.threshold:g}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark harness - timing statistics and machine-readable results.
+
+Timings follow pytest-benchmark: each round calls the function enough
+times to take at least a millisecond, and the per-call statistics of the
+rounds are reported. Results are written as JSON with the commit and
+machine they were measured on, and benchmarks.compare diffs two such files.
+"""
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Shortest round worth timing, and the time budget for one benchmark
+MIN_ROUND_SECONDS = 0.001
+MAX_SECONDS = 1.0
+MIN_ROUNDS = 5
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Get a percentile of ascending values by the nearest-rank method."""
+    if not ordered:
+        raise ValueError("no values")
+    rank = math.ceil(fraction * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Statistics over per-call timings, in seconds."""
+    ordered = sorted(samples)
+    return {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "stddev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "p99": percentile(ordered, 0.99),
+        "rounds": len(ordered),
+    }
+
+
+def measure(
+    func: Callable[[], Any],
+    max_seconds: float = MAX_SECONDS,
+    min_rounds: int = MIN_ROUNDS,
+    setup: Callable[[], Any] | None = None,
+) -> dict[str, float]:
+    """Time func, calibrating the calls per round, and summarize per call.
+
+    Rounds continue until max_seconds is spent, with at least min_rounds
+    of them. setup, if given, runs untimed before each round.
+    """
+    iterations = 1
+    while True:
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_ROUND_SECONDS:
+            break
+        iterations *= 10 if elapsed < MIN_ROUND_SECONDS / 10 else 2
+
+    samples = []
+    deadline = time.perf_counter() + max_seconds
+    while len(samples) < min_rounds or time.perf_counter() < deadline:
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter() - start) / iterations)
+    stats = summarize(samples)
+    stats["iterations"] = iterations
+    stats["ops"] = 1 / stats["mean"] if stats["mean"] else 0.0
+    return stats
+
+
+def _commit() -> dict[str, Any]:
+    """The checked-out commit and whether the tree has local changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return {"id": None, "dirty": None}
+    return {"id": commit, "dirty": bool(dirty)}
+
+
+def write_results(path: str, suite: str, benchmarks: list[dict[str, Any]]) -> None:
+    """Write benchmark entries, each with name, group, params and stats, as JSON."""
+    document = {
+        "suite": suite,
+        "datetime": datetime.now(UTC).isoformat(),
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "commit_info": _commit(),
+        "benchmarks": benchmarks,
+    }
+    Path(path).write_text(json.dumps(document, indent=2) + "\n")
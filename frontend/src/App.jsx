@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import confetti from 'canvas-confetti'
 import { motion, AnimatePresence } from 'framer-motion'
 
@@ -12,6 +12,30 @@ const PRIORITIES = {
   low: { label: 'Low', class: 'priority-low', emoji: '🌱' },
 }
 
+// Board statistics from a list or changes response
+const statsOf = (data) => ({
+  total: data.total,
+  completed: data.completed,
+  pending: data.pending,
+  progress_percentage: data.progress_percentage
+})
+
+// Apply a /tasks/changes response to the local task list in the server's
+// order: changed tasks stay where they are and tasks new to the list go
+// first, as listed (newest first)
+const applyChanges = (tasks, changes) => {
+  if (changes.reset) return changes.tasks
+  if (changes.tasks.length === 0 && changes.deleted.length === 0) return tasks
+  const changed = new Map(changes.tasks.map((task) => [task.id, task]))
+  const deleted = new Set(changes.deleted)
+  const listed = new Set(tasks.map((task) => task.id))
+  const added = changes.tasks.filter((task) => !listed.has(task.id))
+  const kept = tasks
+    .filter((task) => !deleted.has(task.id))
+    .map((task) => changed.get(task.id) ?? task)
+  return [...added, ...kept]
+}
+
 // Confetti celebration
 const triggerConfetti = () => {
   const defaults = {
@@ -160,32 +184,66 @@ function App() {
   const [newTaskPriority, setNewTaskPriority] = useState('medium')
   const [loading, setLoading] = useState(true)
   const [filter, setFilter] = useState('all') // all, pending, completed
+  // Revision the task list is synced to, for /tasks/changes
+  const revision = useRef(null)
 
-  // Fetch tasks
+  // Fetch tasks (filtered on the server; stats always cover the whole board)
   const fetchTasks = useCallback(async () => {
     try {
-      const response = await fetch(`${API_BASE}/tasks`)
+      const query = filter === 'all' ? '' : `?completed=${filter === 'completed'}`
+      const response = await fetch(`${API_BASE}/tasks${query}`)
       if (response.ok) {
         const data = await response.json()
+        const listed = response.headers.get('X-Revision')
+        revision.current = listed === null ? null : Number(listed)
         setTasks(data.tasks)
-        setStats({
-          total: data.total,
-          completed: data.completed,
-          pending: data.pending,
-          progress_percentage: data.progress_percentage
-        })
+        setStats(statsOf(data))
       }
     } catch (error) {
       console.error('Error fetching tasks:', error)
     } finally {
       setLoading(false)
     }
-  }, [])
+  }, [filter])
+
+  // Fetch only the tasks changed since the last sync, not the whole list
+  const syncTasks = useCallback(async () => {
+    if (revision.current === null) return fetchTasks()
+    try {
+      const response = await fetch(`${API_BASE}/tasks/changes?since=${revision.current}`)
+      if (response.ok) {
+        const data = await response.json()
+        // A slow response must not undo a newer one
+        if (!data.reset && data.revision < revision.current) return
+        revision.current = data.revision
+        setTasks((current) => applyChanges(current, data))
+        setStats(statsOf(data))
+      }
+    } catch (error) {
+      console.error('Error syncing tasks:', error)
+    }
+  }, [fetchTasks])
 
   useEffect(() => {
     fetchTasks()
   }, [fetchTasks])
 
+  // The event stream outlives filter changes, so it calls the latest syncTasks
+  const latestSync = useRef(syncTasks)
+  useEffect(() => {
+    latestSync.current = syncTasks
+  }, [syncTasks])
+
+  // Stay in sync with changes made by other clients
+  useEffect(() => {
+    const events = new EventSource(`${API_BASE}/tasks/events`)
+    const refresh = () => latestSync.current()
+    for (const type of ['created', 'updated', 'deleted', 'cleared', 'imported', 'reset']) {
+      events.addEventListener(type, refresh)
+    }
+    return () => events.close()
+  }, [])
+
   // Add task
   const handleAddTask = async (e) => {
     e.preventDefault()
@@ -200,7 +258,7 @@ function App() {
       
       if (response.ok) {
         setNewTaskTitle('')
-        fetchTasks()
+        syncTasks()
       }
     } catch (error) {
       console.error('Error adding task:', error)
@@ -218,8 +276,7 @@ function App() {
         const updatedTask = await response.json()
         
         // Check if all tasks are now completed for confetti
-        const currentTasks = tasks.map(t => t.id === taskId ? updatedTask : t)
-        const allCompleted = currentTasks.length > 0 && currentTasks.every(t => t.completed)
+        const allCompleted = updatedTask.completed && stats.pending === 1
         
         if (allCompleted) {
           triggerConfetti()
@@ -233,7 +290,7 @@ function App() {
           })
         }
         
-        fetchTasks()
+        syncTasks()
       }
     } catch (error) {
       console.error('Error toggling task:', error)
@@ -248,7 +305,7 @@ function App() {
       })
       
       if (response.ok) {
-        fetchTasks()
+        syncTasks()
       }
     } catch (error) {
       console.error('Error deleting task:', error)
@@ -13,11 +13,13 @@ if [ ! -d "frontend/dist" ]; then
     npm install --silent
     npm run build
     cd ..
+    python -m backend.compression frontend/dist
 else
     echo "✅ Frontend already built"
 fi
 
-# Start the server
-echo "🌐 Starting server on port 8000..."
-python -m uvicorn backend.main:app --host 0.0.0.0 --port 8000
+# Start the server; TASK_BOARD_WORKERS > 1 shares one SQLite store between workers
+WORKERS="${TASK_BOARD_WORKERS:-1}"
+echo "🌐 Starting server on port 8000 with $WORKERS worker(s)..."
+python -m uvicorn backend.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS"
 
@@ -3,11 +3,15 @@
 
 import uvicorn
 
+from backend.config import settings
+
 if __name__ == "__main__":
+    # Reload watches files in a single process; it cannot run several workers
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        workers=settings.workers,
+        reload=settings.workers == 1
     )
 
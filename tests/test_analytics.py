@@ -0,0 +1,96 @@
+"""Tests for Task Analytics."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from backend.models.task_model import PRIORITY_CODES, Task, TaskPriority, to_epoch_us
+from backend.repositories import analytics
+from backend.repositories.analytics import TaskColumns, analyze
+
+_DAY = date(2026, 3, 10)
+_HOUR_US = 3_600_000_000
+
+
+def at(day: date, hour: int = 12) -> int:
+    """Epoch microseconds of an hour on a day."""
+    return to_epoch_us(datetime.combine(day, datetime.min.time()) + timedelta(hours=hour))
+
+
+@pytest.fixture
+def columns() -> TaskColumns:
+    """Columns for tasks created and completed around _DAY."""
+    columns = TaskColumns()
+    high, low = PRIORITY_CODES[TaskPriority.HIGH], PRIORITY_CODES[TaskPriority.LOW]
+    # Completed before the range: counts towards the first days' windows only
+    columns.add(at(_DAY - timedelta(days=3)), at(_DAY - timedelta(days=1)), high)
+    # Created and completed within the range, after 2, 4 and 9 hours
+    columns.add(at(_DAY, 8), at(_DAY, 10), high)
+    columns.add(at(_DAY, 8), at(_DAY, 12), high)
+    columns.add(at(_DAY, 9), at(_DAY + timedelta(days=1), 18), low)
+    # Pending, and a deleted task that must be ignored
+    columns.add(at(_DAY + timedelta(days=1)), None, low)
+    columns.add(at(_DAY), at(_DAY, 13), low)
+    columns.remove(len(columns) - 1)
+    return columns
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with NumPy and with the plain Python fallback."""
+    if request.param == "python":
+        monkeypatch.setattr(analytics, "_numpy", lambda: None)
+    elif analytics._numpy() is None:
+        pytest.skip("NumPy is not installed")
+    return str(request.param)
+
+
+class TestAnalyze:
+    """Test cases for reports over array columns."""
+
+    def test_daily_counts(self, columns: TaskColumns, engine: str) -> None:
+        """Test tasks are counted on the days they were created and completed."""
+        report = analyze(columns, _DAY, _DAY + timedelta(days=2), window=1)
+
+        assert report["start"] == _DAY.isoformat()
+        assert report["end"] == (_DAY + timedelta(days=2)).isoformat()
+        assert [d["created"] for d in report["days"]] == [3, 1, 0]
+        assert [d["completed"] for d in report["days"]] == [2, 1, 0]
+        assert [d["throughput"] for d in report["days"]] == [2.0, 1.0, 0.0]
+
+    def test_rolling_throughput_reaches_before_start(
+        self, columns: TaskColumns, engine: str
+    ) -> None:
+        """Test the first days' windows include completions before the range."""
+        report = analyze(columns, _DAY, _DAY + timedelta(days=2), window=2)
+
+        assert [d["throughput"] for d in report["days"]] == [1.5, 1.5, 0.5]
+
+    def test_median_completion_per_priority(self, columns: TaskColumns, engine: str) -> None:
+        """Test medians cover tasks completed in the range, per priority."""
+        report = analyze(columns, _DAY, _DAY + timedelta(days=2), window=7)
+
+        assert report["median_completion_seconds"] == {
+            "low": 33 * _HOUR_US / 1e6,
+            "medium": None,
+            "high": 3 * _HOUR_US / 1e6,
+        }
+
+    def test_compact_keeps_slots_aligned(self, engine: str) -> None:
+        """Test compaction drops dead slots and keeps the others' fields."""
+        columns = TaskColumns()
+        for hour in range(4):
+            columns.append()
+            columns.put(hour, Task.from_raw("id", "T", False, 0, at(_DAY, hour), None))
+        columns.remove(1)
+        columns.compact([0, 2, 3])
+
+        assert list(columns.created) == [at(_DAY, 0), at(_DAY, 2), at(_DAY, 3)]
+        assert analyze(columns, _DAY, _DAY, window=1)["days"][0]["created"] == 3
+
+    def test_invalid_ranges(self, columns: TaskColumns) -> None:
+        """Test reversed and overlong ranges are rejected."""
+        with pytest.raises(ValueError):
+            analyze(columns, _DAY, _DAY - timedelta(days=1), window=7)
+        with pytest.raises(ValueError):
+            analyze(columns, _DAY, _DAY + timedelta(days=analytics.MAX_RANGE_DAYS), window=7)
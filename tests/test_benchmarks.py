@@ -0,0 +1,98 @@
+"""Tests for the benchmark harness, result comparison and load generator."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks import bench_load, bench_transfer
+from benchmarks.compare import compare
+from benchmarks.harness import measure, percentile, summarize, write_results
+
+
+class TestHarness:
+    """Test cases for timing statistics and result files."""
+
+    def test_percentile_is_nearest_rank(self) -> None:
+        """Test percentiles pick an observed value."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile(values, 1.0) == 100.0
+        assert percentile([3.0], 0.99) == 3.0
+        with pytest.raises(ValueError):
+            percentile([], 0.5)
+
+    def test_summarize(self) -> None:
+        """Test statistics over per-call timings."""
+        stats = summarize([3.0, 1.0, 2.0])
+
+        assert (stats["min"], stats["median"], stats["max"]) == (1.0, 2.0, 3.0)
+        assert stats["mean"] == 2.0
+        assert stats["rounds"] == 3
+
+    def test_measure_runs_setup_before_each_round(self) -> None:
+        """Test measure calibrates rounds and calls setup untimed."""
+        calls = {"func": 0, "setup": 0}
+
+        def func() -> None:
+            calls["func"] += 1
+
+        def setup() -> None:
+            calls["setup"] += 1
+
+        stats = measure(func, max_seconds=0.01, min_rounds=3, setup=setup)
+
+        assert stats["rounds"] >= 3
+        assert stats["iterations"] >= 1
+        assert calls["setup"] >= stats["rounds"]
+        assert calls["func"] >= stats["rounds"] * stats["iterations"]
+        assert stats["ops"] > 0
+
+    def test_results_round_trip(self, tmp_path: Path) -> None:
+        """Test written results carry metadata and compare by name and params."""
+        path = tmp_path / "results.json"
+        benchmarks = [
+            {"name": "get", "params": {"tasks": 10}, "stats": {"median": 1.0}},
+            {"name": "get", "params": {"tasks": 100}, "stats": {"median": 2.0}},
+        ]
+        write_results(str(path), "micro", benchmarks)
+
+        baseline = json.loads(path.read_text())
+        assert baseline["suite"] == "micro"
+        assert "python_version" in baseline["machine_info"]
+        current = {"benchmarks": [
+            {"name": "get", "params": {"tasks": 100}, "stats": {"median": 3.0}},
+            {"name": "new", "params": {}, "stats": {"median": 1.0}},
+        ]}
+        assert compare(baseline, current) == [("get", '{"tasks": 100}', 2.0, 3.0, 50.0)]
+
+
+class TestLoad:
+    """Test cases for the in-process load generator."""
+
+    def test_every_endpoint_succeeds(self) -> None:
+        """Test each endpoint's requests are well formed and counted."""
+        results = asyncio.run(bench_load.load(tasks=50, requests=20, concurrency=4))
+
+        assert len(results) == len(bench_load.endpoints(["id"]))
+        for result in results:
+            assert result["stats"]["requests"] == 20
+            assert result["stats"]["errors"] == 0, result["name"]
+            assert result["stats"]["p50"] <= result["stats"]["p99"]
+
+
+class TestTransfer:
+    """Test cases for the export and import benchmark."""
+
+    def test_round_trips_the_board(self, tmp_path: Path) -> None:
+        """Test every transfer runs and the board is restored each time."""
+        results = bench_transfer.run(tasks=30, directory=tmp_path)
+
+        assert [r["name"] for r in results] == [
+            "export_plain", "import_plain", "export_gzip", "import_gzip",
+        ]
+        assert all(r["stats"]["ops"] > 0 for r in results)
+        assert (tmp_path / "tasks.ndjson").read_bytes().count(b"\n") == 30
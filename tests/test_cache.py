@@ -0,0 +1,339 @@
+"""Tests for the read-through task cache."""
+
+import socketserver
+import threading
+import time
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from backend.config import Settings
+from backend.models.task_model import Task, TaskPriority
+from backend.repositories.sqlite_repo import SqliteTaskRepository
+from backend.serialization import task_json
+from backend.services import cache as cache_module
+from backend.services.cache import (
+    MISS,
+    CacheError,
+    MemoryCache,
+    RespCache,
+    TaskCache,
+    create_task_cache,
+)
+from backend.services.task_service import TaskService
+
+
+def _bulk(value: bytes | None) -> bytes:
+    """Encode a RESP bulk string reply."""
+    return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """A local Redis-protocol server with the commands RespCache sends."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password: bytes | None = None) -> None:
+        """Listen on a free local port."""
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.password = password
+        self.values: dict[bytes, tuple[float, bytes]] = {}
+        self.commands: list[list[bytes]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """URL to reach the server at."""
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def execute(self, args: list[bytes]) -> bytes:
+        """Run one command and encode its reply."""
+        name = args[0].upper()
+        with self.lock:
+            self.commands.append(args)
+            now = time.monotonic()
+            if name == b"AUTH":
+                return b"+OK\r\n" if args[-1] == self.password else b"-WRONGPASS invalid\r\n"
+            if name == b"SELECT":
+                return b"+OK\r\n"
+            if name == b"GET":
+                entry = self.values.get(args[1])
+                return _bulk(entry[1] if entry and entry[0] > now else None)
+            if name == b"SET":
+                options = [arg.upper() for arg in args[3:]]
+                entry = self.values.get(args[1])
+                if b"NX" in options and entry and entry[0] > now:
+                    return _bulk(None)
+                ttl = int(options[options.index(b"PX") + 1]) / 1000
+                self.values[args[1]] = (now + ttl, args[2])
+                return b"+OK\r\n"
+            if name == b"DEL":
+                return b":%d\r\n" % sum(self.values.pop(key, None) is not None for key in args[1:])
+            if name == b"SCAN":
+                pattern = args[args.index(b"MATCH") + 1].decode()
+                keys = [key for key in self.values if fnmatchcase(key.decode(), pattern)]
+                return b"*2\r\n" + _bulk(b"0") + b"*%d\r\n" % len(keys) + b"".join(map(_bulk, keys))
+            return b"-ERR unknown command\r\n"
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Serve RESP commands on one connection."""
+
+    server: RespStandIn
+
+    def handle(self) -> None:
+        while line := self.rfile.readline():
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            self.wfile.write(self.server.execute(args))
+
+
+@pytest.fixture
+def resp_server() -> Iterator[RespStandIn]:
+    """Run a Redis-protocol stand-in for one test."""
+    server = RespStandIn(password=b"s3cret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> Iterator[TaskService]:
+    """A service over SQLite with an in-process cache."""
+    service = TaskService()
+    service._repo = SqliteTaskRepository(str(tmp_path / "tasks.db"))
+    service.cache = TaskCache(MemoryCache(size=100, ttl=60))
+    yield service
+    service._repo.close()
+
+
+class TestMemoryCache:
+    """Test cases for the in-process LRU cache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the entry unused for longest goes when the cache is full."""
+        cache = MemoryCache(size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert [cache.get(key) for key in "abc"] == [1, MISS, 3]
+
+    def test_entries_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test entries older than the TTL are misses and can be added again."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module, "monotonic", lambda: now[0])
+        cache = MemoryCache(size=10, ttl=5)
+        cache.set("task", "old")
+
+        now[0] += 4
+        cache.add("task", "ignored")
+        assert cache.get("task") == "old"
+        now[0] += 2
+        assert cache.get("task") is MISS
+        cache.add("task", "new")
+        assert cache.get("task") == "new"
+
+    def test_none_is_a_value(self) -> None:
+        """Test a stored None is told apart from a miss."""
+        cache = MemoryCache(size=10, ttl=60)
+        cache.set("gone", None)
+
+        assert cache.get("gone") is None
+        assert cache.get("unknown") is MISS
+
+
+class TestRespCache:
+    """Test cases for the Redis-protocol client."""
+
+    def test_round_trip(self, resp_server: RespStandIn) -> None:
+        """Test values are stored with a TTL under the prefix, and add keeps them."""
+        cache = RespCache(resp_server.url.replace("//", "//:s3cret@"), ttl=30)
+        cache.set("task:1", [1, "One", None])
+        cache.add("task:1", "ignored")
+        cache.add("task:2", {"total": 2})
+
+        assert cache.get("task:1") == [1, "One", None]
+        assert cache.get("task:2") == {"total": 2}
+        assert cache.get("task:3") is MISS
+        assert resp_server.commands[0] == [b"AUTH", b"s3cret"]
+        assert [b"SET", b"task_board:task:1", b'[1,"One",null]', b"PX", b"30000"] in (
+            resp_server.commands
+        )
+        cache.close()
+
+    def test_clear_only_touches_the_prefix(self, resp_server: RespStandIn) -> None:
+        """Test clear deletes this service's keys and nothing else."""
+        resp_server.values[b"other:key"] = (time.monotonic() + 60, b"1")
+        cache = RespCache(resp_server.url.replace("//", "//:s3cret@"), ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.clear()
+
+        assert list(resp_server.values) == [b"other:key"]
+        cache.close()
+
+    def test_errors(self, resp_server: RespStandIn) -> None:
+        """Test error replies and unreachable servers raise CacheError."""
+        with pytest.raises(CacheError, match="WRONGPASS"):
+            RespCache(resp_server.url.replace("//", "//:wrong@"), ttl=30).get("a")
+
+        host, port = resp_server.server_address[:2]
+        resp_server.shutdown()
+        resp_server.server_close()
+        with pytest.raises(CacheError, match="unavailable"):
+            RespCache(f"redis://{host}:{port}", ttl=30).get("a")
+
+    def test_rejects_other_urls(self) -> None:
+        """Test only redis:// URLs are accepted."""
+        with pytest.raises(ValueError, match="Unsupported cache URL"):
+            RespCache("memcached://localhost", ttl=30)
+
+
+class TestTaskCache:
+    """Test cases for reading tasks through TaskService's cache."""
+
+    def test_hot_task_reads_skip_storage(self, service: TaskService) -> None:
+        """Test a cached task is served without reading the repository."""
+        task = service.create_task("Cached", "high")
+        calls: list[str] = []
+        original = service._repo.get_by_id
+
+        def get_by_id(task_id: str) -> Task | None:
+            calls.append(task_id)
+            return original(task_id)
+
+        service._repo.get_by_id = get_by_id  # type: ignore[method-assign]
+
+        found = [service.get_task(task.id) for _ in range(3)]
+        missing = [service.get_task("non-existent-id") for _ in range(2)]
+
+        assert found == [task] * 3
+        assert found[0].revision == task.revision
+        assert missing == [None, None]
+        assert calls == ["non-existent-id"]
+
+    def test_writes_update_cached_tasks(self, service: TaskService) -> None:
+        """Test updates, toggles and deletes are visible through the cache at once."""
+        task = service.create_task("Before")
+        service.get_task(task.id)
+
+        service.update_task(task.id, title="After")
+        after = service.get_task(task.id)
+        service.toggle_task_completion(task.id)
+        toggled = service.get_task(task.id)
+        service.delete_tasks([task.id])
+
+        assert after is not None and after.title == "After"
+        assert toggled is not None and toggled.completed is True
+        assert service.get_task(task.id) is None
+
+    def test_pages_and_stats_follow_the_version(self, service: TaskService) -> None:
+        """Test a write makes cached pages and stats unreachable."""
+        service.create_tasks([("One", "low"), ("Two", "low")])
+        first_page = service.get_task_page(limit=1)
+        first_stats = service.get_task_stats()
+        assert service.get_task_page(limit=1) == first_page
+        hits = service.cache.hits  # type: ignore[union-attr]
+
+        service.create_task("Three")
+        page, cursor = service.get_task_page(limit=1)
+        stats = service.get_task_stats()
+
+        assert service.cache.hits == hits  # type: ignore[union-attr]
+        assert first_stats["total"] == 2 and stats["total"] == 3
+        assert [t.title for t in page] == ["Three"] and cursor is not None
+        assert [t.title for t in service.get_task_page(limit=5, cursor=cursor)[0]] == ["Two", "One"]
+
+    def test_clear_empties_the_cache(self, service: TaskService) -> None:
+        """Test clearing the board forgets cached tasks."""
+        task = service.create_task("Cleared")
+        service.get_task(task.id)
+
+        service.clear_all_tasks()
+
+        assert service.get_task(task.id) is None
+
+    def test_works_through_a_resp_server(
+        self, service: TaskService, resp_server: RespStandIn
+    ) -> None:
+        """Test the service reads and writes through a Redis-protocol server."""
+        backend = RespCache(resp_server.url.replace("//", "//:s3cret@"), ttl=30)
+        service.cache = TaskCache(backend)
+        task = service.create_task("Shared", "low")
+        service.get_task(task.id)
+        service.get_task_stats()
+        service.get_task_stats()
+
+        # The create stored the task, so only the first stats read misses
+        assert service.get_task(task.id) == task
+        assert (service.cache.hits, service.cache.misses) == (3, 1)
+        assert b"task_board:task:" + task.id.encode() in resp_server.values
+        backend.close()
+
+    def test_unavailable_cache_falls_through(self, service: TaskService) -> None:
+        """Test reads go to storage and writes carry on while the cache is down."""
+        service.cache = TaskCache(RespCache("redis://127.0.0.1:1", ttl=30, timeout=0.1))
+        task = service.create_task("Uncached", "low")
+
+        assert service.get_task(task.id) == task
+        assert service.get_task_stats()["total"] == 1
+        assert service.cache.errors >= 3
+        assert service.cache.hits == 0
+
+    def test_memory_cache_keeps_tasks(self, service: TaskService) -> None:
+        """Test the in-process cache returns the stored task, JSON fragment and all."""
+        task = service.create_task("Kept", "medium")
+        first = service.get_task(task.id)
+        assert first is not None
+        fragment = task_json(first)
+
+        again = service.get_task(task.id)
+
+        assert again is first
+        assert task_json(again) is fragment
+
+    def test_shared_values_are_json(
+        self, service: TaskService, resp_server: RespStandIn
+    ) -> None:
+        """Test tasks in a Redis-protocol server are stored as plain field lists."""
+        backend = RespCache(resp_server.url.replace("//", "//:s3cret@"), ttl=30)
+        service.cache = TaskCache(backend)
+        task = service.create_task("Plain", "medium")
+        stored: Any = backend.get(f"task:{task.id}")
+
+        assert stored == [
+            task.id, "Plain", False, 1, task.created_us, None, task.revision,
+        ]
+        assert Task.from_raw(*stored).priority == TaskPriority.MEDIUM
+        backend.close()
+
+
+class TestCreateTaskCache:
+    """Test cases for choosing a cache through configuration."""
+
+    def test_choices(self) -> None:
+        """Test each cache setting builds the matching backend."""
+        memory = create_task_cache(Settings(cache="memory"))
+        redis = create_task_cache(Settings(cache="redis"))
+
+        assert create_task_cache(Settings(cache="none")) is None
+        assert memory is not None and isinstance(memory.backend, MemoryCache)
+        assert redis is not None and isinstance(redis.backend, RespCache)
+
+    def test_unknown_cache(self) -> None:
+        """Test an unknown cache name is rejected."""
+        with pytest.raises(ValueError, match="Unknown cache"):
+            create_task_cache(Settings(cache="memcached"))
+
@@ -0,0 +1,206 @@
+"""Tests for the task change feed."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.config import Settings
+from backend.routers.task_router import _event_stream
+from backend.services.change_feed import ChangeFeed, SqliteChangeFeed, create_change_feed
+from backend.services.task_service import TaskService
+
+
+@pytest.fixture
+def task_service() -> TaskService:
+    """Create a task service with a clean repository."""
+    service = TaskService()
+    service.clear_all_tasks()
+    return service
+
+
+class TestChangeFeed:
+    """Test cases for publishing and subscribing to change events."""
+
+    def test_service_publishes_mutations(self, task_service: TaskService) -> None:
+        """Test each service mutation publishes one event, in order."""
+
+        async def scenario() -> list[dict[str, object]]:
+            subscription = task_service.subscribe_changes()
+            task = task_service.create_task("Watched")
+            task_service.toggle_task_completion(task.id)
+            task_service.delete_task(task.id)
+            task_service.delete_task(task.id)
+            task_service.clear_all_tasks()
+            events = []
+            for _ in range(4):
+                event = await subscription.get(timeout=1)
+                assert event is not None
+                events.append(json.loads(event.data))
+            task_service.unsubscribe_changes(subscription)
+            return events
+
+        events = asyncio.run(scenario())
+
+        assert [e["type"] for e in events] == ["created", "updated", "deleted", "cleared"]
+        assert events[1]["task"]["completed"] is True
+        assert events[2]["task_id"] == events[0]["task_id"]
+        assert [e["seq"] for e in events] == sorted(e["seq"] for e in events)
+
+    def test_resume_replays_missed_events(self) -> None:
+        """Test subscribing with a seen seq replays only later events."""
+        feed = ChangeFeed()
+        feed.publish("cleared")
+        seen = feed.seq
+        feed.publish("deleted", task_id="a")
+        feed.publish("deleted", task_id="b")
+
+        async def scenario() -> list[str]:
+            subscription = feed.subscribe(since=seen)
+            events = [await subscription.get(timeout=1) for _ in range(2)]
+            return [json.loads(e.data)["task_id"] for e in events if e is not None]
+
+        assert asyncio.run(scenario()) == ["a", "b"]
+
+    def test_resume_from_unknown_point_resets(self) -> None:
+        """Test resuming from before the replay buffer signals a reset."""
+        feed = ChangeFeed(history=2)
+        start = feed.seq
+        for task_id in "abc":
+            feed.publish("deleted", task_id=task_id)
+
+        async def scenario() -> object:
+            return await feed.subscribe(since=start).get(timeout=1)
+
+        assert asyncio.run(scenario()) is None
+
+    def test_slow_subscriber_is_reset(self) -> None:
+        """Test overflowing a subscriber's queue drops backlog and resets it."""
+        feed = ChangeFeed(max_pending=2)
+
+        async def scenario() -> tuple[object, str]:
+            subscription = feed.subscribe()
+            for task_id in "abcd":
+                feed.publish("deleted", task_id=task_id)
+            reset = await subscription.get(timeout=1)
+            feed.publish("deleted", task_id="e")
+            after = await subscription.get(timeout=1)
+            assert after is not None
+            return reset, json.loads(after.data)["task_id"]
+
+        assert asyncio.run(scenario()) == (None, "e")
+
+    def test_event_stream_format(self, task_service: TaskService) -> None:
+        """Test events are encoded as server-sent events with ids."""
+
+        async def scenario() -> bytes:
+            stream = _event_stream(task_service.get_change_seq())
+            task_service.create_task("Streamed")
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        chunk = asyncio.run(scenario())
+
+        lines = chunk.decode().split("\n")
+        assert lines[0].startswith("id: ")
+        assert lines[1] == "event: created"
+        assert json.loads(lines[2].removeprefix("data: "))["task"]["title"] == "Streamed"
+        assert chunk.endswith(b"\n\n")
+
+    def test_event_stream_subscribes_while_streaming(self, task_service: TaskService) -> None:
+        """Test a stream that never starts leaves no subscriber behind."""
+        subscribers = task_service._feed._subscribers
+        before = len(subscribers)
+
+        async def scenario() -> tuple[int, int]:
+            _event_stream(task_service.get_change_seq())
+            unstarted = len(subscribers)
+            stream = _event_stream(task_service.get_change_seq())
+            task_service.create_task("Streamed")
+            await stream.__anext__()
+            streaming = len(subscribers)
+            await stream.aclose()
+            return unstarted, streaming
+
+        assert asyncio.run(scenario()) == (before, before + 1)
+        assert len(subscribers) == before
+
+
+@pytest.fixture
+def feed_path(tmp_path: Path) -> str:
+    """Database file shared by the feeds of simulated workers."""
+    return str(tmp_path / "tasks.db")
+
+
+class TestSqliteChangeFeed:
+    """Test cases for the change feed shared between worker processes."""
+
+    def test_workers_see_each_others_events(self, feed_path: str) -> None:
+        """Test events published by one worker reach another's subscribers."""
+        first, second = SqliteChangeFeed(feed_path), SqliteChangeFeed(feed_path)
+
+        async def scenario() -> tuple[list[int], list[int]]:
+            subscriptions = first.subscribe(), second.subscribe()
+            first.publish("deleted", task_id="a")
+            second.publish("deleted", task_id="b")
+            first.publish("cleared")
+            first.poll()
+            second.poll()
+            seqs: tuple[list[int], list[int]] = ([], [])
+            for subscription, received in zip(subscriptions, seqs, strict=True):
+                for _ in range(3):
+                    event = await subscription.get(timeout=1)
+                    assert event is not None
+                    received.append(event.seq)
+            return seqs
+
+        try:
+            seen_first, seen_second = asyncio.run(scenario())
+        finally:
+            first.close()
+            second.close()
+
+        assert seen_first == seen_second
+        assert seen_first == sorted(seen_first)
+        assert first.seq == second.seq == seen_first[-1]
+
+    def test_resume_across_restart(self, feed_path: str) -> None:
+        """Test a restarted worker replays events for a resuming client."""
+        feed = SqliteChangeFeed(feed_path)
+        feed.publish("deleted", task_id="a")
+        seen = feed.seq
+        feed.publish("deleted", task_id="b")
+        feed.close()
+        restarted = SqliteChangeFeed(feed_path)
+
+        async def scenario() -> object:
+            event = await restarted.subscribe(since=seen).get(timeout=1)
+            assert event is not None
+            return json.loads(event.data)["task_id"]
+
+        try:
+            assert asyncio.run(scenario()) == "b"
+        finally:
+            restarted.close()
+
+    def test_old_events_are_pruned(self, feed_path: str) -> None:
+        """Test the events table keeps only about history rows."""
+        feed = SqliteChangeFeed(feed_path, history=4)
+        for task_id in "abcdefghi":
+            feed.publish("deleted", task_id=task_id)
+        count = feed._conn().execute("SELECT COUNT(*) FROM task_events").fetchone()[0]
+        feed.close()
+
+        assert 4 < count <= 8
+
+    def test_create_change_feed(self, feed_path: str) -> None:
+        """Test the feed is shared only when running several workers."""
+        shared = create_change_feed(
+            Settings(storage_backend="sqlite", sqlite_path=feed_path, workers=2)
+        )
+        assert isinstance(shared, SqliteChangeFeed)
+        shared.close()
+        local = create_change_feed(Settings(storage_backend="sqlite", sqlite_path=feed_path))
+        assert not isinstance(local, SqliteChangeFeed)
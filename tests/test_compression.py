@@ -0,0 +1,87 @@
+"""Tests for encoding negotiation and compressed responses."""
+
+import gzip
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from backend import compression
+from backend.compression import accepts_encoding, choose_encoding, precompress
+from backend.main import app
+from backend.services.task_service import task_service
+
+
+class TestNegotiation:
+    """Test cases for reading Accept-Encoding."""
+
+    def test_accepts_encoding(self) -> None:
+        """Test codings are accepted when listed or covered by *, unless given q=0."""
+        assert accepts_encoding("gzip, deflate, br", "gzip")
+        assert accepts_encoding("*", "gzip")
+        assert not accepts_encoding("br", "gzip")
+        assert not accepts_encoding(None, "gzip")
+        assert not accepts_encoding("*;q=1, gzip;q=0", "gzip")
+        assert not accepts_encoding("gzip;q=0.000", "gzip")
+
+    def test_choose_encoding(self) -> None:
+        """Test the highest quality available coding wins, ties to the first listed."""
+        assert choose_encoding("gzip, br", ["br", "gzip"]) == "br"
+        assert choose_encoding("br;q=0.5, gzip", ["br", "gzip"]) == "gzip"
+        assert choose_encoding("br", ["gzip"]) == "identity"
+        assert choose_encoding("gzip;q=0", ["br", "gzip"]) == "identity"
+        assert choose_encoding(None, ["br", "gzip"]) == "identity"
+
+
+class TestPrecompress:
+    """Test cases for compressing a frontend build."""
+
+    def test_writes_smaller_siblings(self, tmp_path: Path) -> None:
+        """Test text files get a .gz sibling, skipping small and binary files."""
+        (tmp_path / "assets").mkdir()
+        script = tmp_path / "assets" / "index-abc123.js"
+        script.write_text("console.log('task board');\n" * 200)
+        (tmp_path / "tiny.css").write_text("body{}")
+        (tmp_path / "logo.png").write_bytes(os.urandom(4096))
+
+        written = precompress(tmp_path)
+
+        if compression.brotli is None:
+            assert written == [script.with_name("index-abc123.js.gz")]
+        assert gzip.decompress(written[-1].read_bytes()) == script.read_bytes()
+
+    def test_keeps_fresh_siblings(self, tmp_path: Path) -> None:
+        """Test a second run only rewrites siblings older than their file."""
+        page = tmp_path / "index.html"
+        page.write_text("<p>Task</p>\n" * 200)
+        precompress(tmp_path)
+
+        assert precompress(tmp_path) == []
+        os.utime(page, ns=(page.stat().st_mtime_ns + 10**9,) * 2)
+        assert tmp_path / "index.html.gz" in precompress(tmp_path)
+
+
+class TestGZipMiddleware:
+    """Test cases for compressing API responses."""
+
+    def test_large_responses_are_gzipped(self) -> None:
+        """Test a large JSON response is gzipped for a client that accepts it."""
+        task_service.clear_all_tasks()
+        task_service.create_tasks([(f"Compressed task {i}", "low") for i in range(50)])
+        client = TestClient(app)
+
+        compressed = client.get("/api/tasks", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/api/tasks", headers={"Accept-Encoding": "identity"})
+        refused = client.get("/api/tasks", headers={"Accept-Encoding": "br, gzip;q=0"})
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert compressed.json() == plain.json()
+        assert "content-encoding" not in plain.headers
+        assert "content-encoding" not in refused.headers
+
+    def test_small_responses_are_not(self) -> None:
+        """Test responses under the minimum size are sent as they are."""
+        response = TestClient(app).get("/api/health", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
@@ -0,0 +1,104 @@
+"""Tests for application settings."""
+
+import pytest
+
+from backend.config import Settings
+
+
+class TestSettings:
+    """Test cases for Settings."""
+
+    def test_defaults_to_single_in_memory_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the defaults without any environment variables."""
+        for name in ("TASK_BOARD_STORAGE", "TASK_BOARD_WORKERS"):
+            monkeypatch.delenv(name, raising=False)
+
+        config = Settings.from_env()
+
+        assert config.storage_backend == "memory"
+        assert config.workers == 1
+        assert config.shared is False
+
+    def test_workers_default_to_sqlite(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test several workers pick the shared sqlite store by default."""
+        monkeypatch.delenv("TASK_BOARD_STORAGE", raising=False)
+        monkeypatch.setenv("TASK_BOARD_WORKERS", "4")
+
+        config = Settings.from_env()
+
+        assert config.storage_backend == "sqlite"
+        assert config.shared is True
+
+    def test_workers_reject_memory_backend(self) -> None:
+        """Test in-memory storage cannot be split across workers."""
+        with pytest.raises(ValueError, match="shared store"):
+            Settings(storage_backend="memory", workers=2)
+
+    def test_workers_must_be_positive(self) -> None:
+        """Test a worker count below one is rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            Settings(workers=0)
+
+    def test_write_ahead_log_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the write-ahead log settings are read, with per-level defaults."""
+        monkeypatch.setenv("TASK_BOARD_WAL_DIR", "/var/lib/task-board")
+        monkeypatch.setenv("TASK_BOARD_WAL_SYNC", "Always")
+        monkeypatch.delenv("TASK_BOARD_WAL_INTERVAL_MS", raising=False)
+
+        config = Settings.from_env()
+
+        assert config.wal_dir == "/var/lib/task-board"
+        assert config.wal_sync == "always"
+        assert config.wal_interval_ms is None
+
+    def test_read_cache_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the read coalescer's size is read from the environment."""
+        monkeypatch.setenv("TASK_BOARD_READ_CACHE", "0")
+
+        assert Settings.from_env().read_cache_size == 0
+
+    def test_compress_min_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test API response compression is on by default and can be turned off."""
+        monkeypatch.delenv("TASK_BOARD_COMPRESS_MIN_SIZE", raising=False)
+        assert Settings.from_env().compress_min_size == 1024
+
+        monkeypatch.setenv("TASK_BOARD_COMPRESS_MIN_SIZE", "0")
+        assert Settings.from_env().compress_min_size == 0
+
+    def test_metrics_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test request and call timing is on unless turned off."""
+        monkeypatch.delenv("TASK_BOARD_METRICS", raising=False)
+        assert Settings.from_env().metrics is True
+
+        monkeypatch.setenv("TASK_BOARD_METRICS", "false")
+        assert Settings.from_env().metrics is False
+
+    def test_admin_and_tracing_are_off_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the admin token and slow request threshold are read when set."""
+        monkeypatch.delenv("TASK_BOARD_ADMIN_TOKEN", raising=False)
+        monkeypatch.delenv("TASK_BOARD_SLOW_REQUEST_MS", raising=False)
+        config = Settings.from_env()
+        assert (config.admin_token, config.slow_request_ms) == (None, None)
+
+        monkeypatch.setenv("TASK_BOARD_ADMIN_TOKEN", "s3cret")
+        monkeypatch.setenv("TASK_BOARD_SLOW_REQUEST_MS", "250")
+        config = Settings.from_env()
+        assert (config.admin_token, config.slow_request_ms) == ("s3cret", 250.0)
+
+    def test_cache_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the read-through cache is off by default and configurable."""
+        monkeypatch.delenv("TASK_BOARD_CACHE", raising=False)
+        assert Settings.from_env().cache == "none"
+
+        monkeypatch.setenv("TASK_BOARD_CACHE", "Redis")
+        monkeypatch.setenv("TASK_BOARD_CACHE_URL", "redis://cache:6380/2")
+        monkeypatch.setenv("TASK_BOARD_CACHE_TTL", "5")
+        config = Settings.from_env()
+        assert (config.cache, config.cache_url, config.cache_ttl) == (
+            "redis", "redis://cache:6380/2", 5.0
+        )
+
+    def test_workers_reject_memory_cache(self) -> None:
+        """Test per-process caches cannot be used by several workers."""
+        with pytest.raises(ValueError, match="shared cache"):
+            Settings(storage_backend="sqlite", workers=2, cache="memory")
@@ -0,0 +1,288 @@
+"""Tests for the write-ahead-logged in-memory repository."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from backend.models.task_model import Task, TaskPriority
+from backend.repositories.base import TaskUpdate
+from backend.repositories.durable_repo import DurableTaskRepository
+
+
+def reopen(repo: DurableTaskRepository, path: Path) -> DurableTaskRepository:
+    """Close a repository and recover a new one from the same directory."""
+    repo.close()
+    return DurableTaskRepository(str(path), interval=0, verify_stats=True)
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """Directory holding the log and snapshots."""
+    return tmp_path / "data"
+
+
+class TestDurableTaskRepository:
+    """Test cases for logging, snapshots and recovery."""
+
+    def test_recovers_every_mutation(self, data_dir: Path) -> None:
+        """Test creates, updates, toggles and deletes survive a restart."""
+        repo = DurableTaskRepository(str(data_dir), interval=0, verify_stats=True)
+        kept = repo.create("Kept", TaskPriority.HIGH)
+        gone = repo.create("Gone")
+        renamed = repo.create("Before")
+        repo.toggle(kept.id)
+        repo.delete(gone.id)
+        repo.update_many([TaskUpdate(renamed.id, title="After", priority=TaskPriority.LOW)])
+        expected = repo.get_all()
+
+        recovered = reopen(repo, data_dir)
+
+        assert recovered.get_all() == expected
+        assert recovered.get_stats() == {
+            "total": 2,
+            "completed": 1,
+            "pending": 1,
+            "progress_percentage": 50.0,
+            "by_priority": {"low": 1, "medium": 0, "high": 1},
+            "completed_today": 1,
+        }
+        assert recovered.search("after") == [recovered.get_by_id(renamed.id)]
+        recovered.close()
+
+    def test_recovers_clear(self, data_dir: Path) -> None:
+        """Test a clear replays, keeping only tasks created afterwards."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        repo.create_many([("One", TaskPriority.LOW), ("Two", TaskPriority.LOW)])
+        repo.clear_all()
+        repo.create("Three")
+
+        recovered = reopen(repo, data_dir)
+
+        assert [t.title for t in recovered.get_all()] == ["Three"]
+        recovered.close()
+
+    def test_snapshot_plus_log_tail(self, data_dir: Path) -> None:
+        """Test recovery loads the snapshot and replays only the log after it."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        first = repo.create("Snapshotted")
+        repo.snapshot()
+        repo.update(first.id, completed=True)
+        repo.create("Logged")
+        expected = repo.get_all()
+
+        names = sorted(p.name for p in data_dir.iterdir())
+        recovered = reopen(repo, data_dir)
+
+        assert names == ["snapshot.00000002.cols", "wal.00000002.jsonl"]
+        assert recovered.get_all() == expected
+        recovered.close()
+
+    def test_analytics_columns_load_from_snapshot(self, data_dir: Path) -> None:
+        """Test analytics after recovery from a snapshot plus log match the original."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        tasks = repo.create_many([(f"Task {i}", TaskPriority.HIGH) for i in range(4)])
+        repo.toggle(tasks[0].id)
+        repo.snapshot()
+        repo.toggle(tasks[1].id)
+        repo.delete(tasks[2].id)
+        today = date.today()
+        expected = repo.get_analytics(today, today)
+
+        recovered = reopen(repo, data_dir)
+
+        assert recovered.get_analytics(today, today) == expected
+        recovered.close()
+
+    def test_analytics_after_restart_from_snapshot_only(self, data_dir: Path) -> None:
+        """Test analytics count a snapshot's tasks when no log follows it."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        tasks = repo.create_many([(f"Task {i}", TaskPriority.LOW) for i in range(3)])
+        repo.toggle(tasks[0].id)
+        repo.snapshot()
+        today = date.today()
+        expected = repo.get_analytics(today, today)
+
+        recovered = reopen(repo, data_dir)
+
+        assert recovered.get_analytics(today, today) == expected
+        assert expected["days"][0]["created"] == 3
+        assert expected["days"][0]["completed"] == 1
+        recovered.close()
+
+    def test_snapshot_rows_load_lazily(self, data_dir: Path) -> None:
+        """Test a reloaded snapshot serves every query before tasks are materialized."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        tasks = repo.create_many([
+            ("Write release notes", TaskPriority.HIGH),
+            ("Plan the sprint", TaskPriority.LOW),
+            ("Review release plan", TaskPriority.MEDIUM),
+        ])
+        repo.toggle(tasks[1].id)
+        repo.snapshot()
+        stats = repo.get_stats()
+
+        repo.close()
+        recovered = DurableTaskRepository(str(data_dir), interval=0)
+        table = recovered._tasks
+
+        assert recovered.get_stats() == stats
+        assert len(table._loaded) == 0
+        assert recovered._unindexed is not None
+        assert [t.id for t in recovered.get_page(completed=True)[0]] == [tasks[1].id]
+        assert recovered._unindexed is None
+        assert recovered.get_by_id(tasks[0].id) == tasks[0]
+        assert {t.id for t in recovered.search("release")} == {tasks[0].id, tasks[2].id}
+        recovered.close()
+
+    def test_imports_survive_restart(self, data_dir: Path) -> None:
+        """Test imported tasks are logged with their own IDs and timestamps."""
+        repo = DurableTaskRepository(str(data_dir), interval=0, verify_stats=True)
+        repo.create("Local")
+        imported = Task(id="from-elsewhere", title="Imported", completed=True)
+        imported.completed_at = imported.created_at
+        repo.import_many([imported])
+        expected = repo.get_all()
+
+        recovered = reopen(repo, data_dir)
+
+        assert recovered.get_all() == expected
+        assert recovered.get_by_id("from-elsewhere") == imported
+        recovered.close()
+
+    def test_export_leaves_snapshot_rows_unmaterialized(self, data_dir: Path) -> None:
+        """Test iterating a loaded snapshot reads rows without keeping tasks."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        tasks = repo.create_many([(f"Task {i}", TaskPriority.LOW) for i in range(5)])
+        repo.snapshot()
+        repo.close()
+        recovered = DurableTaskRepository(str(data_dir), interval=0)
+
+        exported = [t for batch in recovered.iter_tasks(batch_size=2) for t in batch]
+
+        assert exported == tasks
+        assert len(recovered._tasks._loaded) == 0
+        recovered.close()
+
+    def test_mutations_on_snapshot_rows(self, data_dir: Path) -> None:
+        """Test updates and deletes of snapshot rows apply and survive a restart."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        first, second = repo.create_many([("First", TaskPriority.LOW), ("Second", TaskPriority.LOW)])
+        repo.snapshot()
+        recovered = reopen(repo, data_dir)
+
+        recovered.update(first.id, title="Renamed")
+        recovered.delete(second.id)
+        third = recovered.create("Third")
+        expected = recovered.get_all()
+        stats = recovered.get_stats()
+        again = reopen(recovered, data_dir)
+
+        assert [t.title for t in expected] == ["Third", "Renamed"]
+        assert again.get_all() == expected
+        assert again.get_stats() == stats
+        assert again.get_by_id(second.id) is None
+        assert [t.id for t in again.search("renamed")] == [first.id]
+        assert again.search("second") == []
+        assert again.get_page(limit=1)[0] == [third]
+        again.close()
+
+    def test_changes_after_recovery(self, data_dir: Path) -> None:
+        """Test revisions from before a restart reset and later ones sync."""
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+        first, _ = repo.create_many([("First", TaskPriority.LOW), ("Second", TaskPriority.LOW)])
+        repo.snapshot()
+        repo.create("Logged")
+        before = repo.get_version()
+        recovered = reopen(repo, data_dir)
+        since = recovered.get_version()
+
+        stale = recovered.get_changes(before)
+        recovered.update(first.id, completed=True)
+        changes = recovered.get_changes(since)
+
+        assert stale.reset is True
+        assert [t.title for t in stale.tasks] == ["Logged", "Second", "First"]
+        assert changes.reset is False
+        assert [t.id for t in changes.tasks] == [first.id]
+        recovered.close()
+
+    def test_reads_json_lines_snapshots(self, data_dir: Path) -> None:
+        """Test snapshots in the older JSON-lines format still load."""
+        data_dir.mkdir()
+        (data_dir / "snapshot.00000003.jsonl").write_bytes(
+            b'["p","old-task","Legacy",true,2,1,2]\n'
+        )
+
+        repo = DurableTaskRepository(str(data_dir), interval=0)
+
+        task = repo.get_by_id("old-task")
+        assert task is not None and task.title == "Legacy" and task.completed
+        assert repo._log.path.name == "wal.00000004.jsonl"
+        repo.close()
+
+    def test_automatic_snapshots_compact_the_log(self, data_dir: Path) -> None:
+        """Test a snapshot is taken every snapshot_every records."""
+        repo = DurableTaskRepository(str(data_dir), interval=0, snapshot_every=10)
+        task = repo.create("Churn")
+        for _ in range(25):
+            repo.toggle(task.id)
+        repo.close()
+
+        snapshots = [p for p in data_dir.iterdir() if p.name.startswith("snapshot")]
+        recovered = DurableTaskRepository(str(data_dir), interval=0)
+
+        assert len(snapshots) == 1
+        assert recovered.get_by_id(task.id) == task
+        recovered.close()
+
+    def test_torn_last_record_is_ignored(self, data_dir: Path) -> None:
+        """Test a record cut short by a crash is dropped on recovery."""
+        repo = DurableTaskRepository(str(data_dir), sync="always")
+        task = repo.create("Whole")
+        log_path = repo._log.path
+        repo.close()
+        with open(log_path, "ab") as f:
+            f.write(b'["p","torn","Half')
+
+        recovered = DurableTaskRepository(str(data_dir), interval=0)
+
+        assert recovered.get_all() == [task]
+        recovered.close()
+
+    def test_corrupt_record_raises(self, data_dir: Path) -> None:
+        """Test a damaged record before the end of a log stops recovery."""
+        repo = DurableTaskRepository(str(data_dir), sync="always")
+        repo.create("Whole")
+        log_path = repo._log.path
+        repo.close()
+        log_path.write_bytes(b"garbage\n" + log_path.read_bytes())
+
+        with pytest.raises(ValueError, match="Corrupt record"):
+            DurableTaskRepository(str(data_dir))
+
+    @pytest.mark.parametrize("sync", ["none", "interval"])
+    def test_async_levels_do_not_block(self, data_dir: Path, sync: str) -> None:
+        """Test modes where callers never wait on the disk run inline."""
+        repo = DurableTaskRepository(str(data_dir), sync=sync)
+        task = repo.create("Fast")
+        recovered = reopen(repo, data_dir)
+
+        assert repo.blocking is False
+        assert recovered.get_all() == [task]
+        recovered.close()
+
+    def test_blocks_until_snapshot_is_indexed(self, data_dir: Path) -> None:
+        """Test calls leave the event loop while a loaded snapshot has indexes to build."""
+        repo = DurableTaskRepository(str(data_dir), sync="none")
+        repo.create_many([("Write notes", TaskPriority.LOW), ("Plan", TaskPriority.HIGH)])
+        repo.snapshot()
+        repo.close()
+
+        recovered = DurableTaskRepository(str(data_dir), sync="none")
+        assert recovered.blocking is True
+        recovered.create("After")
+        assert recovered.blocking is True
+        assert [task.title for task in recovered.search("notes")] == ["Write notes"]
+        assert recovered.blocking is False
+        recovered.close()
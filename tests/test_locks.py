@@ -0,0 +1,45 @@
+"""Tests for repository locks."""
+
+import threading
+import time
+
+from backend.repositories.locks import ReadWriteLock
+
+
+class TestReadWriteLock:
+    """Test cases for the read-write lock."""
+
+    def test_readers_share(self) -> None:
+        """Test several readers can hold the lock at once."""
+        lock = ReadWriteLock()
+        inside = threading.Barrier(3, timeout=2)
+
+        def read() -> None:
+            with lock.read():
+                inside.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not inside.broken
+
+    def test_writer_excludes_readers(self) -> None:
+        """Test readers wait while a writer holds the lock."""
+        lock = ReadWriteLock()
+        events: list[str] = []
+
+        def read() -> None:
+            with lock.read():
+                events.append("read")
+
+        with lock.write():
+            reader = threading.Thread(target=read)
+            reader.start()
+            time.sleep(0.05)
+            events.append("write done")
+        reader.join()
+
+        assert events == ["write done", "read"]
@@ -0,0 +1,214 @@
+"""Tests for Metrics."""
+
+import threading
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import metrics
+from backend.main import app
+from backend.metrics import (
+    CALL_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    Registry,
+    instrument,
+    public_methods,
+)
+from backend.services.task_service import task_service
+
+
+def samples(text: str) -> dict[str, float]:
+    """Map each sample line's name and labels to its value."""
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+class Calculator:
+    """A small class to instrument."""
+
+    def add(self, a: int, b: int) -> int:
+        return a + b
+
+    def fail(self) -> None:
+        raise ValueError("nope")
+
+    def _hidden(self) -> None:
+        pass
+
+
+class TestHistogram:
+    """Test cases for histograms and their text format."""
+
+    def test_buckets_are_cumulative(self) -> None:
+        """Test each bucket counts observations up to its bound."""
+        histogram = Histogram("latency", "Latency", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.labels("a").observe(value)
+
+        lines = samples("\n".join(histogram.render()))
+
+        assert lines['latency_bucket{route="a",le="0.1"}'] == 2
+        assert lines['latency_bucket{route="a",le="1.0"}'] == 3
+        assert lines['latency_bucket{route="a",le="+Inf"}'] == 4
+        assert lines['latency_count{route="a"}'] == 4
+        assert lines['latency_sum{route="a"}'] == pytest.approx(2.65)
+
+    def test_threads_record_into_their_own_shards(self) -> None:
+        """Test concurrent observations are all counted."""
+        child = Histogram("latency", "Latency").labels()
+
+        def observe() -> None:
+            for _ in range(10_000):
+                child.observe(0.001)
+
+        threads = [threading.Thread(target=observe) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counts, total = child.snapshot()
+        assert sum(counts) == 40_000
+        assert total == pytest.approx(40.0)
+
+    def test_wrong_label_count(self) -> None:
+        """Test a label set must match the label names."""
+        with pytest.raises(ValueError):
+            Histogram("latency", "Latency", ("route",)).labels("a", "b")
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test quotes and backslashes in label values are escaped."""
+        gauge = Gauge("g", "G", ("name",))
+        gauge.labels('a"b\\c').set(1)
+
+        assert gauge.render()[-1] == 'g{name="a\\"b\\\\c"} 1'
+
+    def test_family_is_abstract(self) -> None:
+        """Test the metric base class cannot be used without a kind of child."""
+        with pytest.raises(TypeError):
+            metrics._Family("base", "Base")  # type: ignore[abstract]
+
+    def test_registry_renders_every_metric(self) -> None:
+        """Test the registry renders HELP and TYPE lines and samples."""
+        registry = Registry()
+        registry.register(Gauge("open", "Open things")).labels().set(3)
+        registry.register(Counter("done_total", "Done things")).labels().set(5)
+
+        assert registry.render().decode().splitlines() == [
+            "# HELP open Open things",
+            "# TYPE open gauge",
+            "open 3",
+            "# HELP done_total Done things",
+            "# TYPE done_total counter",
+            "done_total 5",
+        ]
+
+
+class TestInstrument:
+    """Test cases for timing method calls."""
+
+    def test_times_calls_by_method(self) -> None:
+        """Test calls are observed, including ones that raise."""
+        histogram = Histogram("calls", "Calls", ("method",), CALL_BUCKETS)
+        calculator = instrument(Calculator(), histogram, public_methods(Calculator))
+
+        assert calculator.add(1, 2) == 3
+        with pytest.raises(ValueError):
+            calculator.fail()
+
+        assert sum(histogram.labels("add").snapshot()[0]) == 1
+        assert sum(histogram.labels("fail").snapshot()[0]) == 1
+        assert sum(histogram.labels("_hidden").snapshot()[0]) == 0
+
+    def test_other_instances_are_untouched(self) -> None:
+        """Test wrappers are set on the instance, not the class."""
+        histogram = Histogram("calls", "Calls", ("method",))
+        instrument(Calculator(), histogram, ["add"])
+
+        Calculator().add(1, 2)
+
+        assert sum(histogram.labels("add").snapshot()[0]) == 0
+
+    def test_public_methods(self) -> None:
+        """Test only public methods are listed."""
+        assert public_methods(Calculator) == ["add", "fail"]
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client over an empty board."""
+    task_service.clear_all_tasks()
+    return TestClient(app)
+
+
+class TestMetricsEndpoint:
+    """Test cases for /api/metrics."""
+
+    def test_middleware_is_installed(self) -> None:
+        """Test the app times requests by default."""
+        assert any(m.cls is MetricsMiddleware for m in app.user_middleware)
+
+    def test_reports_task_counts(self, client: TestClient) -> None:
+        """Test task gauges reflect the board."""
+        client.post("/api/tasks", json={"title": "One", "priority": "high"})
+        task_id = client.post("/api/tasks", json={"title": "Two"}).json()["id"]
+        client.patch(f"/api/tasks/{task_id}/toggle")
+
+        response = client.get("/api/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == metrics.CONTENT_TYPE
+        lines = samples(response.text)
+        assert lines['task_board_tasks{status="completed"}'] == 1
+        assert lines['task_board_tasks{status="pending"}'] == 1
+        assert lines['task_board_tasks_by_priority{priority="high"}'] == 1
+
+    def test_reports_request_and_call_latency(self, client: TestClient) -> None:
+        """Test requests are labelled by handler and status, calls by method."""
+        before = samples(client.get("/api/metrics").text)
+        task_id = client.post("/api/tasks", json={"title": "One"}).json()["id"]
+        client.get(f"/api/tasks/{task_id}")
+        client.get("/api/tasks/missing")
+
+        after = samples(client.get("/api/metrics").text)
+
+        def added(name: str) -> float:
+            return after[name] - before.get(name, 0)
+
+        request = "task_board_request_duration_seconds_count"
+        assert added(f'{request}{{method="GET",handler="get_task",status="200"}}') == 1
+        assert added(f'{request}{{method="GET",handler="get_task",status="404"}}') == 1
+        assert added(f'{request}{{method="POST",handler="create_task",status="201"}}') == 1
+        service = "task_board_service_call_duration_seconds_count"
+        assert added(f'{service}{{method="get_task"}}') == 2
+        repository = "task_board_repository_call_duration_seconds_count"
+        assert added(f'{repository}{{method="get_by_id"}}') == 2
+
+    def test_event_streams_are_not_timed(self) -> None:
+        """Test event streams are left out and other responses are recorded."""
+        histogram = Histogram("latency", "Latency", ("method", "handler", "status"))
+
+        async def app(scope: Any, receive: Any, send: Any) -> None:
+            media_type = b"text/event-stream" if scope["path"] == "/events" else b"text/plain"
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", media_type + b"; charset=utf-8")],
+            })
+            await send({"type": "http.response.body", "body": b"data: 1\n\n"})
+
+        client = TestClient(MetricsMiddleware(app, histogram=histogram))
+        client.get("/events")
+        assert histogram.render()[2:] == []
+
+        client.get("/plain")
+        assert 'latency_count{method="GET",handler="unmatched",status="200"} 1' in (
+            histogram.render()
+        )
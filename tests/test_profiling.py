@@ -0,0 +1,196 @@
+"""Tests for profiling and slow request traces."""
+
+import dataclasses
+import importlib
+import queue
+import threading
+from collections import Counter
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import profiling
+from backend.config import settings
+from backend.main import app
+from backend.metrics import public_methods
+from backend.profiling import (
+    ProfilerBusyError,
+    SlowRequestLog,
+    SlowRequestMiddleware,
+    profile,
+    render_collapsed,
+    trace_calls,
+)
+from backend.services.task_service import TaskService, task_service
+
+# The module, which the routers package shadows with its router
+admin_module = importlib.import_module("backend.routers.admin_router")
+
+
+def spin(stop: threading.Event) -> None:
+    """Keep a thread busy in a recognizable frame."""
+    while not stop.is_set():
+        sum(range(100))
+
+
+class TestProfile:
+    """Test cases for the stack sampler."""
+
+    def test_samples_busy_threads(self) -> None:
+        """Test a busy thread's stack is counted under its thread name."""
+        stop = threading.Event()
+        worker = threading.Thread(target=spin, args=(stop,), name="spinner")
+        worker.start()
+        try:
+            counts = profile(0.2, interval=0.005)
+        finally:
+            stop.set()
+            worker.join()
+
+        spinning = [s for s in counts if s.startswith("spinner;") and "test_profiling:spin" in s]
+        assert spinning
+        assert sum(counts[s] for s in spinning) > 5
+
+    def test_idle_workers_are_dropped_unless_asked_for(self) -> None:
+        """Test threads waiting for work are left out by default."""
+        jobs: queue.Queue[None] = queue.Queue()
+        worker = threading.Thread(target=jobs.get, name="idle-worker")
+        worker.start()
+        try:
+            quiet = profile(0.05, interval=0.005)
+            everything = profile(0.05, interval=0.005, include_idle=True)
+        finally:
+            jobs.put(None)
+            worker.join()
+
+        assert not any(s.startswith("idle-worker;") for s in quiet)
+        assert any(s.startswith("idle-worker;") for s in everything)
+
+    def test_one_profile_at_a_time(self) -> None:
+        """Test a second profile is refused while one runs."""
+        with profiling._profiling, pytest.raises(ProfilerBusyError):
+            profile(0.01)
+
+    def test_render_collapsed(self) -> None:
+        """Test collapsed stacks are written most frequent first."""
+        counts = Counter({"main;a:f;a:g": 2, "main;a:f": 5})
+
+        assert render_collapsed(counts) == "main;a:f 5\nmain;a:f;a:g 2\n"
+
+
+@pytest.fixture
+def traced(monkeypatch: pytest.MonkeyPatch) -> SlowRequestLog:
+    """Trace the service singleton's calls for one test; return the log."""
+    task_service.clear_all_tasks()
+    for name in public_methods(TaskService):
+        monkeypatch.setattr(task_service, name, getattr(task_service, name))
+    trace_calls(task_service, "service", public_methods(TaskService))
+    return SlowRequestLog()
+
+
+class TestSlowRequests:
+    """Test cases for slow request traces."""
+
+    def test_slow_requests_are_kept_with_their_calls(self, traced: SlowRequestLog) -> None:
+        """Test a request over the threshold is logged with its service calls."""
+        client = TestClient(SlowRequestMiddleware(app, threshold_ms=0, log=traced))
+        task_id = client.post("/api/tasks", json={"title": "Traced"}).json()["id"]
+        client.get(f"/api/tasks/{task_id}")
+
+        latest, first = traced.recent()
+        assert (latest["method"], latest["path"]) == ("GET", f"/api/tasks/{task_id}")
+        assert (latest["handler"], latest["status"]) == ("get_task", 200)
+        assert [call["call"] for call in latest["calls"]] == ["service.get_task"]
+        call = latest["calls"][0]
+        assert 0 <= call["start_ms"] <= latest["duration_ms"]
+        assert call["duration_ms"] <= latest["duration_ms"]
+        assert first["handler"] == "create_task"
+
+    def test_fast_requests_are_not_kept(self, traced: SlowRequestLog) -> None:
+        """Test requests under the threshold leave no trace."""
+        client = TestClient(SlowRequestMiddleware(app, threshold_ms=60_000, log=traced))
+        client.get("/api/tasks")
+
+        assert traced.recent() == []
+
+    def test_calls_outside_requests_are_not_recorded(self, traced: SlowRequestLog) -> None:
+        """Test traced methods behave normally outside a request."""
+        assert task_service.get_all_tasks() == []
+
+    def test_log_keeps_the_newest(self) -> None:
+        """Test the log is bounded and lists newest first."""
+        log = SlowRequestLog(size=2)
+        for i in range(3):
+            log.record({"n": i})
+
+        assert log.recent() == [{"n": 2}, {"n": 1}]
+        assert log.recent(1) == [{"n": 2}]
+
+
+@pytest.fixture
+def admin(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    """Enable the admin endpoints with a known token."""
+    monkeypatch.setattr(
+        admin_module, "settings", dataclasses.replace(settings, admin_token="s3cret")
+    )
+    return TestClient(app)
+
+
+class TestAdminAPI:
+    """Test cases for the admin endpoints."""
+
+    def test_hidden_without_a_token_configured(self) -> None:
+        """Test the endpoints do not exist unless a token is set."""
+        assert settings.admin_token is None
+        response = TestClient(app).get("/api/admin/slow-requests")
+
+        assert response.status_code == 404
+
+    def test_token_required(self, admin: TestClient) -> None:
+        """Test requests without the right bearer token are refused."""
+        assert admin.get("/api/admin/slow-requests").status_code == 401
+        wrong = admin.get("/api/admin/slow-requests", headers={"Authorization": "Bearer nope"})
+        assert wrong.status_code == 401
+        assert wrong.headers["WWW-Authenticate"] == "Bearer"
+
+    def test_profile(self, admin: TestClient) -> None:
+        """Test a profile comes back as collapsed stacks."""
+        response = admin.get(
+            "/api/admin/profile",
+            params={"seconds": 0.05, "include_idle": True},
+            headers={"Authorization": "Bearer s3cret"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        for line in response.text.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert ";" in stack and int(count) > 0
+
+    def test_profile_busy(self, admin: TestClient) -> None:
+        """Test a second concurrent profile gets 409."""
+        with profiling._profiling:
+            response = admin.get(
+                "/api/admin/profile",
+                params={"seconds": 0.05},
+                headers={"Authorization": "Bearer s3cret"},
+            )
+
+        assert response.status_code == 409
+
+    def test_slow_requests(self, admin: TestClient) -> None:
+        """Test recorded traces are listed newest first."""
+        profiling.slow_requests.clear()
+        profiling.slow_requests.record({"path": "/api/tasks", "duration_ms": 900.0})
+        try:
+            response = admin.get(
+                "/api/admin/slow-requests", headers={"Authorization": "Bearer s3cret"}
+            )
+        finally:
+            profiling.slow_requests.clear()
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "threshold_ms": None,
+            "requests": [{"path": "/api/tasks", "duration_ms": 900.0}],
+        }
@@ -0,0 +1,105 @@
+"""Tests for read coalescing."""
+
+import asyncio
+
+import anyio
+import pytest
+
+from backend.services.read_cache import ReadCoalescer
+
+
+class Counted:
+    """A slow read that counts how often it runs."""
+
+    def __init__(self, result: object = "result", error: Exception | None = None) -> None:
+        self.calls = 0
+        self.result = result
+        self.error = error
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await anyio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestReadCoalescer:
+    """Test cases for single-flight, version-keyed reads."""
+
+    def test_concurrent_reads_share_one_computation(self) -> None:
+        """Test a burst of identical reads computes once."""
+        reads = ReadCoalescer(8)
+        compute = Counted()
+
+        async def run() -> list[object]:
+            return await asyncio.gather(*(reads.get("key", 1, compute) for _ in range(50)))
+
+        assert asyncio.run(run()) == ["result"] * 50
+        assert compute.calls == 1
+        assert (reads.misses, reads.coalesced) == (1, 49)
+
+    def test_cached_until_version_changes(self) -> None:
+        """Test results are reused at the same version and recomputed after."""
+        reads = ReadCoalescer(8)
+        compute = Counted()
+
+        async def run() -> None:
+            await reads.get("key", 1, compute)
+            await reads.get("key", 1, compute)
+            assert compute.calls == 1
+            await reads.get("key", 2, compute)
+            assert compute.calls == 2
+            # A caller that read an older version bypasses the cache
+            await reads.get("key", 1, compute)
+            assert compute.calls == 3
+
+        asyncio.run(run())
+        assert reads.hits == 1
+
+    def test_keys_are_independent_and_bounded(self) -> None:
+        """Test each key has its own result and the oldest is evicted."""
+        reads = ReadCoalescer(2)
+
+        async def run() -> None:
+            for key in ("a", "b", "c"):
+                await reads.get(key, 1, Counted(key))
+            compute = Counted("again")
+            assert await reads.get("c", 1, compute) == "c"
+            assert await reads.get("a", 1, compute) == "again"
+
+        asyncio.run(run())
+
+    def test_errors_reach_every_waiter_and_are_not_cached(self) -> None:
+        """Test a failed read fails its waiters and is retried by the next caller."""
+        reads = ReadCoalescer(8)
+        failing = Counted(error=ValueError("bad cursor"))
+
+        async def run() -> None:
+            results = await asyncio.gather(
+                *(reads.get("key", 1, failing) for _ in range(3)), return_exceptions=True
+            )
+            assert all(isinstance(r, ValueError) for r in results)
+            assert failing.calls == 1
+            assert await reads.get("key", 1, Counted()) == "result"
+
+        asyncio.run(run())
+
+    def test_cancelled_leader_does_not_fail_waiters(self) -> None:
+        """Test waiters still get the result when the first caller goes away."""
+        reads = ReadCoalescer(8)
+        compute = Counted()
+
+        async def run() -> object:
+            leader = asyncio.create_task(reads.get("key", 1, compute))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(reads.get("key", 1, compute))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await waiter
+
+        assert asyncio.run(run()) == "result"
+        # The shield lets the leader finish; a cancel it can't stop means one retry
+        assert compute.calls in (1, 2)
@@ -0,0 +1,166 @@
+"""Tests for fast-path JSON serialization."""
+
+import json
+import os
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from backend import serialization
+from backend.models.task_model import Task, TaskPriority
+from backend.repositories.task_repo import TaskRepository
+from backend.schemas.task_schema import TaskListResponseSchema, TaskResponseSchema
+from backend.serialization import (
+    render_bulk_results,
+    render_ndjson,
+    render_task_list,
+    task_from_json,
+    task_json,
+)
+
+
+@pytest.fixture
+def repo() -> TaskRepository:
+    """Create a repository holding a pending and a completed task."""
+    repo = TaskRepository()
+    repo.create("Pending ✓", TaskPriority.LOW)
+    done = repo.create('Done "quoted"', TaskPriority.HIGH)
+    repo.update(done.id, completed=True)
+    return repo
+
+
+class TestSerialization:
+    """Test cases for the pre-encoded JSON response bodies."""
+
+    def test_task_list_matches_schema(self, repo: TaskRepository) -> None:
+        """Test the fast path encodes the same document as the Pydantic schema."""
+        tasks, next_cursor = repo.get_page(limit=1)
+        stats = repo.get_stats()
+
+        expected = TaskListResponseSchema(
+            tasks=[t.to_dict() for t in tasks], next_cursor=next_cursor, **stats
+        ).model_dump(mode="json")
+
+        assert json.loads(render_task_list(tasks, stats, next_cursor)) == expected
+
+    def test_fragment_cached_until_update(self, repo: TaskRepository) -> None:
+        """Test a task's JSON fragment is reused, then refreshed after an update."""
+        task = repo.get_all()[0]
+        first = task_json(task)
+
+        assert task_json(task) is first
+        repo.update(task.id, title="Renamed")
+        assert json.loads(task_json(task)) == TaskResponseSchema(
+            **task.to_dict()
+        ).model_dump(mode="json")
+
+    def test_fragment_from_before_a_write_is_not_reused(self, repo: TaskRepository) -> None:
+        """Test a fragment stored by a reader that raced a write is ignored."""
+        task = repo.get_all()[0]
+        before = task.revision
+        stale = task_json(task)
+        repo.update(task.id, title="Renamed")
+        # The reader encoded the old fields and stored them after the write
+        task.json_cache = (before, stale)
+
+        assert json.loads(task_json(task))["title"] == "Renamed"
+        assert json.loads(render_ndjson([task]))["title"] == "Renamed"
+
+    def test_ndjson_round_trip(self, repo: TaskRepository) -> None:
+        """Test exported lines decode back into equal tasks without filling the cache."""
+        tasks = repo.get_all()
+        for task in tasks:
+            task.json_cache = None
+
+        lines = render_ndjson(tasks).splitlines()
+
+        assert [task_from_json(line) for line in lines] == tasks
+        assert all(task.json_cache is None for task in tasks)
+
+    @pytest.mark.parametrize(
+        ("line", "error"),
+        [
+            (b"{not json", "invalid JSON"),
+            (b"[1]", "expected a JSON object"),
+            (b'{"id":"a","title":"T","completed":false,"priority":"low"}', "'created_at'"),
+            (
+                b'{"id":"","title":"T","completed":false,"priority":"low","created_at":"2026-01-01"}',
+                "id",
+            ),
+            (
+                '{"id":"t\u00e2che","title":"T","completed":false,"priority":"low",'
+                '"created_at":"2026-01-01"}'.encode(),
+                "id",
+            ),
+            (
+                b'{"id":"a/b","title":"T","completed":false,"priority":"low","created_at":"2026-01-01"}',
+                "id",
+            ),
+            (
+                b'{"id":"' + b"a" * 65 + b'","title":"T","completed":false,"priority":"low",'
+                b'"created_at":"2026-01-01"}',
+                "id",
+            ),
+            (
+                b'{"id":"a","title":"","completed":false,"priority":"low","created_at":"2026-01-01"}',
+                "title",
+            ),
+            (
+                b'{"id":"a","title":"T","completed":0,"priority":"low","created_at":"2026-01-01"}',
+                "completed",
+            ),
+            (
+                b'{"id":"a","title":"T","completed":false,"priority":"urgent",'
+                b'"created_at":"2026-01-01"}',
+                "priority",
+            ),
+            (
+                b'{"id":"a","title":"T","completed":true,"priority":"low",'
+                b'"created_at":"2026-01-01","completed_at":"yesterday"}',
+                "completed_at",
+            ),
+        ],
+    )
+    def test_task_from_json_rejects(self, line: bytes, error: str) -> None:
+        """Test invalid lines raise ValueError naming the problem."""
+        with pytest.raises(ValueError, match=error):
+            task_from_json(line)
+
+    def test_task_from_json_converts_offsets(self) -> None:
+        """Test timestamps with a UTC offset become naive local times."""
+        task = task_from_json(
+            b'{"id":"a","title":"T","completed":false,"priority":"low",'
+            b'"created_at":"2026-01-01T12:00:00+00:00"}'
+        )
+
+        expected = datetime(2026, 1, 1, 12, tzinfo=UTC).astimezone().replace(tzinfo=None)
+        assert task.created_at == expected
+        assert task.completed_at is None
+
+    def test_bulk_results(self) -> None:
+        """Test bulk results encode tasks inline and missing ones as null."""
+        task = Task(title="Bulk")
+
+        body = json.loads(render_bulk_results([(task.id, 201, task), ("gone", 404, None)]))
+
+        assert body["results"][0]["task"]["title"] == "Bulk"
+        assert body["results"][1] == {"id": "gone", "status": 404, "task": None}
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test encoding works without orjson."""
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert serialization.dumps({"title": "✓", "n": 1.5}) == '{"title":"✓","n":1.5}'.encode()
+
+    def test_imports_first_with_durable_backend(self, tmp_path: Path) -> None:
+        """Test the module imports on its own when the durable backend is configured."""
+        env = {**os.environ, "TASK_BOARD_WAL_DIR": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, "-c", "import backend.serialization"],
+            env=env, capture_output=True, text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,115 @@
+"""Tests for columnar snapshots."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from backend.models.task_model import Task
+from backend.repositories.snapshot import ColumnarSnapshot, TaskTable, write_snapshot
+
+ROWS = [
+    ("b-task", "Plan the sprint", False, 0, 1_000, None),
+    ("a-longer-id", "Écrire les notes ✓", True, 2, 2_000, 86_400_000_123),
+    ("c", "", False, 1, 3_000, None),
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path: Path) -> Iterator[ColumnarSnapshot]:
+    """Map a snapshot of ROWS."""
+    path = tmp_path / "snapshot.cols"
+    write_snapshot(path, ROWS)
+    snapshot = ColumnarSnapshot(path)
+    yield snapshot
+    snapshot.close()
+
+
+class TestColumnarSnapshot:
+    """Test cases for writing and mapping snapshot files."""
+
+    def test_round_trip(self, snapshot: ColumnarSnapshot) -> None:
+        """Test every row reads back as written, in order."""
+        assert len(snapshot) == 3
+        assert snapshot.ids() == [row[0] for row in ROWS]
+        assert [snapshot.row(i) for i in range(3)] == ROWS
+        assert list(snapshot.titles()) == [row[1] for row in ROWS]
+        assert snapshot.task(1) == Task.from_raw(*ROWS[1])
+
+    def test_statistics(self, snapshot: ColumnarSnapshot) -> None:
+        """Test the header carries the counters the repository needs."""
+        assert snapshot.completed_count == 1
+        assert snapshot.priority_counts == [1, 1, 1]
+        assert snapshot.completed_by_day == {1: 1}
+        assert bytes(snapshot.completed) == b"\x00\x01\x00"
+
+    def test_find(self, snapshot: ColumnarSnapshot) -> None:
+        """Test IDs are found by binary search, and missing ones are not."""
+        assert [snapshot.find(row[0]) for row in ROWS] == [0, 1, 2]
+        assert snapshot.find("a") is None
+        assert snapshot.find("zzz") is None
+        assert snapshot.find("ünicode") is None
+
+    def test_empty(self, tmp_path: Path) -> None:
+        """Test an empty snapshot maps and finds nothing."""
+        path = tmp_path / "empty.cols"
+        write_snapshot(path, [])
+        snapshot = ColumnarSnapshot(path)
+
+        assert len(snapshot) == 0
+        assert snapshot.ids() == []
+        assert snapshot.find("a") is None
+        snapshot.close()
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """Test a file without the snapshot header is refused."""
+        path = tmp_path / "other.cols"
+        path.write_bytes(b'["p"]\n' * 20)
+
+        with pytest.raises(ValueError, match="not a columnar task snapshot"):
+            ColumnarSnapshot(path)
+
+
+class TestTaskTable:
+    """Test cases for the lazy task mapping over a snapshot."""
+
+    def test_materializes_on_access(self, snapshot: ColumnarSnapshot) -> None:
+        """Test rows become Task objects only when looked up, once each."""
+        table = TaskTable(snapshot)
+
+        assert len(table) == 3
+        assert table._loaded == {}
+        task = table["c"]
+        assert table.get("c") is task
+        assert table.get("missing") is None
+        assert list(table._loaded) == ["c"]
+
+    def test_mutations(self, snapshot: ColumnarSnapshot) -> None:
+        """Test adds, replacements and deletes keep creation order and length."""
+        table = TaskTable(snapshot)
+        new = Task.from_raw("d", "New", False, 1, 4_000, None)
+        table["d"] = new
+        replacement = Task.from_raw("c", "Replaced", False, 1, 3_000, None)
+        table.get("c")
+        table["c"] = replacement
+        removed = table.pop("b-task")
+
+        assert removed is not None and removed.title == "Plan the sprint"
+        assert table.pop("b-task") is None
+        assert table.get("b-task") is None
+        assert len(table) == 3
+        assert [t.id for t in table.values()] == ["a-longer-id", "c", "d"]
+        assert table["c"] is replacement
+        assert table.raw("c") == ("c", "Replaced", False, 1, 3_000, None)
+        assert table.raw("a-longer-id") == ROWS[1]
+        assert table.raw("b-task") is None
+
+    def test_clear(self, snapshot: ColumnarSnapshot) -> None:
+        """Test clearing drops the snapshot rows as well as new tasks."""
+        table = TaskTable(snapshot)
+        table["d"] = Task.from_raw("d", "New", False, 1, 4_000, None)
+        table.clear()
+
+        assert len(table) == 0
+        assert table.values() == []
+        assert table.get("c") is None
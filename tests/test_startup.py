@@ -0,0 +1,89 @@
+"""Tests for startup time and the precomputed OpenAPI schema."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.openapi import SCHEMA_PATH, build, use_precomputed
+from backend.serialization import loads
+from benchmarks.bench_startup import BUDGET_SECONDS, cold_start, import_profile
+
+
+@pytest.fixture(scope="module")
+def startup() -> dict[str, Any]:
+    """One cold start's phases and loaded packages."""
+    return cold_start()
+
+
+class TestStartup:
+    """Test cases for a fresh process's startup."""
+
+    @pytest.mark.skipif(
+        not os.environ.get("TASK_BOARD_CHECK_STARTUP"),
+        reason="wall-clock budget; set TASK_BOARD_CHECK_STARTUP=1 to check it",
+    )
+    def test_first_request_within_budget(self) -> None:
+        """Test a new process answers its first request within the budget."""
+        # The fastest of a few cold starts, to ride out a busy machine
+        startup = min((cold_start() for _ in range(3)), key=lambda phases: phases["ready"])
+        assert startup["ready"] < BUDGET_SECONDS, (
+            f"Cold start took {startup['ready'] * 1e3:.0f} ms, over the "
+            f"{BUDGET_SECONDS * 1e3:.0f} ms budget; see "
+            "python -m benchmarks.bench_startup --profile"
+        )
+
+    def test_optional_subsystems_are_not_loaded(self, startup: dict[str, Any]) -> None:
+        """Test packages only some requests need are not imported by startup."""
+        assert "numpy" not in startup["modules"]
+        assert "backend" in startup["modules"]
+
+    def test_app_imports_with_durable_backend(self, tmp_path: Path) -> None:
+        """Test the app and the schema generator import with the WAL backend configured."""
+        env = {**os.environ, "TASK_BOARD_WAL_DIR": str(tmp_path)}
+        for module in ("backend.main", "backend.openapi"):
+            result = subprocess.run(
+                [sys.executable, "-c", f"import {module}"],
+                env=env, capture_output=True, text=True,
+            )
+            assert result.returncode == 0, result.stderr
+
+    def test_import_profile(self) -> None:
+        """Test the import profile covers the app's own modules."""
+        rows = import_profile()
+        modules = {name for name, _, _ in rows}
+
+        assert {"backend.main", "backend.routers.task_router"} <= modules
+        assert all(total >= own >= 0 for _, own, total in rows)
+
+
+class TestOpenAPI:
+    """Test cases for the precomputed schema."""
+
+    def test_schema_file_is_current(self) -> None:
+        """Test backend/openapi.json matches the routes."""
+        assert loads(SCHEMA_PATH.read_bytes()) == build(app), (
+            "backend/openapi.json is out of date; run python -m backend.openapi"
+        )
+
+    def test_schema_served_from_file(self, tmp_path: Path) -> None:
+        """Test the schema comes from the file rather than the routes."""
+        schema_path = tmp_path / "openapi.json"
+        schema_path.write_text('{"openapi": "3.1.0", "info": {"title": "Saved"}}')
+        other = FastAPI()
+        use_precomputed(other, schema_path)
+
+        assert TestClient(other).get("/openapi.json").json()["info"]["title"] == "Saved"
+
+    def test_schema_built_without_a_file(self, tmp_path: Path) -> None:
+        """Test the schema is built from the routes when there is no file."""
+        other = FastAPI(title="Built")
+        use_precomputed(other, tmp_path / "missing.json")
+
+        assert TestClient(other).get("/openapi.json").json()["info"]["title"] == "Built"
@@ -0,0 +1,128 @@
+"""Tests for serving the frontend build."""
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from backend.static import FrontendFiles, scan
+
+INDEX = b"<!doctype html><div id='root'></div>\n" * 50
+SCRIPT = b"console.log('task board');\n" * 100
+
+
+@pytest.fixture
+def build(tmp_path: Path) -> Path:
+    """A frontend build with a precompressed index and a plain asset."""
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-abc123.js").write_bytes(SCRIPT)
+    (tmp_path / "index.html").write_bytes(INDEX)
+    (tmp_path / "index.html.gz").write_bytes(gzip.compress(INDEX))
+    return tmp_path
+
+
+def client_for(directory: Path) -> TestClient:
+    """A client for an app serving directory like backend.main does."""
+    app = FastAPI()
+    frontend = FrontendFiles(directory)
+
+    @app.get("/{full_path:path}")
+    async def serve_frontend(full_path: str, request: Request) -> Response:
+        return frontend.response(full_path, request.headers)
+
+    return TestClient(app)
+
+
+class TestScan:
+    """Test cases for building the file table."""
+
+    def test_siblings_become_variants(self, build: Path) -> None:
+        """Test compressed siblings are variants of their file, not files."""
+        files = scan(build)
+
+        assert sorted(files) == ["assets/index-abc123.js", "index.html"]
+        assert list(files["index.html"].variants) == ["identity", "gzip"]
+        assert files["index.html"].media_type == "text/html"
+
+    def test_stale_siblings_are_ignored(self, build: Path) -> None:
+        """Test a sibling older than its file is not served."""
+        page = build / "index.html"
+        os.utime(page, ns=(page.stat().st_mtime_ns + 10**9,) * 2)
+
+        assert list(scan(build)["index.html"].variants) == ["identity"]
+
+
+class TestFrontendFiles:
+    """Test cases for frontend responses."""
+
+    def test_hashed_assets_are_immutable(self, build: Path) -> None:
+        """Test files under assets/ may be cached without revalidation."""
+        response = client_for(build).get("/assets/index-abc123.js")
+
+        assert response.status_code == 200
+        assert response.content == SCRIPT
+        assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert "javascript" in response.headers["Content-Type"]
+        assert "vary" not in response.headers
+
+    def test_precompressed_variant(self, build: Path) -> None:
+        """Test the gzip sibling is sent to clients that accept it."""
+        client = client_for(build)
+        compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/", headers={"Accept-Encoding": "identity"})
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert compressed.content == INDEX
+        assert compressed.headers["Vary"] == "Accept-Encoding"
+        assert "content-encoding" not in plain.headers
+        assert plain.content == INDEX
+        assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+    def test_index_is_revalidated(self, build: Path) -> None:
+        """Test index.html must be revalidated and a matching ETag gets a 304."""
+        client = client_for(build)
+        first = client.get("/index.html", headers={"Accept-Encoding": "gzip"})
+        again = client.get(
+            "/index.html",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]},
+        )
+
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["ETag"] == first.headers["ETag"]
+        assert again.headers["Cache-Control"] == "no-cache"
+
+    def test_client_routes_get_index(self, build: Path) -> None:
+        """Test unknown paths get index.html, except missing assets."""
+        client = client_for(build)
+
+        route = client.get("/tasks/today")
+        assert route.status_code == 200
+        assert route.content == INDEX
+        assert client.get("/assets/index-old999.js").status_code == 404
+
+    def test_scanned_on_first_request(self, build: Path) -> None:
+        """Test creating the responder leaves the build untouched until needed."""
+        frontend = FrontendFiles(build)
+        assert "files" not in vars(frontend)
+
+        (build / "late.txt").write_text("added after startup")
+        assert "late.txt" in frontend.files
+
+    def test_reads_nothing_per_request(
+        self, build: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test requests after the first are answered without stat calls."""
+        client = client_for(build)
+        client.get("/")
+
+        def stat(*args: object, **kwargs: object) -> None:
+            raise AssertionError("stat called while serving")
+
+        monkeypatch.setattr(os, "stat", stat)
+        monkeypatch.setattr(Path, "stat", stat)
+        assert client.get("/assets/index-abc123.js").content == SCRIPT
@@ -1,5 +1,8 @@
 """Tests for Task API endpoints."""
 
+import gzip
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -70,6 +73,59 @@ class TestTaskAPI:
         assert data["total"] == 2
         assert len(data["tasks"]) == 2
 
+    def test_get_tasks_paginated(self, client: TestClient) -> None:
+        """Test paging through tasks with limit and cursor."""
+        for i in range(5):
+            client.post("/api/tasks", json={"title": f"Task {i}"})
+
+        first = client.get("/api/tasks", params={"limit": 3}).json()
+        second = client.get(
+            "/api/tasks", params={"limit": 3, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [t["title"] for t in first["tasks"]] == ["Task 4", "Task 3", "Task 2"]
+        assert [t["title"] for t in second["tasks"]] == ["Task 1", "Task 0"]
+        assert second["next_cursor"] is None
+        assert first["total"] == 5
+
+    def test_get_tasks_invalid_cursor(self, client: TestClient) -> None:
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/tasks", params={"limit": 3, "cursor": "bogus!"})
+
+        assert response.status_code == 400
+
+    def test_get_tasks_filtered(self, client: TestClient) -> None:
+        """Test filtering tasks by completion status and priority."""
+        done_id = client.post("/api/tasks", json={"title": "Done", "priority": "high"}).json()["id"]
+        client.post("/api/tasks", json={"title": "Todo", "priority": "high"})
+        client.post("/api/tasks", json={"title": "Later", "priority": "low"})
+        client.patch(f"/api/tasks/{done_id}/toggle")
+
+        completed = client.get("/api/tasks", params={"completed": "true"}).json()
+        pending_high = client.get(
+            "/api/tasks", params={"completed": "false", "priority": "high"}
+        ).json()
+
+        assert [t["title"] for t in completed["tasks"]] == ["Done"]
+        assert [t["title"] for t in pending_high["tasks"]] == ["Todo"]
+        assert completed["total"] == 3
+
+    def test_get_tasks_invalid_priority_filter(self, client: TestClient) -> None:
+        """Test an unknown priority filter is rejected."""
+        response = client.get("/api/tasks", params={"priority": "urgent"})
+
+        assert response.status_code == 422
+
+    def test_search_tasks(self, client: TestClient) -> None:
+        """Test searching titles with a type-ahead prefix."""
+        client.post("/api/tasks", json={"title": "Buy groceries"})
+        client.post("/api/tasks", json={"title": "Book flights"})
+
+        response = client.get("/api/tasks/search", params={"q": "bu"})
+
+        assert response.status_code == 200
+        assert [t["title"] for t in response.json()["tasks"]] == ["Buy groceries"]
+
     def test_get_single_task(self, client: TestClient) -> None:
         """Test getting a single task."""
         create_response = client.post("/api/tasks", json={"title": "Find Me"})
@@ -148,6 +204,290 @@ class TestTaskAPI:
         assert data["completed"] == 1
         assert data["pending"] == 1
 
+    def test_get_analytics(self, client: TestClient) -> None:
+        """Test analytics default to the last 30 days and count today's activity."""
+        created = client.post("/api/tasks", json={"title": "Task", "priority": "high"}).json()
+        client.patch(f"/api/tasks/{created['id']}/toggle")
+
+        response = client.get("/api/tasks/analytics")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["days"]) == 30
+        assert data["days"][-1]["created"] == 1
+        assert data["days"][-1]["completed"] == 1
+        assert data["median_completion_seconds"]["high"] is not None
+
+    def test_get_analytics_invalid_range(self, client: TestClient) -> None:
+        """Test a range ending before it starts is a 400."""
+        response = client.get(
+            "/api/tasks/analytics", params={"start": "2026-02-02", "end": "2026-02-01"}
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "start, end", [("0001-01-01", "0001-01-05"), ("9999-12-25", "9999-12-31")]
+    )
+    def test_get_analytics_range_near_calendar_bounds(
+        self, client: TestClient, start: str, end: str
+    ) -> None:
+        """Test a range whose window or end would leave the calendar is a 400."""
+        response = client.get("/api/tasks/analytics", params={"start": start, "end": end})
+
+        assert response.status_code == 400
+
+    def test_get_analytics_default_start_near_calendar_bounds(self, client: TestClient) -> None:
+        """Test the default start does not overflow for an end near date.min."""
+        response = client.get("/api/tasks/analytics", params={"end": "0001-01-05"})
+
+        assert response.status_code == 400
+
+    def test_bulk_create(self, client: TestClient) -> None:
+        """Test creating several tasks in one request."""
+        response = client.post(
+            "/api/tasks/bulk",
+            json={"tasks": [{"title": "One"}, {"title": "Two", "priority": "high"}]}
+        )
+
+        assert response.status_code == 201
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == [201, 201]
+        assert [r["task"]["title"] for r in results] == ["One", "Two"]
+        assert client.get("/api/tasks/stats").json()["total"] == 2
+
+    def test_bulk_update(self, client: TestClient) -> None:
+        """Test updating several tasks, with a per-item result for missing ones."""
+        task_id = client.post("/api/tasks", json={"title": "Sprint"}).json()["id"]
+
+        response = client.patch(
+            "/api/tasks/bulk",
+            json={"tasks": [
+                {"id": task_id, "completed": True},
+                {"id": "non-existent-id", "completed": True},
+            ]}
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0]["status"] == 200
+        assert results[0]["task"]["completed"] is True
+        assert results[1] == {"id": "non-existent-id", "status": 404, "task": None}
+
+    def test_bulk_delete(self, client: TestClient) -> None:
+        """Test deleting several tasks in one request."""
+        task_id = client.post("/api/tasks", json={"title": "Delete Me"}).json()["id"]
+
+        response = client.request(
+            "DELETE", "/api/tasks/bulk", json={"ids": [task_id, "non-existent-id"]}
+        )
+
+        assert response.status_code == 200
+        assert [r["status"] for r in response.json()["results"]] == [204, 404]
+        assert client.get(f"/api/tasks/{task_id}").status_code == 404
+
+    def test_bulk_create_validation_error(self, client: TestClient) -> None:
+        """Test one invalid item rejects the whole batch."""
+        response = client.post(
+            "/api/tasks/bulk", json={"tasks": [{"title": "Fine"}, {"title": ""}]}
+        )
+
+        assert response.status_code == 422
+        assert client.get("/api/tasks/stats").json()["total"] == 0
+
+    def test_list_etag_not_modified(self, client: TestClient) -> None:
+        """Test a repeated list request with the ETag gets 304 until a mutation."""
+        client.post("/api/tasks", json={"title": "Cached"})
+        etag = client.get("/api/tasks").headers["ETag"]
+
+        unchanged = client.get("/api/tasks", headers={"If-None-Match": etag})
+        client.post("/api/tasks", json={"title": "Changed"})
+        changed = client.get("/api/tasks", headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["total"] == 2
+
+    def test_stats_etag_not_modified(self, client: TestClient) -> None:
+        """Test stats honour If-None-Match, including weak and listed tags."""
+        etag = client.get("/api/tasks/stats").headers["ETag"]
+
+        response = client.get(
+            "/api/tasks/stats", headers={"If-None-Match": f'"stale", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    def test_delta_sync(self, client: TestClient) -> None:
+        """Test a client syncs from the list's revision through mutation responses."""
+        kept = client.post("/api/tasks", json={"title": "Kept"}).json()
+        gone = client.post("/api/tasks", json={"title": "Gone"}).json()
+        since = int(client.get("/api/tasks").headers["X-Revision"])
+
+        toggled = client.patch(f"/api/tasks/{kept['id']}/toggle")
+        deleted = client.delete(f"/api/tasks/{gone['id']}")
+        created = client.post("/api/tasks", json={"title": "New"})
+        response = client.get("/api/tasks/changes", params={"since": since})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["reset"] is False
+        assert [t["title"] for t in data["tasks"]] == ["New", "Kept"]
+        assert data["tasks"][1]["completed"] is True
+        assert data["deleted"] == [gone["id"]]
+        assert (data["total"], data["completed"], data["pending"]) == (2, 1, 1)
+        revisions = [int(r.headers["X-Revision"]) for r in (toggled, deleted, created)]
+        assert since < revisions[0] < revisions[1] < revisions[2] == data["revision"]
+
+        unchanged = client.get("/api/tasks/changes", params={"since": data["revision"]}).json()
+        assert (unchanged["tasks"], unchanged["deleted"]) == ([], [])
+
+    def test_mutation_revisions(self, client: TestClient) -> None:
+        """Test deletes, clears and imports report the version they produced,
+        and requests that change nothing report none."""
+        first, second = (
+            client.post("/api/tasks", json={"title": title}).json()["id"]
+            for title in ("First", "Second")
+        )
+
+        deleted = client.delete(f"/api/tasks/{first}")
+        bulk = client.request(
+            "DELETE", "/api/tasks/bulk", json={"ids": [second, "non-existent-id"]}
+        )
+        nothing = client.request("DELETE", "/api/tasks/bulk", json={"ids": ["non-existent-id"]})
+        changes = client.get(
+            "/api/tasks/changes", params={"since": deleted.headers["X-Revision"]}
+        ).json()
+        cleared = client.delete("/api/tasks")
+
+        revisions = [int(r.headers["X-Revision"]) for r in (deleted, bulk, cleared)]
+        assert revisions == sorted(set(revisions))
+        assert revisions[1] == changes["revision"]
+        assert changes["deleted"] == [second]
+        assert revisions[2] == task_service.get_version()
+        assert "x-revision" not in nothing.headers
+
+    def test_delta_sync_reset(self, client: TestClient) -> None:
+        """Test a revision the server cannot sync from returns the whole board."""
+        client.post("/api/tasks/bulk", json={"tasks": [{"title": "A"}, {"title": "B"}]})
+
+        data = client.get("/api/tasks/changes", params={"since": 0}).json()
+
+        assert data["reset"] is True
+        assert [t["title"] for t in data["tasks"]] == ["B", "A"]
+        assert client.get("/api/tasks/changes", params={"since": -1}).status_code == 422
+
+    def test_export_import_round_trip(self, client: TestClient) -> None:
+        """Test an export, gzipped or not, restores the same board."""
+        client.post("/api/tasks/bulk", json={"tasks": [{"title": "A"}, {"title": "B"}]})
+        done = client.post("/api/tasks", json={"title": "C", "priority": "high"}).json()
+        client.patch(f"/api/tasks/{done['id']}/toggle")
+        board = client.get("/api/tasks").json()["tasks"]
+
+        plain = client.get("/api/tasks/export", headers={"Accept-Encoding": "identity"})
+        packed = client.get("/api/tasks/export", headers={"Accept-Encoding": "br, gzip"})
+
+        assert plain.headers["content-type"] == "application/x-ndjson"
+        assert "content-encoding" not in plain.headers
+        assert packed.headers["content-encoding"] == "gzip"
+        assert packed.content == plain.content  # decoded by the client
+        lines = [json.loads(line) for line in plain.text.splitlines()]
+        assert lines == board[::-1]
+
+        client.delete("/api/tasks")
+        response = client.post(
+            "/api/tasks/import",
+            content=gzip.compress(plain.content),
+            headers={"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"imported": 3, "skipped": 0}
+        assert int(response.headers["X-Revision"]) == task_service.get_version()
+        assert client.get("/api/tasks").json()["tasks"] == board
+        again = client.post("/api/tasks/import", content=plain.content)
+        assert again.json() == {"imported": 0, "skipped": 3}
+        assert "x-revision" not in again.headers
+
+    def test_export_refused_gzip(self, client: TestClient) -> None:
+        """Test gzip is not used when the client gives it zero quality."""
+        response = client.get("/api/tasks/export", headers={"Accept-Encoding": "*;q=1, gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_import_streams_in_chunks(self, client: TestClient) -> None:
+        """Test lines split across body chunks, blank lines and a missing final newline."""
+        line = (
+            b'{"id":"chunked-%d","title":"Chunked %d","completed":false,'
+            b'"priority":"low","created_at":"2026-01-01T00:00:00.%06d"}'
+        )
+        body = b"\n\n".join(line % (i, i, i) for i in range(1500))
+
+        def chunks():
+            for start in range(0, len(body), 4096):
+                yield body[start:start + 4096]
+
+        response = client.post("/api/tasks/import", content=chunks())
+
+        assert response.json() == {"imported": 1500, "skipped": 0}
+        assert client.get("/api/tasks", params={"limit": 1}).json()["tasks"][0]["id"] == (
+            "chunked-1499"
+        )
+
+    def test_import_errors(self, client: TestClient) -> None:
+        """Test bad lines and encodings are rejected."""
+        good = b'{"id":"ok","title":"Ok","completed":false,"priority":"low","created_at":"2026-01-01"}'
+
+        bad_line = client.post("/api/tasks/import", content=good + b'\n{"id":"x"}\n')
+        truncated = client.post(
+            "/api/tasks/import",
+            content=gzip.compress(good)[:-8],
+            headers={"Content-Encoding": "gzip"},
+        )
+        unknown = client.post(
+            "/api/tasks/import", content=good, headers={"Content-Encoding": "br"}
+        )
+        too_long = client.post("/api/tasks/import", content=b"x" * (65 * 1024))
+
+        assert bad_line.status_code == 400
+        assert bad_line.json()["detail"] == "Line 2: missing field 'title'"
+        # The bad line failed its batch before it reached storage
+        assert client.get("/api/tasks/ok").status_code == 404
+        assert truncated.status_code == 400
+        assert unknown.status_code == 415
+        assert too_long.status_code == 400
+
+    def test_import_rejects_non_ascii_ids(self, client: TestClient) -> None:
+        """Test IDs snapshots could not store are refused before storage."""
+        line = '{"id":"tâche","title":"T","completed":false,"priority":"low","created_at":"2026-01-01"}'
+
+        response = client.post("/api/tasks/import", content=line.encode())
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Line 1: id must be")
+        assert client.get("/api/tasks").json()["total"] == 0
+
+    @pytest.mark.parametrize(
+        "created_at", ["9999-12-31T23:59:59-05:00", "0001-01-01T00:00:00+05:00"]
+    )
+    def test_import_rejects_times_outside_the_calendar(
+        self, client: TestClient, created_at: str
+    ) -> None:
+        """Test a timestamp that leaves the calendar in local time names its line."""
+        line = (
+            '{"id":"edge","title":"Edge","completed":false,"priority":"low",'
+            f'"created_at":"{created_at}"}}'
+        )
+
+        response = client.post("/api/tasks/import", content=line.encode())
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Line 1: created_at is out of range"
+        assert client.get("/api/tasks").json()["total"] == 0
+
     def test_create_task_validation_error(self, client: TestClient) -> None:
         """Test creating task with invalid data."""
         response = client.post("/api/tasks", json={"title": ""})
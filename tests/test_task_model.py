@@ -0,0 +1,62 @@
+"""Tests for Task Model."""
+
+from datetime import datetime
+
+from backend.models.task_model import Task, TaskPriority, from_epoch_us, to_epoch_us
+
+
+class TestTaskModel:
+    """Test cases for the compact Task model."""
+
+    def test_epoch_round_trip(self) -> None:
+        """Test datetimes survive conversion to epoch microseconds and back."""
+        value = datetime(2024, 12, 31, 23, 59, 59, 999_999)
+
+        assert from_epoch_us(to_epoch_us(value)) == value
+
+    def test_fields_stored_compactly(self) -> None:
+        """Test priority and timestamps are kept as ints without an instance dict."""
+        created = datetime(2024, 1, 2, 3, 4, 5, 6)
+        task = Task(title="Compact", priority=TaskPriority.HIGH, created_at=created)
+
+        assert not hasattr(task, "__dict__")
+        assert task.priority_code == 2
+        assert task.created_us == to_epoch_us(created)
+        assert task.priority == TaskPriority.HIGH
+        assert task.created_at == created
+        assert len(task.id) < 36
+
+    def test_setters_update_compact_fields(self) -> None:
+        """Test assigning enum and datetime views updates the stored values."""
+        task = Task(title="Setters")
+        completed = datetime(2024, 6, 1, 12, 0)
+
+        task.priority = TaskPriority.LOW
+        task.completed_at = completed
+
+        assert task.priority_code == 0
+        assert task.completed_us == to_epoch_us(completed)
+        task.completed_at = None
+        assert task.completed_us is None
+
+    def test_to_dict(self) -> None:
+        """Test the API dictionary uses ISO timestamps and priority values."""
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        task = Task(id="abc", title="Dict", created_at=created)
+
+        assert task.to_dict() == {
+            "id": "abc",
+            "title": "Dict",
+            "completed": False,
+            "priority": "medium",
+            "created_at": "2024-01-02T03:04:05",
+            "completed_at": None,
+        }
+
+    def test_from_raw_matches_constructor(self) -> None:
+        """Test building from raw fields gives an equal task."""
+        task = Task(title="Raw", priority=TaskPriority.LOW)
+
+        raw = Task.from_raw(task.id, "Raw", False, 0, task.created_us, None)
+
+        assert raw == task
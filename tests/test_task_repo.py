@@ -0,0 +1,673 @@
+"""Tests for Task Repository."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from backend.config import Settings
+from backend.models.task_model import Task, TaskPriority
+from backend.repositories import sqlite_repo as sqlite_module
+from backend.repositories import task_repo as task_repo_module
+from backend.repositories.base import TaskRepositoryProtocol, TaskUpdate
+from backend.repositories.durable_repo import DurableTaskRepository
+from backend.repositories.sqlite_repo import SqliteTaskRepository
+from backend.repositories.task_repo import TaskRepository, create_task_repository
+
+
+@pytest.fixture
+def memory_repo() -> TaskRepository:
+    """Create a fresh, empty in-memory repository that verifies its stats."""
+    return TaskRepository(verify_stats=True)
+
+
+@pytest.fixture
+def sqlite_repo(tmp_path: Path) -> Iterator[SqliteTaskRepository]:
+    """Create a fresh, empty SQLite repository that verifies its stats."""
+    repo = SqliteTaskRepository(str(tmp_path / "tasks.db"), verify_stats=True)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def durable_repo(tmp_path: Path) -> Iterator[DurableTaskRepository]:
+    """Create a fresh, empty write-ahead-logged repository that verifies its stats."""
+    repo = DurableTaskRepository(str(tmp_path / "data"), interval=0, verify_stats=True)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "durable"])
+def repo(request: pytest.FixtureRequest) -> TaskRepositoryProtocol:
+    """Run a test against every storage backend."""
+    backend: TaskRepositoryProtocol = request.getfixturevalue(f"{request.param}_repo")
+    return backend
+
+
+class TestTaskRepositoryPagination:
+    """Test cases for cursor pagination over the creation-order index."""
+
+    def test_get_all_newest_first(self, repo: TaskRepositoryProtocol) -> None:
+        """Test get_all returns tasks in reverse creation order."""
+        titles = [repo.create(f"Task {i}").title for i in range(5)]
+
+        assert [t.title for t in repo.get_all()] == titles[::-1]
+
+    def test_pages_cover_all_tasks(self, repo: TaskRepositoryProtocol) -> None:
+        """Test walking every page yields each task exactly once, in order."""
+        for i in range(10):
+            repo.create(f"Task {i}", TaskPriority.LOW)
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page, cursor = repo.get_page(limit=3, cursor=cursor)
+            seen.extend(t.title for t in page)
+            if cursor is None:
+                break
+
+        assert seen == [f"Task {i}" for i in range(9, -1, -1)]
+
+    def test_last_full_page_has_no_cursor(self, repo: TaskRepositoryProtocol) -> None:
+        """Test a page ending on the oldest task returns no next cursor."""
+        for i in range(4):
+            repo.create(f"Task {i}")
+
+        page, cursor = repo.get_page(limit=2)
+        page, cursor = repo.get_page(limit=2, cursor=cursor)
+
+        assert [t.title for t in page] == ["Task 1", "Task 0"]
+        assert cursor is None
+
+    def test_cursor_survives_deletes(self, repo: TaskRepositoryProtocol) -> None:
+        """Test deleting tasks, including the cursor task, keeps pages stable."""
+        tasks = [repo.create(f"Task {i}") for i in range(200)]
+
+        page, cursor = repo.get_page(limit=10)
+        # Delete the cursor task and enough others to force index compaction
+        for task in tasks[:150] + [page[-1]]:
+            repo.delete(task.id)
+        page, cursor = repo.get_page(limit=10, cursor=cursor)
+
+        assert [t.title for t in page] == [f"Task {i}" for i in range(189, 179, -1)]
+
+    def test_invalid_cursor(self, repo: TaskRepositoryProtocol) -> None:
+        """Test a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError):
+            repo.get_page(limit=5, cursor="not a cursor!")
+
+
+class TestTaskRepositoryFilters:
+    """Test cases for filtered pages served from secondary indexes."""
+
+    def test_filter_by_completed_and_priority(self, repo: TaskRepositoryProtocol) -> None:
+        """Test filters follow updates to completion status and priority."""
+        a = repo.create("A", TaskPriority.HIGH)
+        b = repo.create("B", TaskPriority.LOW)
+        c = repo.create("C", TaskPriority.HIGH)
+        repo.update(a.id, completed=True)
+        repo.update(b.id, completed=True, priority=TaskPriority.HIGH)
+        repo.delete(c.id)
+        repo.create("D", TaskPriority.HIGH)
+
+        def titles(
+            completed: bool | None = None,
+            priority: TaskPriority | None = None
+        ) -> list[str]:
+            return [t.title for t in repo.get_page(completed=completed, priority=priority)[0]]
+
+        assert titles(completed=True) == ["B", "A"]
+        assert titles(completed=False) == ["D"]
+        assert titles(priority=TaskPriority.HIGH) == ["D", "B", "A"]
+        assert titles(priority=TaskPriority.LOW) == []
+        assert titles(completed=True, priority=TaskPriority.HIGH) == ["B", "A"]
+
+    def test_filtered_pagination(self, repo: TaskRepositoryProtocol) -> None:
+        """Test cursors page through filtered matches only."""
+        for i in range(10):
+            repo.create(f"Task {i}", TaskPriority.HIGH if i % 2 else TaskPriority.LOW)
+
+        first, cursor = repo.get_page(limit=3, priority=TaskPriority.HIGH)
+        second, last = repo.get_page(limit=3, cursor=cursor, priority=TaskPriority.HIGH)
+
+        assert [t.title for t in first] == ["Task 9", "Task 7", "Task 5"]
+        assert [t.title for t in second] == ["Task 3", "Task 1"]
+        assert last is None
+
+
+class TestTaskRepositorySearch:
+    """Test cases for title search."""
+
+    def test_search_follows_mutations(self, repo: TaskRepositoryProtocol) -> None:
+        """Test search reflects creates, title updates and deletes, newest first."""
+        first = repo.create("Release notes")
+        second = repo.create("Release checklist")
+        repo.create("Sprint review")
+        repo.update(first.id, title="Release blog post")
+        repo.delete(second.id)
+
+        assert [t.title for t in repo.search("release")] == ["Release blog post"]
+        assert [t.title for t in repo.search("rev")] == ["Sprint review"]
+        assert repo.search("notes") == []
+        assert repo.search("release", limit=0) == []
+
+    def test_search_limit(self, repo: TaskRepositoryProtocol) -> None:
+        """Test search returns at most limit of the newest matches."""
+        for i in range(5):
+            repo.create(f"Bug {i}")
+
+        assert [t.title for t in repo.search("bug", limit=2)] == ["Bug 4", "Bug 3"]
+
+
+class TestTaskRepositoryStats:
+    """Test cases for incrementally maintained statistics."""
+
+    def test_counters_track_mutations(self, repo: TaskRepositoryProtocol) -> None:
+        """Test counters agree with a recount across every kind of mutation."""
+        high = repo.create("High", TaskPriority.HIGH)
+        low = repo.create("Low", TaskPriority.LOW)
+        medium = repo.create("Medium")
+
+        repo.update(high.id, completed=True)
+        repo.update(low.id, completed=True, priority=TaskPriority.MEDIUM)
+        repo.update(low.id, completed=False)
+        repo.delete(high.id)
+        repo.update(medium.id, completed=True)
+        stats = repo.get_stats()
+
+        assert stats["total"] == 2
+        assert stats["completed"] == 1
+        assert stats["completed_today"] == 1
+        assert stats["by_priority"] == {"low": 0, "medium": 2, "high": 0}
+
+    def test_completed_today_ignores_older_days(self, memory_repo: TaskRepository) -> None:
+        """Test completions bucketed on an earlier day don't count as today."""
+        task = memory_repo.create("Yesterday")
+        memory_repo.update(task.id, completed=True)
+        # Move the completion into yesterday's bucket, as if it happened then
+        memory_repo._uncount_completion(task)
+        task.completed_at = datetime.now() - timedelta(days=1)
+        memory_repo._count_completion(task)
+
+        stats = memory_repo.get_stats()
+
+        assert stats["completed"] == 1
+        assert stats["completed_today"] == 0
+
+    def test_clear_all_resets_counters(self, repo: TaskRepositoryProtocol) -> None:
+        """Test clearing the repository zeroes every counter."""
+        task = repo.create("Task", TaskPriority.HIGH)
+        repo.update(task.id, completed=True)
+
+        repo.clear_all()
+
+        assert repo.get_stats()["total"] == 0
+        assert repo.get_stats()["by_priority"] == {"low": 0, "medium": 0, "high": 0}
+
+    def test_verify_detects_drift(self, memory_repo: TaskRepository) -> None:
+        """Test the consistency-check mode catches counters that drift."""
+        memory_repo.create("Task")
+        memory_repo._completed_count += 1
+
+        with pytest.raises(AssertionError):
+            memory_repo.get_stats()
+
+
+class TestTaskRepositoryAnalytics:
+    """Test cases for completion trends over the analytics columns."""
+
+    def test_report_tracks_mutations(self, repo: TaskRepositoryProtocol) -> None:
+        """Test creates, completions, priority changes and deletes all show up."""
+        high = repo.create("High", TaskPriority.HIGH)
+        low = repo.create("Low", TaskPriority.LOW)
+        gone = repo.create("Gone")
+        repo.update(high.id, completed=True)
+        repo.update(low.id, completed=True, priority=TaskPriority.MEDIUM)
+        repo.delete(gone.id)
+        today = date.today()
+
+        report = repo.get_analytics(today - timedelta(days=1), today, window=2)
+
+        assert [(d["created"], d["completed"]) for d in report["days"]] == [(0, 0), (2, 2)]
+        assert report["days"][-1]["throughput"] == 1.0
+        medians = report["median_completion_seconds"]
+        assert medians["low"] is None
+        assert medians["medium"] is not None and medians["high"] is not None
+
+    def test_columns_survive_compaction(self, memory_repo: TaskRepository) -> None:
+        """Test the columns stay slot for slot with the order index after compaction."""
+        tasks = memory_repo.create_many([(f"Task {i}", TaskPriority.LOW) for i in range(200)])
+        memory_repo.delete_many([t.id for t in tasks[:150]])
+        memory_repo.toggle(tasks[-1].id)
+
+        report = memory_repo.get_analytics(date.today(), date.today())
+
+        assert len(memory_repo._columns) == len(memory_repo._order_ids) < 200
+        assert (report["days"][0]["created"], report["days"][0]["completed"]) == (50, 1)
+
+    def test_invalid_range(self, repo: TaskRepositoryProtocol) -> None:
+        """Test a range ending before it starts raises ValueError."""
+        with pytest.raises(ValueError):
+            repo.get_analytics(date.today(), date.today() - timedelta(days=1))
+
+    @pytest.mark.parametrize(
+        "start, end",
+        [(date.min, date.min + timedelta(days=4)), (date.max - timedelta(days=6), date.max)],
+    )
+    def test_range_near_calendar_bounds(
+        self, repo: TaskRepositoryProtocol, start: date, end: date
+    ) -> None:
+        """Test a range whose window or end would leave the calendar raises ValueError."""
+        with pytest.raises(ValueError):
+            repo.get_analytics(start, end)
+
+
+class TestTaskRepositoryVersion:
+    """Test cases for the mutation version counter."""
+
+    def test_every_mutation_bumps_version(self, repo: TaskRepositoryProtocol) -> None:
+        """Test creates, updates and deletes each increase the version."""
+        versions = [repo.get_version()]
+        task = repo.create("Versioned")
+        versions.append(repo.get_version())
+        repo.update(task.id, title="Renamed")
+        versions.append(repo.get_version())
+        repo.delete(task.id)
+        versions.append(repo.get_version())
+
+        assert versions == sorted(set(versions))
+
+    def test_reads_keep_version(self, repo: TaskRepositoryProtocol) -> None:
+        """Test reads and misses leave the version alone."""
+        repo.create("Stable")
+        version = repo.get_version()
+
+        repo.get_all()
+        repo.get_stats()
+        repo.update("non-existent-id", title="Nope")
+        repo.delete("non-existent-id")
+
+        assert repo.get_version() == version
+
+    def test_version_seeded_from_utc(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a new in-memory version does not depend on the local time zone."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            before = time.time_ns() // 1000
+            version = TaskRepository().get_version()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert before <= version <= time.time_ns() // 1000
+
+    def test_clear_bumps_version(self, repo: TaskRepositoryProtocol) -> None:
+        """Test clearing increases the version, even with nothing to clear."""
+        versions = [repo.get_version()]
+        repo.clear_all()
+        versions.append(repo.get_version())
+        repo.create("Cleared")
+        versions.append(repo.get_version())
+        repo.clear_all()
+        versions.append(repo.get_version())
+
+        assert versions == sorted(set(versions))
+
+
+class TestTaskRepositoryConcurrency:
+    """Test cases for use from many threads at once."""
+
+    def test_concurrent_toggles_are_atomic(self, repo: TaskRepositoryProtocol) -> None:
+        """Test racing toggles never lose an update or skew the counters."""
+        task = repo.create("Contended")
+
+        def toggle_many() -> None:
+            for _ in range(25):
+                repo.toggle(task.id)
+
+        threads = [threading.Thread(target=toggle_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        found = repo.get_by_id(task.id)
+        assert found is not None and found.completed is False
+        assert repo.get_stats()["completed"] == 0
+
+    def test_concurrent_creates_and_reads(self, repo: TaskRepositoryProtocol) -> None:
+        """Test writers and readers can interleave without corrupting indexes."""
+        errors: list[BaseException] = []
+
+        def write(n: int) -> None:
+            for i in range(50):
+                repo.create(f"Task {n}-{i}", TaskPriority.HIGH if i % 2 else TaskPriority.LOW)
+
+        def read() -> None:
+            try:
+                for _ in range(50):
+                    repo.get_page(limit=10, priority=TaskPriority.HIGH)
+                    repo.get_stats()
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert repo.get_stats()["by_priority"] == {"low": 100, "medium": 0, "high": 100}
+
+
+class TestTaskRepositoryBulk:
+    """Test cases for batch create/update/delete."""
+
+    def test_batch_round_trip(self, repo: TaskRepositoryProtocol) -> None:
+        """Test batch methods return per-item results in request order."""
+        tasks = repo.create_many([("A", TaskPriority.LOW), ("B", TaskPriority.HIGH)])
+
+        updated = repo.update_many([
+            TaskUpdate(tasks[1].id, completed=True, priority=TaskPriority.LOW),
+            TaskUpdate("non-existent-id", title="Missing"),
+        ])
+        deleted = repo.delete_many([tasks[0].id, tasks[0].id])
+
+        assert [t.title for t in repo.get_all()] == ["B"]
+        assert updated[0] is not None and updated[0].completed is True
+        assert updated[1] is None
+        assert deleted == [repo.get_version(), None]
+        assert repo.get_stats()["by_priority"] == {"low": 1, "medium": 0, "high": 0}
+
+
+class TestTaskRepositoryTransfer:
+    """Test cases for exporting and importing whole boards."""
+
+    def test_iter_tasks_oldest_first(self, repo: TaskRepositoryProtocol) -> None:
+        """Test iteration yields every live task, oldest first, in batches."""
+        tasks = repo.create_many([(f"Task {i}", TaskPriority.LOW) for i in range(7)])
+        repo.delete_many([tasks[2].id, tasks[3].id])
+
+        batches = list(repo.iter_tasks(batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [t.title for batch in batches for t in batch] == [
+            "Task 0", "Task 1", "Task 4", "Task 5", "Task 6",
+        ]
+        assert list(TaskRepository().iter_tasks()) == []
+
+    def test_iteration_sees_later_writes(self, repo: TaskRepositoryProtocol) -> None:
+        """Test a batch reflects writes made after the previous one."""
+        first, second = repo.create_many([("First", TaskPriority.LOW), ("Second", TaskPriority.LOW)])
+        batches = repo.iter_tasks(batch_size=1)
+
+        assert [t.id for t in next(batches)] == [first.id]
+        repo.delete(first.id)
+        repo.update(second.id, title="Second again")
+        repo.create("Third")
+        assert [t.title for batch in batches for t in batch] == ["Second again", "Third"]
+
+    def test_import_keeps_fields(self, repo: TaskRepositoryProtocol) -> None:
+        """Test imported tasks keep their IDs and timestamps and skip taken IDs."""
+        existing = repo.create("Existing")
+        done = Task(
+            id="imported-1",
+            title="Done",
+            completed=True,
+            priority=TaskPriority.HIGH,
+            created_at=datetime(2026, 1, 2, 3, 4, 5),
+            completed_at=datetime(2026, 1, 3),
+        )
+        pending = Task(id="imported-2", title="Pending", created_at=datetime(2026, 1, 1))
+        clash = Task(id=existing.id, title="Clash")
+        before = repo.get_version()
+
+        added = repo.import_many([done, pending, clash, Task(id="imported-1", title="Again")])
+
+        assert added == [True, True, False, False]
+        assert repo.get_version() == before + 2
+        assert done.revision == before + 1 and pending.revision == before + 2
+        assert [t.title for t in repo.get_all()] == ["Pending", "Done", "Existing"]
+        assert repo.get_by_id("imported-1") == done
+        assert repo.get_by_id(existing.id) == existing
+        stats = repo.get_stats()
+        assert (stats["total"], stats["completed"]) == (3, 1)
+        assert [t.title for t in repo.search("pend")] == ["Pending"]
+        changes = repo.get_changes(before)
+        assert [t.id for t in changes.tasks] == ["imported-2", "imported-1"]
+
+    def test_reimport_after_delete(self, repo: TaskRepositoryProtocol) -> None:
+        """Test a deleted task imported again syncs as live, not deleted."""
+        task = repo.create("Restored")
+        since = repo.get_version()
+        repo.delete(task.id)
+
+        assert repo.import_many([task]) == [True]
+        changes = repo.get_changes(since)
+        assert [t.id for t in changes.tasks] == [task.id]
+        assert changes.deleted == []
+
+
+class TestTaskRepositoryChanges:
+    """Test cases for delta sync from a revision."""
+
+    def test_changes_since_revision(self, repo: TaskRepositoryProtocol) -> None:
+        """Test only tasks written or deleted after the revision come back."""
+        old, edited, gone = repo.create_many([
+            ("Old", TaskPriority.LOW), ("Edited", TaskPriority.LOW), ("Gone", TaskPriority.LOW),
+        ])
+        since = repo.get_version()
+        repo.update(edited.id, title="Edited again")
+        repo.delete(gone.id)
+        new = repo.create("New")
+
+        changes = repo.get_changes(since)
+
+        assert changes.reset is False
+        assert [task.title for task in changes.tasks] == ["New", "Edited again"]
+        assert changes.deleted == [gone.id]
+        assert changes.revision == repo.get_version()
+        assert old.id not in {task.id for task in changes.tasks}
+        assert repo.get_changes(changes.revision).tasks == []
+        assert new.revision == changes.revision
+
+    def test_mutations_stamp_revisions(self, repo: TaskRepositoryProtocol) -> None:
+        """Test written tasks carry the version their write produced."""
+        first, second = repo.create_many([("A", TaskPriority.LOW), ("B", TaskPriority.LOW)])
+        assert (first.revision, second.revision) == (repo.get_version() - 1, repo.get_version())
+
+        toggled = repo.toggle(first.id)
+        assert toggled is not None and toggled.revision == repo.get_version()
+        found = repo.get_by_id(first.id)
+        assert found is not None and found.revision == repo.get_version()
+
+    def test_unknown_revision_resets(self, repo: TaskRepositoryProtocol) -> None:
+        """Test revisions from before the history or after the data get every task."""
+        repo.create_many([("A", TaskPriority.LOW), ("B", TaskPriority.LOW)])
+
+        for since in (0, repo.get_version() + 1):
+            changes = repo.get_changes(since)
+            assert changes.reset is True
+            assert [task.title for task in changes.tasks] == ["B", "A"]
+            assert changes.deleted == []
+
+    def test_clear_resets_earlier_revisions(self, repo: TaskRepositoryProtocol) -> None:
+        """Test clients from before a clear start over."""
+        repo.create("Cleared")
+        since = repo.get_version()
+        repo.clear_all()
+        repo.create("After")
+
+        changes = repo.get_changes(since)
+
+        assert changes.reset is True
+        assert [task.title for task in changes.tasks] == ["After"]
+
+    def test_memory_log_overflow_resets(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test revisions that fell out of the change log get a reset."""
+        monkeypatch.setattr(task_repo_module, "CHANGE_LOG_SIZE", 3)
+        repo = TaskRepository()
+        task = repo.create("Busy")
+        since = repo.get_version()
+        for i in range(3):
+            repo.update(task.id, title=f"Busy {i}")
+
+        assert repo.get_changes(since).reset is False
+        repo.update(task.id, title="Busy again")
+        assert repo.get_changes(since).reset is True
+        assert repo.get_changes(since + 1).reset is False
+
+    def test_sqlite_tombstones_are_pruned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test old tombstones are dropped and revisions before them reset."""
+        monkeypatch.setattr(sqlite_module, "CHANGE_LOG_SIZE", 3)
+        repo = SqliteTaskRepository(str(tmp_path / "tasks.db"))
+        tasks = repo.create_many([(f"Task {i}", TaskPriority.LOW) for i in range(5)])
+        since = repo.get_version()
+        repo.delete(tasks[0].id)
+        repo.delete(tasks[1].id)
+
+        assert repo.get_changes(since).deleted == [tasks[0].id, tasks[1].id]
+        repo.delete_many([task.id for task in tasks[2:]])
+        assert repo.get_changes(since).reset is True
+        changes = repo.get_changes(repo.get_version() - 3)
+        assert changes.deleted == [tasks[2].id, tasks[3].id, tasks[4].id]
+        count = repo._conn().execute("SELECT COUNT(*) FROM task_tombstones").fetchone()[0]
+        assert count == 3
+        repo.close()
+
+
+class TestSqliteTaskRepository:
+    """Test cases specific to the SQLite backend."""
+
+    def test_tasks_persist_across_instances(self, tmp_path: Path) -> None:
+        """Test tasks written by one repository are read back by another."""
+        path = str(tmp_path / "tasks.db")
+        writer = SqliteTaskRepository(path)
+        task = writer.create("Persisted", TaskPriority.HIGH)
+        writer.update(task.id, completed=True)
+        writer.close()
+
+        reader = SqliteTaskRepository(path)
+        found = reader.get_by_id(task.id)
+        reader.close()
+
+        assert found is not None
+        assert found.title == "Persisted"
+        assert found.priority == TaskPriority.HIGH
+        assert found.completed_at is not None
+        assert found.created_at == task.created_at
+
+    def test_adds_revisions_to_older_databases(self, tmp_path: Path) -> None:
+        """Test a database from before delta sync is upgraded in place."""
+        path = str(tmp_path / "tasks.db")
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE tasks (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                completed INTEGER NOT NULL DEFAULT 0,
+                priority TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                completed_at INTEGER
+            );
+            CREATE TABLE task_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                version INTEGER NOT NULL DEFAULT 0,
+                total INTEGER NOT NULL DEFAULT 0,
+                completed INTEGER NOT NULL DEFAULT 0,
+                low INTEGER NOT NULL DEFAULT 0,
+                medium INTEGER NOT NULL DEFAULT 0,
+                high INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT INTO tasks (id, title, priority, created_at) VALUES ('old', 'Old', 'low', 0);
+            INSERT INTO task_stats (id, version, total, low) VALUES (0, 100, 1, 1);
+        """)
+        conn.close()
+
+        repo = SqliteTaskRepository(path, verify_stats=True)
+        stale = repo.get_changes(99)
+        repo.delete("old")
+        changes = repo.get_changes(100)
+        repo.close()
+
+        assert stale.reset is True
+        assert [task.id for task in stale.tasks] == ["old"]
+        assert stale.tasks[0].revision == 0
+        assert changes.reset is False
+        assert changes.deleted == ["old"]
+
+    def test_uses_wal_mode(self, sqlite_repo: SqliteTaskRepository) -> None:
+        """Test connections run in write-ahead-log mode."""
+        mode = sqlite_repo._conn().execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_connection_per_thread(self, sqlite_repo: SqliteTaskRepository) -> None:
+        """Test other threads get their own connection and see committed writes."""
+        task = sqlite_repo.create("Shared")
+        found = []
+        connections = []
+
+        def read() -> None:
+            found.append(sqlite_repo.get_by_id(task.id))
+            connections.append(sqlite_repo._conn())
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+        assert found[0] is not None
+        assert connections[0] is not sqlite_repo._conn()
+
+    def test_update_missing_task(self, sqlite_repo: SqliteTaskRepository) -> None:
+        """Test updating a non-existent task returns None."""
+        assert sqlite_repo.update("non-existent-id", title="Nope") is None
+
+    def test_verify_detects_drift(self, sqlite_repo: SqliteTaskRepository) -> None:
+        """Test the consistency-check mode catches counters that drift."""
+        sqlite_repo.create("Task")
+        sqlite_repo._conn().execute("UPDATE task_stats SET completed = completed + 1")
+
+        with pytest.raises(AssertionError):
+            sqlite_repo.get_stats()
+
+
+class TestCreateTaskRepository:
+    """Test cases for choosing a backend through configuration."""
+
+    def test_memory_backend(self) -> None:
+        """Test the default configuration uses in-memory storage."""
+        assert isinstance(create_task_repository(Settings()), TaskRepository)
+
+    def test_sqlite_backend(self, tmp_path: Path) -> None:
+        """Test the sqlite backend is created at the configured path."""
+        path = tmp_path / "tasks.db"
+        repo = create_task_repository(Settings(storage_backend="sqlite", sqlite_path=str(path)))
+
+        assert isinstance(repo, SqliteTaskRepository)
+        assert path.exists()
+        repo.close()
+
+    def test_durable_backend(self, tmp_path: Path) -> None:
+        """Test a WAL directory makes the memory backend durable."""
+        config = Settings(wal_dir=str(tmp_path / "data"), wal_sync="always")
+        repo = create_task_repository(config)
+
+        assert isinstance(repo, DurableTaskRepository)
+        assert repo.blocking is True
+        repo.close()
+
+    def test_unknown_backend(self) -> None:
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            create_task_repository(Settings(storage_backend="postgres"))
@@ -1,9 +1,13 @@
 """Tests for Task Service."""
 
+import asyncio
+import threading
+
 import pytest
 
-from backend.models.task_model import TaskPriority
-from backend.services.task_service import TaskService
+from backend.models.task_model import Task, TaskPriority
+from backend.repositories.sqlite_repo import SqliteTaskRepository
+from backend.services.task_service import AsyncTaskService, TaskService
 
 
 @pytest.fixture
@@ -85,14 +89,14 @@ class TestTaskService:
 
         result = task_service.delete_task(task.id)
 
-        assert result is True
+        assert result == task_service.get_version()
         assert task_service.get_task(task.id) is None
 
     def test_delete_task_not_found(self, task_service: TaskService) -> None:
         """Test deleting non-existent task."""
         result = task_service.delete_task("non-existent-id")
 
-        assert result is False
+        assert result is None
 
     def test_get_task_stats(self, task_service: TaskService) -> None:
         """Test getting task statistics."""
@@ -111,20 +115,6 @@ class TestTaskService:
         assert stats["by_priority"]["medium"] == 1
         assert stats["by_priority"]["low"] == 1
 
-    def test_get_tasks_with_stats(self, task_service: TaskService) -> None:
-        """Test getting tasks with statistics."""
-        task_service.create_task("Task 1")
-        task_service.create_task("Task 2")
-
-        result = task_service.get_tasks_with_stats()
-
-        assert "tasks" in result
-        assert len(result["tasks"]) == 2
-        assert result["total"] == 2
-        assert result["completed"] == 0
-        assert result["pending"] == 2
-        assert result["progress_percentage"] == 0
-
     def test_update_task(self, task_service: TaskService) -> None:
         """Test updating a task."""
         task = task_service.create_task("Original", "low")
@@ -139,3 +129,179 @@ class TestTaskService:
         assert updated.title == "Updated"
         assert updated.priority == TaskPriority.HIGH
 
+    def test_bulk_operations(self, task_service: TaskService) -> None:
+        """Test creating, updating and deleting tasks in batches."""
+        created = task_service.create_tasks([("  One  ", "high"), ("Two", "bogus")])
+
+        updated = task_service.update_tasks([
+            {"task_id": created[0].id, "completed": True},
+            {"task_id": "non-existent-id", "title": "Missing"},
+        ])
+        deleted = task_service.delete_tasks([created[1].id, "non-existent-id"])
+
+        assert [t.title for t in created] == ["One", "Two"]
+        assert created[1].priority == TaskPriority.MEDIUM
+        assert updated[0] is not None and updated[0].completed is True
+        assert updated[1] is None
+        assert deleted == [task_service.get_version(), None]
+        assert task_service.get_task_stats()["total"] == 1
+
+    def test_get_task_changes(self, task_service: TaskService) -> None:
+        """Test changes since a revision are passed through from the repository."""
+        kept = task_service.create_task("Kept")
+        gone = task_service.create_task("Gone")
+        since = task_service.get_version()
+        task_service.toggle_task_completion(kept.id)
+        task_service.delete_task(gone.id)
+
+        changes = task_service.get_task_changes(since)
+
+        assert [t.id for t in changes.tasks] == [kept.id]
+        assert changes.deleted == [gone.id]
+        assert changes.revision == task_service.get_version()
+
+    def test_import_tasks(self, task_service: TaskService) -> None:
+        """Test an import adds new tasks and announces the batch with one event."""
+        existing = task_service.create_task("Existing")
+        seq = task_service.get_change_seq()
+
+        added = task_service.import_tasks([
+            Task(id="imported-1", title="One"),
+            Task(id=existing.id, title="Clash"),
+            Task(id="imported-2", title="Two"),
+        ])
+
+        assert added == [True, False, True]
+        assert task_service.get_change_seq() == seq + 1
+        assert task_service.get_task("imported-2") is not None
+        assert task_service.get_task(existing.id) == existing
+        assert task_service.import_tasks([Task(id="imported-1", title="Again")]) == [False]
+        assert task_service.get_change_seq() == seq + 1
+
+    def test_export_tasks(self, task_service: TaskService) -> None:
+        """Test an export walks every task oldest first."""
+        task_service.create_tasks([(f"Task {i}", "low") for i in range(3)])
+
+        batches = list(task_service.export_tasks(batch_size=2))
+
+        assert [[t.title for t in batch] for batch in batches] == [["Task 0", "Task 1"], ["Task 2"]]
+
+
+class TestAsyncTaskService:
+    """Test cases for AsyncTaskService."""
+
+    def test_memory_calls_run_inline(self, task_service: TaskService) -> None:
+        """Test in-memory storage is called on the event loop thread."""
+        service = AsyncTaskService(task_service)
+        calls: list[threading.Thread] = []
+        original = task_service.create_task
+
+        def create_task(*args: object) -> object:
+            calls.append(threading.current_thread())
+            return original(*args)
+
+        task_service.create_task = create_task  # type: ignore[method-assign]
+
+        async def run() -> None:
+            task = await service.create_task("Inline", "low")
+            assert (await service.get_task(task.id)) == task
+
+        asyncio.run(run())
+        assert service.offloads is False
+        assert calls == [threading.main_thread()]
+
+    def test_blocking_calls_run_in_worker_threads(self, tmp_path) -> None:
+        """Test SQLite storage is called off the event loop thread."""
+        task_service = TaskService()
+        task_service._repo = SqliteTaskRepository(str(tmp_path / "tasks.db"))
+        service = AsyncTaskService(task_service, threads=2)
+        calls: list[threading.Thread] = []
+        original = task_service.create_task
+
+        def create_task(*args: object) -> object:
+            calls.append(threading.current_thread())
+            return original(*args)
+
+        task_service.create_task = create_task  # type: ignore[method-assign]
+
+        async def run() -> None:
+            tasks = await asyncio.gather(
+                *(service.create_task(f"Task {i}") for i in range(5))
+            )
+            stats = await service.get_task_stats()
+            assert stats["total"] == 5
+            page, _ = await service.get_task_page(limit=10)
+            assert {t.id for t in page} == {t.id for t in tasks}
+
+        try:
+            asyncio.run(run())
+        finally:
+            task_service._repo.close()
+        assert service.offloads is True
+        assert len(calls) == 5
+        assert threading.main_thread() not in calls
+
+    def test_export_batches_run_in_worker_threads(self, tmp_path) -> None:
+        """Test each export batch from SQLite is read off the event loop thread."""
+        task_service = TaskService()
+        repo = task_service._repo = SqliteTaskRepository(str(tmp_path / "tasks.db"))
+        service = AsyncTaskService(task_service, threads=2)
+        task_service.create_tasks([(f"Task {i}", "low") for i in range(5)])
+        threads: list[threading.Thread] = []
+        original = repo._conn
+
+        def conn() -> object:
+            threads.append(threading.current_thread())
+            return original()
+
+        repo._conn = conn  # type: ignore[method-assign]
+
+        async def run() -> list[list[str]]:
+            return [[t.title for t in batch] async for batch in service.export_tasks(2)]
+
+        try:
+            batches = asyncio.run(run())
+        finally:
+            repo.close()
+        assert batches == [["Task 0", "Task 1"], ["Task 2", "Task 3"], ["Task 4"]]
+        assert len(threads) == 4
+        assert threading.main_thread() not in threads
+
+    def test_concurrent_reads_are_coalesced(self, tmp_path) -> None:
+        """Test a burst of identical reads hits storage once until the next write."""
+        task_service = TaskService()
+        task_service._repo = SqliteTaskRepository(str(tmp_path / "tasks.db"))
+        service = AsyncTaskService(task_service, threads=8)
+        calls = 0
+        original = task_service.get_task_stats
+
+        def get_task_stats() -> dict[str, object]:
+            nonlocal calls
+            calls += 1
+            return original()
+
+        task_service.get_task_stats = get_task_stats  # type: ignore[method-assign]
+
+        async def run() -> None:
+            await service.create_task("Task")
+            burst = await asyncio.gather(*(service.get_task_stats() for _ in range(20)))
+            assert all(stats["total"] == 1 for stats in burst)
+            assert calls == 1
+            await service.get_task_stats()
+            assert calls == 1
+            await service.create_task("Another")
+            assert (await service.get_task_stats())["total"] == 2
+            assert calls == 2
+
+        try:
+            asyncio.run(run())
+        finally:
+            task_service._repo.close()
+
+    def test_coalescing_can_be_disabled(self, task_service: TaskService) -> None:
+        """Test a zero-sized read cache calls storage every time."""
+        service = AsyncTaskService(task_service, read_cache_size=0)
+
+        assert service.reads is None
+        assert asyncio.run(service.get_task_stats())["total"] == 0
+
@@ -0,0 +1,63 @@
+"""Tests for the title inverted index."""
+
+import pytest
+
+from backend.repositories.title_index import TitleIndex, tokenize
+
+
+@pytest.fixture
+def index() -> TitleIndex:
+    """Create an index over a few titles."""
+    titles = {
+        "a": "Write release notes",
+        "b": "Review release plan",
+        "c": "Plan the sprint",
+    }
+    index = TitleIndex(titles.__getitem__)
+    for task_id, title in titles.items():
+        index.add(task_id, title)
+    return index
+
+
+class TestTitleIndex:
+    """Test cases for tokenizing and searching titles."""
+
+    def test_tokenize(self) -> None:
+        """Test tokens are case-folded words without punctuation."""
+        assert tokenize("Fix: Login-Page (URGENT)!") == ["fix", "login", "page", "urgent"]
+
+    def test_words_and_prefix(self, index: TitleIndex) -> None:
+        """Test all words must match and the last one matches as a prefix."""
+        assert index.search("release") == {"a", "b"}
+        assert index.search("rel") == {"a", "b"}
+        assert index.search("PLAN") == {"b", "c"}
+        assert index.search("release pl") == {"b"}
+        assert index.search("plan release") == {"b"}
+        assert index.search("sprint release") == set()
+        assert index.search("release w") == {"a"}
+        assert index.search("notes p") == set()
+
+    def test_no_match(self, index: TitleIndex) -> None:
+        """Test unknown words and empty queries match nothing."""
+        assert index.search("deploy") == set()
+        assert index.search("zzz release") == set()
+        assert index.search("  !! ") == set()
+
+    def test_remove(self, index: TitleIndex) -> None:
+        """Test removed titles stop matching and unused tokens are dropped."""
+        index.remove("c", "Plan the sprint")
+
+        assert index.search("sprint") == set()
+        assert index.search("the") == set()
+        assert index.search("plan") == {"b"}
+
+    def test_bulk_load(self, index: TitleIndex) -> None:
+        """Test titles indexed in a bulk load are found by prefix afterwards."""
+        with index.bulk_load():
+            index.add("d", "Zebra crossing")
+            index.add("e", "Alpha test")
+            index.remove("e", "Alpha test")
+
+        assert index.search("zeb") == {"d"}
+        assert index.search("alp") == set()
+        assert index._vocabulary == sorted(index._vocabulary)
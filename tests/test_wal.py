@@ -0,0 +1,70 @@
+"""Tests for the write-ahead log."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend.repositories.wal import SYNC_LEVELS, WriteAheadLog
+
+
+class TestWriteAheadLog:
+    """Test cases for appending, group commit and rotation."""
+
+    @pytest.mark.parametrize("sync", SYNC_LEVELS)
+    def test_records_reach_the_file(self, tmp_path: Path, sync: str) -> None:
+        """Test every sync level writes all records by the time the log closes."""
+        path = tmp_path / "wal.log"
+        log = WriteAheadLog(path, sync=sync, interval=0)
+        for i in range(100):
+            log.append(b"%d\n" % i)
+        log.sync()
+        log.close()
+
+        assert path.read_bytes().splitlines() == [b"%d" % i for i in range(100)]
+
+    def test_group_sync_waits_for_disk(self, tmp_path: Path) -> None:
+        """Test sync returns only once the flusher has covered the caller's records."""
+        log = WriteAheadLog(tmp_path / "wal.log", sync="group", interval=0.01)
+        log.append(b"a\n")
+        log.sync()
+
+        assert log._durable == log.appended == 1
+        log.close()
+
+    def test_concurrent_writers_share_commits(self, tmp_path: Path) -> None:
+        """Test records appended from many threads are all written, each once."""
+        path = tmp_path / "wal.log"
+        log = WriteAheadLog(path, sync="group", interval=0.001)
+
+        def writer(n: int) -> None:
+            for i in range(50):
+                log.append(b"%d-%d\n" % (n, i))
+                log.sync()
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        log.close()
+
+        assert sorted(path.read_bytes().splitlines()) == sorted(
+            b"%d-%d" % (n, i) for n in range(8) for i in range(50)
+        )
+
+    def test_rotate_switches_files(self, tmp_path: Path) -> None:
+        """Test records after a rotation go to the new file."""
+        log = WriteAheadLog(tmp_path / "one.log", sync="interval", interval=0)
+        log.append(b"first\n")
+        log.rotate(tmp_path / "two.log")
+        log.append(b"second\n")
+        log.close()
+
+        assert (tmp_path / "one.log").read_bytes() == b"first\n"
+        assert (tmp_path / "two.log").read_bytes() == b"second\n"
+
+    def test_unknown_sync_level(self, tmp_path: Path) -> None:
+        """Test an unknown sync level is rejected."""
+        with pytest.raises(ValueError):
+            WriteAheadLog(tmp_path / "wal.log", sync="sometimes")